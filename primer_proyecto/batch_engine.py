@@ -0,0 +1,239 @@
+"""
+Motor de Validación por Lotes para Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Valida muchas oraciones a la vez con NumPy. Cada palabra se convierte en un
+identificador de tipo con el vocabulario del analizador léxico, los
+identificadores se empaquetan en una matriz de enteros rellenada (una fila
+por oración) y el autómata del motor fusionado avanza todas las filas juntas,
+una columna por paso, con búsquedas vectorizadas en la tabla de transiciones.
+
+El resultado es un veredicto por fila y la primera columna donde la fila fue
+rechazada; los mensajes de error se construyen aparte, solo para las filas
+rechazadas, con el camino escalar del compilador.
+
+NumPy es opcional: se importa solo al crear un BatchEngine.
+"""
+
+from typing import TYPE_CHECKING, Dict, Mapping, NamedTuple, Optional, Sequence
+from lexical_analyzer import LexicalAnalyzer, TOKEN_TYPES
+from fused_engine import (ACCEPT, COLUMN_COUNT, DOT_ID, END, ERROR, START, STATE_COUNT,
+                          build_transition_table)
+
+if TYPE_CHECKING:
+    import numpy
+
+# Columna adicional para las palabras que no están en el vocabulario: desde
+# cualquier estado lleva a ERROR
+UNKNOWN = COLUMN_COUNT
+BATCH_COLUMN_COUNT = COLUMN_COUNT + 1
+
+# Palabra que separa las oraciones al partir todo el lote de una vez
+LINE_SEPARATOR = '\x00'
+
+def load_numpy():
+    """Importa NumPy, con un mensaje claro si no está instalado"""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("El motor por lotes requiere NumPy (pip install numpy)") from None
+    return numpy
+
+class BatchVerdicts(NamedTuple):
+    """Veredictos de un lote de oraciones"""
+    accepted: "numpy.ndarray"         # bool, una entrada por oración
+    failing_columns: "numpy.ndarray"  # Primera columna rechazada, o -1 si se aceptó
+    shapes: Optional[Dict[int, bytes]] = None  # Fila -> forma, solo con record_shapes
+
+class BatchResult(NamedTuple):
+    """Resultado de LittleEnglishCompiler.compile_batch"""
+    accepted: "numpy.ndarray"         # bool, una entrada por oración
+    failing_columns: "numpy.ndarray"  # Primera columna rechazada, o -1 si se aceptó
+    messages: Dict[int, str]          # Fila -> mensaje, solo para las filas rechazadas
+    shapes: Optional[Dict[int, bytes]] = None  # Fila -> forma de las aceptadas, con record_shapes
+
+class WordCodes(dict):
+    """
+    Diccionario palabra -> código de palabra del BatchEngine
+    
+    Las palabras que faltan se buscan en el vocabulario del analizador léxico
+    al pedirlas (así no se recorre completo un léxico externo); las conocidas
+    se guardan y las desconocidas devuelven el código de desconocida.
+    """
+    
+    def __init__(self, type_codes: Mapping, unknown_code: int):
+        super().__init__()
+        self.type_codes = type_codes
+        self.unknown_code = unknown_code
+    
+    def __missing__(self, word: str) -> int:
+        if word[-1:] == '.':
+            type_id = self.type_codes.get(word[:-1])
+            has_dot = 1
+        else:
+            type_id = self.type_codes.get(word)
+            has_dot = 0
+        if type_id is None:
+            return self.unknown_code
+        code = self[word] = 1 + 2 * type_id + has_dot
+        return code
+
+class BatchEngine:
+    """Validador vectorizado de lotes de oraciones"""
+    
+    def __init__(self, lexical_analyzer: LexicalAnalyzer = None):
+        self.np = load_numpy()
+        if lexical_analyzer is None:
+            lexical_analyzer = LexicalAnalyzer()
+        
+        # Código de palabra según el tipo de su primer token y si le sigue un
+        # token DOT (la forma con punto final, igual que en el tokenizador):
+        # 0 es el punto solo, 1 + 2 * tipo la palabra y 2 + 2 * tipo la palabra
+        # con punto; el último código es el de las palabras desconocidas
+        first_types = [DOT_ID]
+        for type_id in range(len(TOKEN_TYPES)):
+            first_types += [type_id, type_id]
+        self.unknown_code = len(first_types)
+        first_types.append(UNKNOWN)
+        
+        # Palabra (en minúsculas) -> código, que se completa al encontrar
+        # cada palabra del vocabulario por primera vez
+        self.word_codes = WordCodes(lexical_analyzer.type_codes, self.unknown_code)
+        self.word_codes['.'] = 0
+        self.word_codes[LINE_SEPARATOR] = -1
+        
+        np = self.np
+        self.first_types = np.array(first_types, dtype=np.int8)
+        self.has_dot = np.zeros(len(first_types), dtype=bool)
+        self.has_dot[2::2] = True
+        
+        # Tabla del motor fusionado como matriz, con la columna UNKNOWN
+        table = self.np.full((STATE_COUNT, BATCH_COLUMN_COUNT), ERROR, dtype=self.np.int8)
+        table[:, :COLUMN_COUNT] = self.np.frombuffer(
+            build_transition_table(), dtype=self.np.int8).reshape(STATE_COUNT, COLUMN_COUNT)
+        self.table = table
+        # Con record_shapes, compile_batch devuelve también la forma de las
+        # filas aceptadas (ver LittleEnglishCompiler.set_record_shapes)
+        self.record_shapes = False
+    
+    def encode(self, lines: Sequence[str]) -> "numpy.ndarray":
+        """
+        Convierte las oraciones en una matriz de identificadores de tipo
+        
+        Cada fila contiene los tokens de una oración seguidos de columnas END
+        de relleno; siempre queda al menos una columna END por fila. Las
+        palabras desconocidas ocupan una sola columna UNKNOWN.
+        
+        Todo el lote se pasa a minúsculas y se parte en palabras de una sola
+        vez, con LINE_SEPARATOR entre oraciones; si alguna oración ya contiene
+        ese carácter, se parte oración por oración y una palabra igual al
+        separador cuenta como desconocida.
+        
+        Args:
+            lines: Oraciones (pueden incluir espacios y saltos de línea)
+            
+        Returns:
+            Matriz de enteros de forma (oraciones, máximo de tokens + 1)
+        """
+        np = self.np
+        rows = len(lines)
+        separator = f" {LINE_SEPARATOR} "
+        text = separator.join(lines)
+        if text.count(LINE_SEPARATOR) == max(rows - 1, 0):
+            words = text.lower().split()
+        else:
+            words = []
+            for line in lines:
+                words.extend(word if word != LINE_SEPARATOR else '' for word in line.lower().split())
+                words.append(LINE_SEPARATOR)
+        
+        # Único ciclo en Python: buscar cada palabra en el vocabulario
+        codes = np.array(list(map(self.word_codes.__getitem__, words)), dtype=np.intp)
+        
+        # Fila de cada palabra según los separadores que la preceden
+        separators = codes < 0
+        word_rows = np.cumsum(separators)[~separators]
+        codes = codes[~separators]
+        
+        # Expandir cada palabra a sus tokens (uno, o dos con el punto final)
+        token_counts = 1 + self.has_dot[codes]
+        ends = np.cumsum(token_counts)
+        starts = ends - token_counts
+        flat = np.empty(int(ends[-1]) if len(ends) else 0, dtype=np.int8)
+        flat[starts] = self.first_types[codes]
+        flat[starts[token_counts == 2] + 1] = DOT_ID
+        
+        lengths = np.bincount(word_rows, weights=token_counts, minlength=rows).astype(np.intp)
+        width = int(lengths.max()) + 1 if rows else 1
+        matrix = np.full((rows, width), END, dtype=np.int8)
+        matrix[np.arange(width) < lengths[:, None]] = flat
+        return matrix
+    
+    def validate(self, matrix: "numpy.ndarray") -> BatchVerdicts:
+        """
+        Recorre el autómata sobre todas las filas de la matriz a la vez
+        
+        Args:
+            matrix: Matriz de identificadores producida por encode()
+            
+        Returns:
+            Veredictos y primera columna rechazada de cada fila
+        """
+        np = self.np
+        table = self.table
+        rows = matrix.shape[0]
+        
+        state = np.full(rows, START, dtype=np.int8)
+        failing_columns = np.full(rows, -1, dtype=np.intp)
+        for column in range(matrix.shape[1]):
+            state = table[state, matrix[:, column]]
+            newly_failed = (state == ERROR) & (failing_columns < 0)
+            failing_columns[newly_failed] = column
+        
+        return BatchVerdicts(state == ACCEPT, failing_columns)
+    
+    def accepted_shapes(self, matrix: "numpy.ndarray",
+                        accepted: "numpy.ndarray") -> Dict[int, bytes]:
+        """Forma de cada fila aceptada: sus identificadores hasta el relleno END"""
+        lengths = (matrix != END).sum(axis=1).tolist()
+        width = matrix.shape[1]
+        data = matrix.tobytes()
+        return {row: data[row * width:row * width + lengths[row]]
+                for row in accepted.nonzero()[0].tolist()}
+    
+    def compile_batch(self, lines: Sequence[str]) -> BatchVerdicts:
+        """Codifica y valida un lote de oraciones (con record_shapes, también da sus formas)"""
+        matrix = self.encode(lines)
+        verdicts = self.validate(matrix)
+        if self.record_shapes:
+            return verdicts._replace(shapes=self.accepted_shapes(matrix, verdicts.accepted))
+        return verdicts
+
+def test_batch_engine():
+    """Función de prueba: compara el motor por lotes con el camino clásico"""
+    from main import LittleEnglishCompiler
+    
+    classic_compiler = LittleEnglishCompiler()
+    engine = BatchEngine()
+    
+    test_sentences = [
+        "the cat runs.",                    # Válida: NP VP .
+        "a big dog walks.",                 # Válida: NP(con adj) VP .
+        "the man reads a book .",           # Válida: NP VP NP .
+        "the cat runs in the house.",       # Válida: NP VP PP .
+        "",                                 # Inválida: línea vacía
+        "the cat.",                         # Inválida: falta VP
+        "runs the cat.",                    # Inválida: orden incorrecto
+        "the big cat runs quickly."         # Inválida: adverbio no está en gramática
+    ]
+    
+    verdicts = engine.compile_batch(test_sentences)
+    for row, sentence in enumerate(test_sentences):
+        _, expected_success, message = classic_compiler.compile_sentence(sentence, row + 1)
+        accepted = bool(verdicts.accepted[row])
+        column = int(verdicts.failing_columns[row])
+        status = "OK" if accepted == expected_success else "DIFERENTE"
+        print(f"[{status}] '{sentence}' -> columna {column}: {message}")
+
+if __name__ == "__main__":
+    test_batch_engine()
@@ -0,0 +1,377 @@
+"""
+Modo por Lotes para Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Compila todos los archivos de un directorio (recursivamente) o de un patrón
+glob en una sola ejecución. Los archivos se reparten entre procesos
+trabajadores, del más grande al más chico: cada trabajador construye su
+compilador una sola vez y toma el siguiente archivo de la cola común en cuanto
+termina el anterior, así que los archivos chicos rellenan el tiempo que dejan
+libre los grandes.
+
+Cada archivo tiene su propio reporte (idéntico al que genera main.py para ese
+archivo) en el directorio de salida, con la misma ruta relativa, y un reporte
+global resume las estadísticas combinadas y las de cada archivo.
+
+Uso: python batch_mode.py entrada directorio_salida [--pattern '*.txt'] [--workers N]
+"""
+
+import argparse
+import csv
+import fnmatch
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from report import (DEFAULT_FORMAT, REPORT_FORMATS, add_stats, format_error_summary,
+                    format_statistics, new_stats)
+
+# Patrón por defecto de los archivos de entrada dentro de un directorio
+DEFAULT_PATTERN = "*.txt"
+
+# Extensión de los reportes de cada formato
+REPORT_SUFFIXES = {
+    "text": ".txt",
+    "jsonl": ".jsonl",
+    "csv": ".csv"
+}
+
+# Nombre del reporte global dentro del directorio de salida (sin extensión)
+MERGED_REPORT = "reporte_global"
+
+# Compilador propio de cada proceso trabajador (se crea en _init_worker)
+_worker_compiler = None
+
+class FileTask(NamedTuple):
+    """Archivo de entrada por compilar"""
+    input_filename: str
+    relative_name: str      # Ruta relativa a la raíz de la entrada
+    size: int               # Tamaño en bytes, para ordenar la cola
+
+class FileSummary(NamedTuple):
+    """Resultado de compilar un archivo del lote"""
+    relative_name: str
+    report_filename: str
+    stats: Dict[str, int]
+    seconds: float
+    error: Optional[str] = None   # Mensaje si el archivo no se pudo compilar
+
+def find_input_files(source: str, pattern: str = DEFAULT_PATTERN,
+                     exclude: Optional[str] = None) -> List[FileTask]:
+    """
+    Busca los archivos de entrada, ordenados del más grande al más chico
+    
+    Args:
+        source: Directorio (se recorre recursivamente) o patrón glob (acepta **)
+        pattern: Patrón de nombre de archivo dentro de un directorio
+        exclude: Directorio cuyos archivos se ignoran (el de salida)
+        
+    Returns:
+        Lista de archivos; a igual tamaño, en orden de ruta
+        
+    Raises:
+        FileNotFoundError: Si no hay ningún archivo de entrada
+    """
+    if os.path.isdir(source):
+        root = source
+        filenames = []
+        for directory, subdirectories, names in os.walk(source):
+            subdirectories.sort()
+            filenames.extend(os.path.join(directory, name)
+                             for name in sorted(names) if fnmatch.fnmatch(name, pattern))
+    else:
+        filenames = [filename for filename in sorted(glob.glob(source, recursive=True))
+                     if os.path.isfile(filename)]
+        root = os.path.commonpath([os.path.dirname(os.path.abspath(filename))
+                                   for filename in filenames]) if filenames else ""
+    
+    excluded = os.path.abspath(exclude) + os.sep if exclude else None
+    tasks = []
+    for filename in filenames:
+        if excluded and os.path.abspath(filename).startswith(excluded):
+            continue
+        tasks.append(FileTask(filename, os.path.relpath(os.path.abspath(filename),
+                                                        os.path.abspath(root)),
+                              os.path.getsize(filename)))
+    
+    if not tasks:
+        raise FileNotFoundError(f"No se encontraron archivos de entrada en '{source}'")
+    tasks.sort(key=lambda task: (-task.size, task.relative_name))
+    return tasks
+
+def report_filename(output_directory: str, relative_name: str,
+                    report_format: str = DEFAULT_FORMAT) -> str:
+    """Reporte de un archivo de entrada: misma ruta relativa, extensión del formato"""
+    base = os.path.splitext(relative_name)[0]
+    return os.path.join(output_directory, base + REPORT_SUFFIXES[report_format])
+
+def check_report_filenames(tasks: List[FileTask], output_directory: str,
+                           report_format: str = DEFAULT_FORMAT):
+    """
+    Verifica, antes de compilar, que cada archivo tenga un reporte propio
+    
+    Args:
+        tasks: Archivos de entrada (ver find_input_files)
+        output_directory: Directorio de los reportes
+        report_format: Formato de los reportes
+        
+    Raises:
+        ValueError: Si dos archivos tendrían el mismo reporte (por ejemplo,
+            a.txt y a.dat), si un reporte coincidiría con el reporte global o
+            si reemplazaría un archivo de entrada
+    """
+    merged_filename = os.path.join(output_directory,
+                                   MERGED_REPORT + REPORT_SUFFIXES[report_format])
+    input_filenames = {os.path.normcase(os.path.abspath(task.input_filename)) for task in tasks}
+    owners = {}
+    for task in tasks:
+        filename = report_filename(output_directory, task.relative_name, report_format)
+        key = os.path.normcase(os.path.abspath(filename))
+        if filename == merged_filename:
+            raise ValueError(f"el reporte de '{task.relative_name}' coincidiría con el "
+                             f"reporte global '{merged_filename}'")
+        if key in input_filenames:
+            raise ValueError(f"el reporte de '{task.relative_name}' reemplazaría el archivo "
+                             f"de entrada '{filename}'")
+        owner = owners.setdefault(key, task.relative_name)
+        if owner != task.relative_name:
+            raise ValueError(f"'{owner}' y '{task.relative_name}' tendrían el mismo "
+                             f"reporte '{filename}'")
+
+def _init_worker(compiler_options: Optional[Dict]):
+    """Inicializa el compilador del proceso trabajador"""
+    global _worker_compiler
+    from main import LittleEnglishCompiler
+    _worker_compiler = LittleEnglishCompiler(**(compiler_options or {}))
+
+def _compile_file(job: Tuple[FileTask, str, str, bool]) -> FileSummary:
+    """
+    Compila un archivo completo con el compilador del proceso
+    
+    Args:
+        job: Tupla con (archivo, reporte, formato, streaming)
+        
+    Returns:
+        Resumen con las estadísticas del archivo, o con el error si falló
+    """
+    task, output_filename, report_format, streaming = job
+    start = time.perf_counter()
+    try:
+        os.makedirs(os.path.dirname(output_filename) or ".", exist_ok=True)
+        _worker_compiler.compile_file(task.input_filename, output_filename,
+                                      streaming=streaming, report_format=report_format)
+    except (OSError, ValueError) as e:
+        return FileSummary(task.relative_name, output_filename, new_stats(),
+                           time.perf_counter() - start, str(e))
+    finally:
+        # Los resultados del archivo ya están en su reporte
+        _worker_compiler.results = []
+    return FileSummary(task.relative_name, output_filename, dict(_worker_compiler.stats),
+                       time.perf_counter() - start)
+
+def compile_files(tasks: List[FileTask], output_directory: str, workers: int = 1,
+                  report_format: str = DEFAULT_FORMAT, streaming: bool = False,
+                  compiler_options: Optional[Dict] = None) -> Iterator[FileSummary]:
+    """
+    Compila los archivos en orden de la lista, repartidos entre trabajadores
+    
+    Todos los archivos se encolan de una vez; cada trabajador toma el
+    siguiente en cuanto queda libre, así que con la lista ordenada por tamaño
+    los más grandes empiezan primero.
+    
+    Args:
+        tasks: Archivos de entrada (ver find_input_files)
+        output_directory: Directorio de los reportes
+        workers: Cantidad de procesos trabajadores (1 compila en este proceso)
+        report_format: Formato de los reportes (ver report.py)
+        streaming: Si es True, cada archivo se compila en modo streaming
+        compiler_options: Argumentos del LittleEnglishCompiler de cada trabajador
+        
+    Returns:
+        Iterador de resúmenes en el orden en que terminan los archivos; los
+        que no se pudieron compilar traen el mensaje en error
+    """
+    if workers < 1:
+        raise ValueError("La cantidad de trabajadores debe ser al menos 1")
+    
+    jobs = [(task, report_filename(output_directory, task.relative_name, report_format),
+             report_format, streaming) for task in tasks]
+    
+    if workers == 1:
+        _init_worker(compiler_options)
+        for job in jobs:
+            yield _compile_file(job)
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(compiler_options,)) as executor:
+        futures = {executor.submit(_compile_file, job): job for job in jobs}
+        for future in as_completed(futures):
+            try:
+                summary = future.result()
+            except Exception as e:
+                # El trabajador murió (BrokenProcessPool) o el error no es de
+                # compilación: el archivo queda en el lote como fallido
+                task, output_filename = futures[future][:2]
+                summary = FileSummary(task.relative_name, output_filename, new_stats(), 0.0,
+                                      str(e) or type(e).__name__)
+            yield summary
+
+def write_merged_report(filename: str, summaries: List[FileSummary],
+                        report_format: str = DEFAULT_FORMAT) -> Dict[str, int]:
+    """
+    Escribe el reporte global con las estadísticas combinadas y por archivo
+    
+    En text es un reporte legible; en jsonl y csv hay un registro por archivo
+    (file, report, error y los contadores) y un último registro con file
+    vacío que tiene los totales.
+    
+    Args:
+        filename: Nombre del reporte global
+        summaries: Resúmenes de los archivos, en el orden del reporte
+        report_format: Formato del reporte
+        
+    Returns:
+        Estadísticas combinadas
+    """
+    totals = new_stats()
+    for summary in summaries:
+        add_stats(totals, summary.stats)
+    
+    rows = [{'file': summary.relative_name,
+             'report': os.path.relpath(summary.report_filename, os.path.dirname(filename)),
+             'error': summary.error or "",
+             **summary.stats}
+            for summary in summaries]
+    rows.append({'file': "", 'report': "", 'error': "", **totals})
+    
+    with open(filename, 'w', encoding='utf-8', newline='' if report_format == "csv" else None) as output_file:
+        if report_format == "jsonl":
+            output_file.writelines(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+        elif report_format == "csv":
+            writer = csv.DictWriter(output_file, fieldnames=list(rows[-1]))
+            writer.writeheader()
+            writer.writerows(rows)
+        else:
+            output_file.write("REPORTE GLOBAL DE COMPILACIÓN - LITTLE ENGLISH\n")
+            output_file.write("=" * 50 + "\n\n")
+            output_file.write(f"Archivos procesados: {len(summaries)}\n")
+            output_file.write(f"Archivos con error: {sum(1 for summary in summaries if summary.error)}\n\n")
+            output_file.write(format_statistics(totals))
+            output_file.write("ARCHIVOS:\n" + "-" * 30 + "\n\n")
+            for row, summary in zip(rows, summaries):
+                if summary.error:
+                    output_file.write(f"{row['file']}: ERROR: {summary.error}\n")
+                else:
+                    output_file.write(f"{row['file']}: {row['total']} líneas, "
+                                      f"{row['successful']} exitosas, {row['failed']} fallidas "
+                                      f"-> {row['report']}\n")
+            output_file.write("\n")
+            output_file.write(format_error_summary(totals))
+    return totals
+
+def main():
+    """Función principal del modo por lotes"""
+    from main import ENGINES, LittleEnglishCompiler
+    from grammar import GrammarError
+    
+    parser = argparse.ArgumentParser(
+        description="Compila todos los archivos de un directorio o patrón glob de Little English")
+    parser.add_argument("source", metavar="entrada",
+                        help="directorio (se recorre recursivamente) o patrón glob, por ejemplo "
+                             "'datos/**/*.txt'")
+    parser.add_argument("output_directory", metavar="directorio_salida")
+    parser.add_argument("--pattern", default=DEFAULT_PATTERN,
+                        help=f"archivos a compilar dentro de un directorio (por defecto {DEFAULT_PATTERN})")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, metavar="N",
+                        help="cantidad de procesos trabajadores (por defecto, uno por CPU)")
+    parser.add_argument("--format", choices=REPORT_FORMATS, default=DEFAULT_FORMAT,
+                        dest="report_format", help="formato de los reportes (por defecto text)")
+    parser.add_argument("--stream", action="store_true",
+                        help="compila cada archivo en modo streaming (memoria constante)")
+    parser.add_argument("--engine", choices=ENGINES, default="classic",
+                        help="motor de compilación (ver main.py)")
+    parser.add_argument("--lexicon", default=None, metavar="ARCHIVO",
+                        help="léxico externo (ver main.py)")
+    parser.add_argument("--grammar", default=None, metavar="ARCHIVO",
+                        help="gramática BNF; solo con --engine classic (ver main.py)")
+    parser.add_argument("--suggest", type=int, default=0, metavar="K",
+                        help="sugerencias por token no reconocido (ver main.py)")
+    args = parser.parse_args()
+    
+    if args.workers < 1:
+        parser.error("--workers debe ser al menos 1")
+    if args.grammar and args.engine != "classic":
+        parser.error("--grammar solo se usa con --engine classic")
+    if args.suggest < 0:
+        parser.error("--suggest no puede ser negativo")
+    
+    # Los archivos del directorio de salida se ignoran al buscar la entrada,
+    # así que si la contiene no quedaría nada que compilar
+    if os.path.isdir(args.source):
+        source = os.path.realpath(args.source)
+        output_directory = os.path.realpath(args.output_directory)
+        if source == output_directory:
+            parser.error(f"el directorio de salida no puede ser el directorio de entrada "
+                         f"'{args.source}': los reportes se mezclarían con los archivos de entrada")
+        if source.startswith(output_directory + os.sep):
+            parser.error(f"el directorio de salida '{args.output_directory}' no puede "
+                         f"contener el directorio de entrada '{args.source}'")
+    
+    try:
+        tasks = find_input_files(args.source, args.pattern, exclude=args.output_directory)
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    
+    try:
+        check_report_filenames(tasks, args.output_directory, args.report_format)
+    except ValueError as e:
+        parser.error(str(e))
+    merged_filename = os.path.join(args.output_directory,
+                                   MERGED_REPORT + REPORT_SUFFIXES[args.report_format])
+    
+    compiler_options = {'engine': args.engine, 'lexicon': args.lexicon, 'grammar': args.grammar,
+                        'suggest': args.suggest}
+    # Construir un compilador valida las opciones antes de lanzar los
+    # trabajadores y deja compilados en disco el léxico, la gramática y el
+    # índice de sugerencias
+    try:
+        compiler = LittleEnglishCompiler(**compiler_options)
+        if args.suggest:
+            from suggestions import load_suggestion_index
+            load_suggestion_index(compiler.lexical_analyzer).close()
+    except ImportError as e:
+        parser.error(str(e))
+    except GrammarError as e:
+        parser.error(f"gramática inválida: {e}")
+    except (OSError, ValueError) as e:
+        parser.error(f"no se pudo cargar el léxico o la gramática: {e}")
+    os.makedirs(args.output_directory, exist_ok=True)
+    
+    print(f"Compilando {len(tasks)} archivos con {args.workers} trabajadores...")
+    start = time.perf_counter()
+    summaries = []
+    for summary in compile_files(tasks, args.output_directory, args.workers,
+                                 args.report_format, args.stream, compiler_options):
+        if summary.error:
+            print(f"  {summary.relative_name}: ERROR: {summary.error}")
+        summaries.append(summary)
+    elapsed = time.perf_counter() - start
+    
+    # El reporte global lista los archivos en el orden de sus rutas
+    summaries.sort(key=lambda summary: summary.relative_name)
+    totals = write_merged_report(merged_filename, summaries, args.report_format)
+    
+    print(f"Compilación completada en {elapsed:.2f} s. Reporte global en '{merged_filename}'")
+    print(f"\nEstadísticas: {totals['successful']}/{totals['total']} oraciones compiladas "
+          f"exitosamente en {len(summaries)} archivos")
+    if any(summary.error for summary in summaries):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark del Motor por Lotes para Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Compara la validación oración por oración del motor fusionado con
+LittleEnglishCompiler.compile_batch, que valida lotes enteros con NumPy, y
+verifica que ambos den los mismos veredictos y mensajes.
+
+Uso: python benchmark_batch.py [--lines N] [--batch-lines N] [--repeat N]
+"""
+
+import argparse
+import random
+import time
+from typing import List
+
+from benchmark_workers import SAMPLE_SENTENCES
+from main import LittleEnglishCompiler
+
+def generate_lines(total_lines: int, seed: int = 7) -> List[str]:
+    """Genera líneas de entrada con oraciones de muestra al azar"""
+    rng = random.Random(seed)
+    return [rng.choice(SAMPLE_SENTENCES) + "\n" for _ in range(total_lines)]
+
+def compile_scalar(compiler: LittleEnglishCompiler, lines: List[str]) -> list:
+    """Compila cada oración por separado con el motor fusionado"""
+    return [compiler.compile_sentence(line, line_number)[1:]
+            for line_number, line in enumerate(lines, 1)]
+
+def compile_batched(compiler: LittleEnglishCompiler, lines: List[str], batch_lines: int) -> list:
+    """Compila lotes de batch_lines oraciones con compile_batch()"""
+    results = []
+    for start in range(0, len(lines), batch_lines):
+        batch = compiler.compile_batch(lines[start:start + batch_lines], start + 1)
+        for row, accepted in enumerate(batch.accepted.tolist()):
+            results.append((accepted, batch.messages.get(row, "Compilación exitosa")))
+    return results
+
+def best_time(function, repeat: int) -> float:
+    """Devuelve el mejor tiempo de varias ejecuciones de la función"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    """Función principal del benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark del motor por lotes")
+    parser.add_argument("--lines", type=int, default=500000,
+                        help="oraciones a validar (por defecto 500000)")
+    parser.add_argument("--batch-lines", type=int, default=2000,
+                        help="oraciones por lote (por defecto 2000)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="repeticiones; se reporta la mejor (por defecto 3)")
+    args = parser.parse_args()
+    
+    # Sin cachés, para medir solo la validación
+    scalar = LittleEnglishCompiler(engine="fused", cache_size=0, shape_cache_size=0)
+    batched = LittleEnglishCompiler(engine="batch", cache_size=0, shape_cache_size=0)
+    lines = generate_lines(args.lines)
+    
+    if compile_scalar(scalar, lines[:10000]) != compile_batched(batched, lines[:10000], args.batch_lines):
+        print("ADVERTENCIA: los dos motores no producen los mismos resultados")
+    
+    per_sentence = best_time(lambda: compile_scalar(scalar, lines), args.repeat)
+    per_batch = best_time(lambda: compile_batched(batched, lines, args.batch_lines), args.repeat)
+    
+    print(f"Oraciones: {args.lines}  Oraciones por lote: {args.batch_lines}")
+    print(f"{'Motor':<26} {'Segundos':>10} {'Oraciones/s':>12}")
+    print(f"{'fused (por oración)':<26} {per_sentence:>10.3f} {args.lines / per_sentence:>12.0f}")
+    print(f"{'compile_batch (NumPy)':<26} {per_batch:>10.3f} {args.lines / per_batch:>12.0f}")
+    print(f"Aceleración: {per_sentence / per_batch:.2f}x")
+
+if __name__ == "__main__":
+    main()
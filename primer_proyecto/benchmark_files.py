@@ -0,0 +1,101 @@
+"""
+Benchmark del Modo por Lotes para Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Genera un árbol de directorios con muchos archivos de tamaños muy distintos
+(la mayoría chicos y unos pocos grandes) y compara:
+
+- ejecutar main.py una vez por archivo, que paga el arranque del intérprete
+  en cada archivo,
+- batch_mode.py con 1 trabajador y con varios.
+
+Verifica que el reporte de cada archivo sea idéntico al de main.py.
+
+Uso: python benchmark_files.py [--files N] [--lines N] [--workers 1,2,4]
+"""
+
+import argparse
+import filecmp
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List
+
+from batch_mode import compile_files, find_input_files, report_filename
+from benchmark_workers import SAMPLE_SENTENCES
+
+def write_tree(directory: str, total_files: int, total_lines: int, seed: int = 7) -> int:
+    """
+    Escribe los archivos de entrada en subdirectorios, con tamaños sesgados
+    
+    Returns:
+        Cantidad de líneas escritas
+    """
+    rng = random.Random(seed)
+    weights = [rng.paretovariate(1.2) for _ in range(total_files)]
+    scale = total_lines / sum(weights)
+    written = 0
+    for index, weight in enumerate(weights):
+        subdirectory = os.path.join(directory, f"lote{index % 8}")
+        os.makedirs(subdirectory, exist_ok=True)
+        lines = max(1, int(weight * scale))
+        with open(os.path.join(subdirectory, f"archivo{index:04d}.txt"), 'w', encoding='utf-8') as output_file:
+            for _ in range(lines):
+                output_file.write(rng.choice(SAMPLE_SENTENCES) + "\n")
+        written += lines
+    return written
+
+def run_per_file(tasks, output_directory: str) -> float:
+    """Ejecuta main.py una vez por archivo y devuelve los segundos totales"""
+    main_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+    start = time.perf_counter()
+    for task in tasks:
+        output_filename = report_filename(output_directory, task.relative_name)
+        os.makedirs(os.path.dirname(output_filename), exist_ok=True)
+        subprocess.run([sys.executable, main_script, task.input_filename, output_filename],
+                       check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+def main():
+    """Función principal del benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark del modo por lotes")
+    parser.add_argument("--files", type=int, default=200,
+                        help="cantidad de archivos de entrada (por defecto 200)")
+    parser.add_argument("--lines", type=int, default=200000,
+                        help="líneas en total entre todos los archivos (por defecto 200000)")
+    parser.add_argument("--workers", default="1,2,4",
+                        help="cantidades de trabajadores separadas por comas (por defecto 1,2,4)")
+    args = parser.parse_args()
+    worker_counts: List[int] = [int(value) for value in args.workers.split(",")]
+    
+    with tempfile.TemporaryDirectory() as directory:
+        input_directory = os.path.join(directory, "entrada")
+        lines = write_tree(input_directory, args.files, args.lines)
+        tasks = find_input_files(input_directory)
+        print(f"Archivos: {len(tasks)}  Líneas: {lines}  "
+              f"Más grande: {tasks[0].size / 1024:.0f} KB  CPUs: {os.cpu_count()}")
+        
+        expected_directory = os.path.join(directory, "main")
+        per_file_seconds = run_per_file(tasks, expected_directory)
+        print(f"  {'main.py por archivo':<30} {per_file_seconds:>8.2f} s")
+        
+        for workers in worker_counts:
+            output_directory = os.path.join(directory, f"lotes{workers}")
+            start = time.perf_counter()
+            summaries = list(compile_files(tasks, output_directory, workers))
+            seconds = time.perf_counter() - start
+            
+            identical = all(filecmp.cmp(report_filename(expected_directory, task.relative_name),
+                                        report_filename(output_directory, task.relative_name),
+                                        shallow=False)
+                            for task in tasks)
+            errors = sum(1 for summary in summaries if summary.error)
+            print(f"  {f'batch_mode, {workers} trabajadores':<30} {seconds:>8.2f} s  "
+                  f"x{per_file_seconds / seconds:.1f}  "
+                  f"{'reportes idénticos' if identical and not errors else 'DIFERENCIAS'}")
+
+if __name__ == "__main__":
+    main()
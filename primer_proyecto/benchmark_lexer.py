@@ -0,0 +1,86 @@
+"""
+Micro-benchmark de Analizadores Léxicos para Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Compara LexicalAnalyzer.analyze, que tokeniza línea por línea, con
+LexicalAnalyzer.scan_buffer, que tokeniza bloques de muchas líneas en una sola
+pasada, y verifica que ambos produzcan los mismos tokens y errores.
+
+Uso: python benchmark_lexer.py [--lines N] [--block-lines N] [--repeat N]
+"""
+
+import argparse
+import random
+import time
+from itertools import islice
+from typing import List
+
+from benchmark_workers import SAMPLE_SENTENCES
+from lexical_analyzer import LexicalAnalyzer
+
+def generate_lines(total_lines: int, seed: int = 7) -> List[str]:
+    """Genera líneas de entrada con oraciones de muestra al azar"""
+    rng = random.Random(seed)
+    return [rng.choice(SAMPLE_SENTENCES) + "\n" for _ in range(total_lines)]
+
+def lex_per_line(analyzer: LexicalAnalyzer, lines: List[str]) -> list:
+    """Tokeniza cada línea por separado con analyze()"""
+    results = []
+    for line in lines:
+        try:
+            results.append((analyzer.analyze(line), None))
+        except ValueError as e:
+            results.append(([], str(e)))
+    return results
+
+def lex_buffered(analyzer: LexicalAnalyzer, lines: List[str], block_lines: int) -> list:
+    """Tokeniza bloques de block_lines líneas con scan_buffer()"""
+    results = []
+    line_iterator = iter(lines)
+    first_line = 1
+    while True:
+        block = list(islice(line_iterator, block_lines))
+        if not block:
+            break
+        for scanned in analyzer.scan_buffer("".join(block), first_line):
+            results.append((scanned.tokens if scanned.error is None else [], scanned.error))
+        first_line += len(block)
+    return results
+
+def best_time(function, repeat: int) -> float:
+    """Devuelve el mejor tiempo de varias ejecuciones de la función"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    """Función principal del benchmark"""
+    parser = argparse.ArgumentParser(description="Micro-benchmark de analizadores léxicos")
+    parser.add_argument("--lines", type=int, default=500000,
+                        help="líneas de entrada (por defecto 500000)")
+    parser.add_argument("--block-lines", type=int, default=2000,
+                        help="líneas por bloque para scan_buffer (por defecto 2000)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="repeticiones; se reporta la mejor (por defecto 3)")
+    args = parser.parse_args()
+    
+    analyzer = LexicalAnalyzer()
+    lines = generate_lines(args.lines)
+    
+    if lex_per_line(analyzer, lines[:10000]) != lex_buffered(analyzer, lines[:10000], args.block_lines):
+        print("ADVERTENCIA: los dos analizadores no producen los mismos resultados")
+    
+    per_line = best_time(lambda: lex_per_line(analyzer, lines), args.repeat)
+    buffered = best_time(lambda: lex_buffered(analyzer, lines, args.block_lines), args.repeat)
+    
+    print(f"Líneas: {args.lines}  Líneas por bloque: {args.block_lines}")
+    print(f"{'Analizador':<24} {'Segundos':>10} {'Líneas/s':>12}")
+    print(f"{'analyze (por línea)':<24} {per_line:>10.3f} {args.lines / per_line:>12.0f}")
+    print(f"{'scan_buffer (bloques)':<24} {buffered:>10.3f} {args.lines / buffered:>12.0f}")
+    print(f"Aceleración: {per_line / buffered:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Benchmark del Léxico Externo para Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Genera un léxico sintético grande (el vocabulario de Little English más
+palabras al azar, algunas con varias categorías), lo compila con lexicon.py y
+mide:
+
+- la compilación del texto al formato binario,
+- la apertura del léxico compilado con mmap, contra leer el texto a un dict,
+- la tokenización de oraciones con el vocabulario fijo y con el léxico.
+
+Uso: python benchmark_lexicon.py [--words N] [--sentences N] [--repeat N]
+"""
+
+import argparse
+import os
+import random
+import string
+import tempfile
+import time
+from typing import Dict, List
+
+from lexical_analyzer import LexicalAnalyzer, TokenType, VOCABULARY
+from lexicon import WORD_TYPES, Lexicon, compile_lexicon, parse_lexicon
+
+def generate_lexicon(filename: str, total_words: int, seed: int = 7) -> Dict[TokenType, List[str]]:
+    """
+    Escribe un léxico de texto con el vocabulario de Little English y
+    palabras al azar
+    
+    Returns:
+        Palabras al azar agrupadas por categoría principal
+    """
+    rng = random.Random(seed)
+    words_by_type = {token_type: [] for token_type in WORD_TYPES}
+    with open(filename, 'w', encoding='utf-8') as lexicon_file:
+        for word, token_type in VOCABULARY.items():
+            lexicon_file.write(f"{word} {token_type.value}\n")
+        
+        for _ in range(total_words):
+            word = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 12)))
+            types = rng.sample(WORD_TYPES, rng.choice((1, 1, 1, 2)))
+            words_by_type[types[0]].append(word)
+            lexicon_file.write(f"{word} {' '.join(token_type.value for token_type in types)}\n")
+    return words_by_type
+
+def generate_sentences(words_by_type: Dict[TokenType, List[str]], total: int,
+                       seed: int = 7) -> List[str]:
+    """Genera oraciones válidas con palabras al azar del léxico"""
+    rng = random.Random(seed)
+    sentences = []
+    for _ in range(total):
+        words = [rng.choice(("a", "the")),
+                 rng.choice(words_by_type[TokenType.ADJECTIVE]),
+                 rng.choice(words_by_type[TokenType.NOUN]),
+                 rng.choice(words_by_type[TokenType.VERB]),
+                 rng.choice(words_by_type[TokenType.PREPOSITION]),
+                 rng.choice(("a", "the")),
+                 rng.choice(words_by_type[TokenType.NOUN]) + "."]
+        sentences.append(" ".join(words))
+    return sentences
+
+def best_time(function, repeat: int) -> float:
+    """Devuelve el mejor tiempo de varias ejecuciones de la función"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def load_text(filename: str) -> dict:
+    """Lee el léxico de texto a un dict, como haría un vocabulario en memoria"""
+    with open(filename, 'r', encoding='utf-8') as lexicon_file:
+        return parse_lexicon(lexicon_file)
+
+def open_and_close(filename: str):
+    """Abre el léxico compilado, busca una palabra y lo cierra"""
+    lexicon = Lexicon(filename)
+    lexicon.find("the")
+    lexicon.close()
+
+def tokenize_all(analyzer: LexicalAnalyzer, sentences: List[str]):
+    """Tokeniza todas las oraciones con tokenize_stream()"""
+    tokenize = analyzer.tokenize_stream
+    for sentence in sentences:
+        tokenize(sentence)
+
+def main():
+    """Función principal del benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark del léxico externo")
+    parser.add_argument("--words", type=int, default=500000,
+                        help="palabras al azar del léxico (por defecto 500000)")
+    parser.add_argument("--sentences", type=int, default=200000,
+                        help="oraciones a tokenizar (por defecto 200000)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="repeticiones; se reporta la mejor (por defecto 3)")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as directory:
+        text_filename = os.path.join(directory, "lexico.txt")
+        compiled_filename = os.path.join(directory, "lexico.lexc")
+        words_by_type = generate_lexicon(text_filename, args.words)
+        sentences = generate_sentences(words_by_type, args.sentences)
+        small_sentences = generate_sentences(
+            {token_type: [word for word, word_type in VOCABULARY.items() if word_type == token_type]
+             for token_type in WORD_TYPES}, args.sentences)
+        
+        start = time.perf_counter()
+        count = compile_lexicon(text_filename, compiled_filename)
+        compile_seconds = time.perf_counter() - start
+        
+        text_seconds = best_time(lambda: load_text(text_filename), args.repeat)
+        open_seconds = best_time(lambda: open_and_close(compiled_filename), args.repeat)
+        
+        lexicon = Lexicon(compiled_filename)
+        fixed_seconds = best_time(lambda: tokenize_all(LexicalAnalyzer(), small_sentences),
+                                  args.repeat)
+        cold_seconds = best_time(lambda: tokenize_all(LexicalAnalyzer(Lexicon(compiled_filename)),
+                                                      sentences), 1)
+        analyzer = LexicalAnalyzer(lexicon)
+        warm_seconds = best_time(lambda: tokenize_all(analyzer, sentences), args.repeat)
+        small_seconds = best_time(lambda: tokenize_all(LexicalAnalyzer(lexicon), small_sentences),
+                                  args.repeat)
+        
+        print(f"Léxico: {count} palabras, {os.path.getsize(text_filename) / 2**20:.1f} MB de texto, "
+              f"{os.path.getsize(compiled_filename) / 2**20:.1f} MB compilado")
+        print(f"Compilación a formato binario: {compile_seconds:.3f} s")
+        print(f"Leer el texto a un dict: {text_seconds * 1000:.1f} ms  "
+              f"Abrir el compilado con mmap: {open_seconds * 1000:.3f} ms")
+        print(f"Tokenización de {args.sentences} oraciones:")
+        print(f"  {'vocabulario fijo (dict)':<44} {fixed_seconds:>8.3f} s")
+        print(f"  {'léxico, mismas palabras':<44} {small_seconds:>8.3f} s")
+        print(f"  {'léxico, palabras al azar (primera pasada)':<44} {cold_seconds:>8.3f} s")
+        print(f"  {'léxico, palabras al azar (ya buscadas)':<44} {warm_seconds:>8.3f} s")
+        lexicon.close()
+
+if __name__ == "__main__":
+    main()
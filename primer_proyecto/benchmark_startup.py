@@ -0,0 +1,137 @@
+"""
+Benchmark de Arranque para Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Mide el costo de arranque de main.py con -X importtime y lo compara con un
+presupuesto:
+
+- el tiempo acumulado de "import main" (mejor de varias ejecuciones) y los
+  módulos que más aportan,
+- que los módulos de funciones opcionales no se importen al arrancar,
+- el tiempo total de "python main.py" con una entrada chica, contra el
+  arranque del intérprete solo,
+- varias compilaciones chicas con un proceso por compilación y con un solo
+  proceso --serve-stdin.
+
+Sale con código 1 si se excede el presupuesto o se importa un módulo diferido.
+
+Uso: python benchmark_startup.py [--budget-ms MS] [--repeat N] [--pairs N]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+# Presupuesto por defecto de "import main", en milisegundos
+DEFAULT_BUDGET_MS = 40.0
+
+# Módulos que solo se importan cuando se usa su función
+DEFERRED_MODULES = (
+    "argparse",             # solo en main()
+    "typing",               # solo al revisar los tipos
+    "re",                   # --mmap; también lo importa typing
+    "mmap",                 # --mmap, --lexicon
+    "mmap_input",           # --mmap
+    "parallel_compiler",    # --workers, --threads
+    "concurrent.futures",   # --workers
+    "multiprocessing",      # --workers
+    "fused_engine",         # --engine fused, --engine batch, --mmap
+    "batch_engine",         # --engine batch
+    "numpy",                # --engine batch
+    "instrumentation",      # --profile
+    "incremental",          # --incremental
+    "hashlib",              # --incremental, --lexicon, --grammar
+    "lexicon",              # --lexicon
+    "grammar",              # --grammar
+    "suggestions",          # --suggest
+    "parse_tree",           # --trees
+    "json",                 # --format jsonl, --incremental, --serve-stdin
+    "csv"                   # --format csv
+)
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+MAIN_SCRIPT = os.path.join(DIRECTORY, "main.py")
+
+def import_times(module: str = "main") -> Dict[str, Tuple[int, int]]:
+    """
+    Importa un módulo en un intérprete nuevo con -X importtime
+    
+    Returns:
+        Módulo -> (microsegundos propios, microsegundos acumulados)
+    """
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                               cwd=DIRECTORY, capture_output=True, text=True, check=True)
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+def best_wall_time(command: List[str], repeat: int, stdin: str = None) -> float:
+    """Mejor tiempo total de varias ejecuciones de un comando, en segundos"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=DIRECTORY, input=stdin, text=True, check=True,
+                       stdout=subprocess.DEVNULL)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    """Función principal del benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark del arranque de main.py")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"presupuesto de 'import main' en ms (por defecto {DEFAULT_BUDGET_MS:.0f})")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="repeticiones; se reporta la mejor (por defecto 5)")
+    parser.add_argument("--pairs", type=int, default=20,
+                        help="compilaciones chicas para comparar con --serve-stdin (por defecto 20)")
+    args = parser.parse_args()
+    
+    runs = [import_times() for _ in range(args.repeat)]
+    best = min(runs, key=lambda times: times["main"][1])
+    import_ms = best["main"][1] / 1000
+    print(f"import main: {import_ms:.1f} ms (presupuesto {args.budget_ms:.1f} ms)")
+    print("Módulos con más tiempo propio:")
+    for name, (own, _) in sorted(best.items(), key=lambda item: -item[1][0])[:8]:
+        print(f"  {name:<32} {own / 1000:>6.2f} ms")
+    
+    imported = [module for module in DEFERRED_MODULES if module in best]
+    if imported:
+        print(f"Módulos diferidos importados al arrancar: {', '.join(imported)}")
+    
+    with tempfile.TemporaryDirectory() as directory:
+        input_filename = os.path.join(DIRECTORY, "oraciones.txt")
+        output_filename = os.path.join(directory, "resultados.txt")
+        
+        interpreter = best_wall_time([sys.executable, "-c", "pass"], args.repeat)
+        single = best_wall_time([sys.executable, MAIN_SCRIPT, input_filename, output_filename],
+                                args.repeat)
+        print(f"python -c pass: {interpreter * 1000:.1f} ms  "
+              f"python main.py (entrada chica): {single * 1000:.1f} ms")
+        
+        pairs = "".join(f"{input_filename}\t{os.path.join(directory, f'r{index}.txt')}\n"
+                        for index in range(args.pairs))
+        start = time.perf_counter()
+        for index in range(args.pairs):
+            subprocess.run([sys.executable, MAIN_SCRIPT, input_filename,
+                            os.path.join(directory, f"p{index}.txt")],
+                           cwd=DIRECTORY, check=True, stdout=subprocess.DEVNULL)
+        separate = time.perf_counter() - start
+        served = best_wall_time([sys.executable, MAIN_SCRIPT, "--serve-stdin"], 1, stdin=pairs)
+        print(f"{args.pairs} compilaciones: un proceso por compilación {separate:.2f} s, "
+              f"--serve-stdin {served:.2f} s")
+    
+    if import_ms > args.budget_ms or imported:
+        print("FALLA: se excedió el presupuesto de arranque")
+        sys.exit(1)
+    print("Dentro del presupuesto")
+
+if __name__ == "__main__":
+    main()
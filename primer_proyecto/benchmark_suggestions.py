@@ -0,0 +1,154 @@
+"""
+Benchmark de las Sugerencias para Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Genera un léxico sintético grande (ver benchmark_lexicon.py), construye su
+índice de sugerencias con suggestions.py y mide:
+
+- la construcción del índice y su tamaño en disco,
+- la apertura del índice desde la caché con mmap,
+- la latencia de las búsquedas (promedio, mediana y p99) para palabras con
+  una o dos ediciones y para palabras al azar,
+- la misma búsqueda con un recorrido lineal de todo el vocabulario, y si
+  ambas dan las mismas sugerencias.
+
+Sale con código 1 si la latencia promedio del índice excede el presupuesto.
+
+Uso: python benchmark_suggestions.py [--words N] [--queries N] [--budget-ms MS]
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+from typing import List
+
+from benchmark_lexicon import generate_lexicon
+from lexical_analyzer import LexicalAnalyzer
+from lexicon import compile_lexicon, Lexicon
+from suggestions import (DEFAULT_SUGGESTIONS, MAX_DISTANCE, Suggestion, character_masks,
+                         edit_distance, load_suggestion_index)
+
+def misspell(word: str, rng: random.Random) -> str:
+    """Aplica una o dos ediciones al azar (inserción, borrado, sustitución o transposición)"""
+    for _ in range(rng.choice((1, 1, 2))):
+        position = rng.randrange(len(word))
+        edit = rng.randrange(4)
+        if edit == 0:
+            word = word[:position] + rng.choice(string.ascii_lowercase) + word[position:]
+        elif edit == 1 and len(word) > 1:
+            word = word[:position] + word[position + 1:]
+        elif edit == 2:
+            word = word[:position] + rng.choice(string.ascii_lowercase) + word[position + 1:]
+        elif position + 1 < len(word):
+            word = word[:position] + word[position + 1] + word[position] + word[position + 2:]
+    return word
+
+def generate_queries(words: List[str], total: int, seed: int = 11) -> List[str]:
+    """Palabras desconocidas: la mayoría con errores de tipeo, el resto al azar"""
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(total):
+        if rng.random() < 0.8:
+            queries.append(misspell(rng.choice(words), rng))
+        else:
+            queries.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 12))))
+    return queries
+
+def linear_lookup(words: List[str], word: str, count: int) -> List[Suggestion]:
+    """Sugerencias comparando con todas las palabras del vocabulario"""
+    masks = character_masks(word)
+    suggestions = []
+    for candidate in words:
+        if abs(len(candidate) - len(word)) > MAX_DISTANCE:
+            continue
+        distance = edit_distance(word, candidate, masks)
+        if distance <= MAX_DISTANCE:
+            suggestions.append(Suggestion(candidate, distance))
+    suggestions.sort(key=lambda suggestion: (suggestion.distance, suggestion.word))
+    return suggestions[:count]
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Percentil de una lista ordenada"""
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+def main():
+    """Función principal del benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark de las sugerencias")
+    parser.add_argument("--words", type=int, default=100000,
+                        help="palabras al azar del léxico (por defecto 100000)")
+    parser.add_argument("--queries", type=int, default=5000,
+                        help="palabras desconocidas a buscar (por defecto 5000)")
+    parser.add_argument("--linear-queries", type=int, default=50,
+                        help="búsquedas con recorrido lineal, para comparar (por defecto 50)")
+    parser.add_argument("--count", type=int, default=DEFAULT_SUGGESTIONS,
+                        help=f"sugerencias por palabra (por defecto {DEFAULT_SUGGESTIONS})")
+    parser.add_argument("--budget-ms", type=float, default=1.0,
+                        help="latencia promedio máxima de una búsqueda en ms (por defecto 1.0)")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as directory:
+        text_filename = os.path.join(directory, "lexico.txt")
+        compiled_filename = os.path.join(directory, "lexico.lexc")
+        generate_lexicon(text_filename, args.words)
+        compile_lexicon(text_filename, compiled_filename)
+        lexicon = Lexicon(compiled_filename)
+        analyzer = LexicalAnalyzer(lexicon)
+        words = list(lexicon.words())
+        queries = generate_queries(words, args.queries)
+        
+        start = time.perf_counter()
+        load_suggestion_index(analyzer).close()
+        build_seconds = time.perf_counter() - start
+        cached = [name for name in os.listdir(os.path.join(directory, "__pycache__"))
+                  if name.endswith(".sug")]
+        size = os.path.getsize(os.path.join(directory, "__pycache__", cached[0]))
+        
+        start = time.perf_counter()
+        index = load_suggestion_index(analyzer)
+        open_seconds = time.perf_counter() - start
+        
+        latencies = []
+        results = []
+        for query in queries:
+            start = time.perf_counter()
+            results.append(index.lookup(query, args.count))
+            latencies.append(time.perf_counter() - start)
+        latencies.sort()
+        mean_ms = sum(latencies) / len(latencies) * 1000
+        found = sum(1 for suggestions in results if suggestions)
+        
+        linear_total = 0.0
+        matches = 0
+        for query, expected in list(zip(queries, results))[:args.linear_queries]:
+            start = time.perf_counter()
+            suggestions = linear_lookup(words, query, args.count)
+            linear_total += time.perf_counter() - start
+            matches += suggestions == expected
+        linear_count = min(args.linear_queries, len(queries))
+        
+        print(f"Vocabulario: {len(index)} palabras  Índice: {size / 2**20:.1f} MB "
+              f"(construido en {build_seconds:.2f} s, abierto desde la caché en "
+              f"{open_seconds * 1000:.2f} ms)")
+        print(f"{len(queries)} búsquedas, {args.count} sugerencias, distancia máxima "
+              f"{index.max_distance}: {found} con sugerencias")
+        print(f"  {'índice de borrados':<22} promedio {mean_ms:.3f} ms  "
+              f"mediana {percentile(latencies, 0.5) * 1000:.3f} ms  "
+              f"p99 {percentile(latencies, 0.99) * 1000:.3f} ms")
+        if linear_count:
+            linear_ms = linear_total / linear_count * 1000
+            print(f"  {'recorrido lineal':<22} promedio {linear_ms:.1f} ms  "
+                  f"x{linear_ms / mean_ms:.0f} más lento  "
+                  f"mismas sugerencias en {matches}/{linear_count}")
+        index.close()
+        lexicon.close()
+    
+    if mean_ms > args.budget_ms:
+        print(f"FALLA: la búsqueda promedio excede {args.budget_ms} ms")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
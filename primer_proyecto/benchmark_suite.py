@@ -0,0 +1,291 @@
+"""
+Suite de Benchmarks para Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Mide líneas por segundo y memoria máxima (RSS) de cuatro etapas sobre un
+corpus sintético de corpus_generator.py:
+
+- lexer: LexicalAnalyzer.analyze sobre cada línea
+- parser: SyntaxAnalyzer.analyze sobre los tokens ya generados
+- end_to_end: LittleEnglishCompiler.compile_file completo
+- report: LittleEnglishCompiler.generate_output_file con resultados ya calculados
+
+Cada etapa se ejecuta en un subproceso propio, para que la memoria máxima de
+una no contamine la de las demás. Los resultados se guardan como JSON y
+--compare los contrasta con un archivo anterior para detectar regresiones
+entre versiones.
+
+Uso: python benchmark_suite.py [--lines N] [--input ARCHIVO] [--output ARCHIVO]
+                               [--compare ANTERIOR.json] [--tolerance 0.10]
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:
+    # Windows no tiene el módulo resource; la memoria máxima queda sin medir
+    resource = None
+
+from corpus_generator import parse_mix, write_corpus
+from lexical_analyzer import LexicalAnalyzer
+from syntax_analyzer import SyntaxAnalyzer
+from main import LittleEnglishCompiler
+
+def read_lines(input_filename: str) -> List[str]:
+    """Lee todas las líneas del corpus"""
+    with open(input_filename, 'r', encoding='utf-8') as input_file:
+        return input_file.readlines()
+
+def bench_lexer(input_filename: str, work_dir: str) -> Tuple[int, Callable[[], None]]:
+    """Prepara el benchmark del analizador léxico"""
+    lines = read_lines(input_filename)
+    analyzer = LexicalAnalyzer()
+    
+    def run():
+        for line in lines:
+            try:
+                analyzer.analyze(line)
+            except ValueError:
+                pass
+    
+    return len(lines), run
+
+def bench_parser(input_filename: str, work_dir: str) -> Tuple[int, Callable[[], None]]:
+    """Prepara el benchmark del analizador sintáctico (solo líneas sin errores léxicos)"""
+    lexical_analyzer = LexicalAnalyzer()
+    token_lists = []
+    for line in read_lines(input_filename):
+        try:
+            token_lists.append(lexical_analyzer.analyze(line))
+        except ValueError:
+            pass
+    analyzer = SyntaxAnalyzer()
+    
+    def run():
+        for tokens in token_lists:
+            try:
+                analyzer.analyze(tokens)
+            except SyntaxError:
+                pass
+    
+    return len(token_lists), run
+
+def bench_end_to_end(input_filename: str, work_dir: str) -> Tuple[int, Callable[[], None]]:
+    """Prepara el benchmark de compile_file completo"""
+    output_filename = os.path.join(work_dir, "reporte_end_to_end.txt")
+    line_count = len(read_lines(input_filename))
+    
+    def run():
+        LittleEnglishCompiler().compile_file(input_filename, output_filename)
+    
+    return line_count, run
+
+def bench_report(input_filename: str, work_dir: str) -> Tuple[int, Callable[[], None]]:
+    """Prepara el benchmark de la escritura del reporte"""
+    output_filename = os.path.join(work_dir, "reporte_report.txt")
+    compiler = LittleEnglishCompiler()
+    compiler.compile_file(input_filename, output_filename)
+    
+    def run():
+        compiler.generate_output_file(output_filename)
+    
+    return len(compiler.results), run
+
+# Etapas medidas, en el orden en que se ejecutan
+BENCHMARKS: Dict[str, Callable[[str, str], Tuple[int, Callable[[], None]]]] = {
+    "lexer": bench_lexer,
+    "parser": bench_parser,
+    "end_to_end": bench_end_to_end,
+    "report": bench_report
+}
+
+def max_rss_megabytes() -> Optional[float]:
+    """Devuelve la memoria máxima (RSS) del proceso actual en MB, si se puede medir"""
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reporta KB y macOS reporta bytes
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return max_rss / divisor
+
+def run_benchmark(name: str, input_filename: str, repeat: int) -> Dict:
+    """
+    Ejecuta una etapa en el proceso actual
+    
+    Args:
+        name: Nombre de la etapa (clave de BENCHMARKS)
+        input_filename: Corpus de entrada
+        repeat: Repeticiones; se reporta la mejor
+        
+    Returns:
+        Diccionario con líneas, segundos, líneas por segundo y memoria
+    """
+    with tempfile.TemporaryDirectory() as work_dir:
+        line_count, run = BENCHMARKS[name](input_filename, work_dir)
+        baseline_rss = max_rss_megabytes()
+        
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+    
+    return {
+        'lines': line_count,
+        'seconds': best,
+        'lines_per_second': line_count / best if best > 0 else 0.0,
+        'baseline_rss_mb': baseline_rss,
+        'peak_rss_mb': max_rss_megabytes()
+    }
+
+def run_in_subprocess(name: str, input_filename: str, repeat: int) -> Dict:
+    """Ejecuta una etapa en un subproceso nuevo y devuelve su resultado"""
+    command = [sys.executable, os.path.abspath(__file__),
+               "--run-one", name, "--input", input_filename, "--repeat", str(repeat)]
+    completed = subprocess.run(command, capture_output=True, text=True,
+                               cwd=os.path.dirname(os.path.abspath(__file__)))
+    if completed.returncode != 0:
+        raise RuntimeError(f"Falló el benchmark '{name}': {completed.stderr.strip()}")
+    return json.loads(completed.stdout)
+
+def current_label() -> str:
+    """Identifica la versión del código con el commit de git, si está disponible"""
+    try:
+        completed = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                   text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    except OSError:
+        return "desconocida"
+    return completed.stdout.strip() if completed.returncode == 0 else "desconocida"
+
+def compare_results(previous: Dict, current: Dict, tolerance: float) -> List[str]:
+    """
+    Compara dos corridas e imprime la variación de cada etapa
+    
+    Una regresión es una caída de líneas por segundo, o un aumento de la
+    memoria máxima, mayor que la tolerancia relativa.
+    
+    Args:
+        previous: Resultados anteriores (JSON cargado)
+        current: Resultados actuales
+        tolerance: Variación relativa permitida (0.10 = 10%)
+        
+    Returns:
+        Lista de descripciones de las regresiones encontradas
+    """
+    regressions = []
+    print(f"\nComparación con '{previous.get('label', '?')}' (tolerancia {tolerance:.0%})")
+    print(f"{'Etapa':<12} {'Líneas/s antes':>15} {'Líneas/s ahora':>15} {'Cambio':>8}")
+    for name, result in current['benchmarks'].items():
+        before = previous.get('benchmarks', {}).get(name)
+        if before is None:
+            print(f"{name:<12} {'-':>15} {result['lines_per_second']:>15.0f} {'nueva':>8}")
+            continue
+        
+        change = result['lines_per_second'] / before['lines_per_second'] - 1
+        print(f"{name:<12} {before['lines_per_second']:>15.0f} "
+              f"{result['lines_per_second']:>15.0f} {change:>+8.1%}")
+        if change < -tolerance:
+            regressions.append(f"{name}: {change:+.1%} líneas/s")
+        
+        if before.get('peak_rss_mb') and result.get('peak_rss_mb'):
+            memory_change = result['peak_rss_mb'] / before['peak_rss_mb'] - 1
+            if memory_change > tolerance:
+                regressions.append(f"{name}: {memory_change:+.1%} memoria máxima")
+    
+    return regressions
+
+def main():
+    """Función principal de la suite"""
+    parser = argparse.ArgumentParser(description="Suite de benchmarks de Little English")
+    parser.add_argument("--lines", type=int, default=200000,
+                        help="oraciones del corpus generado (por defecto 200000)")
+    parser.add_argument("--input", default=None, metavar="ARCHIVO",
+                        help="usa un corpus existente en lugar de generarlo")
+    parser.add_argument("--mix", default="0.8,0.1,0.1", metavar="V,L,S",
+                        help="mezcla del corpus generado (ver corpus_generator.py)")
+    parser.add_argument("--seed", type=int, default=7, help="semilla del corpus (por defecto 7)")
+    parser.add_argument("--benchmarks", default=",".join(BENCHMARKS),
+                        help=f"etapas separadas por coma (por defecto {','.join(BENCHMARKS)})")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="repeticiones por etapa; se reporta la mejor (por defecto 3)")
+    parser.add_argument("--output", default="resultados_benchmark.json", metavar="ARCHIVO",
+                        help="archivo JSON de resultados (por defecto resultados_benchmark.json)")
+    parser.add_argument("--compare", default=None, metavar="ANTERIOR",
+                        help="JSON de una corrida anterior; sale con código 1 si hay regresiones")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="variación relativa tolerada por --compare (por defecto 0.10)")
+    parser.add_argument("--label", default=None,
+                        help="nombre de la versión medida (por defecto, el commit de git)")
+    parser.add_argument("--run-one", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    # Modo interno: una sola etapa, resultado como JSON en la salida estándar
+    if args.run_one is not None:
+        print(json.dumps(run_benchmark(args.run_one, args.input, args.repeat)))
+        return
+    
+    names = args.benchmarks.split(",")
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"etapas desconocidas: {', '.join(unknown)}")
+    if args.repeat < 1:
+        parser.error("--repeat debe ser al menos 1")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if args.input is not None:
+            input_filename = os.path.abspath(args.input)
+            corpus = {'input': args.input}
+        else:
+            try:
+                mix = parse_mix(args.mix)
+            except ValueError as e:
+                parser.error(str(e))
+            input_filename = os.path.join(temp_dir, "corpus.txt")
+            write_corpus(input_filename, args.lines, args.seed, mix)
+            corpus = {'lines': args.lines, 'seed': args.seed, 'mix': list(mix)}
+        
+        results = {
+            'label': args.label or current_label(),
+            'timestamp': datetime.now().isoformat(timespec="seconds"),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'corpus': corpus,
+            'repeat': args.repeat,
+            'benchmarks': {}
+        }
+        
+        print(f"{'Etapa':<12} {'Líneas':>9} {'Segundos':>9} {'Líneas/s':>11} {'RSS máx. (MB)':>14}")
+        for name in names:
+            result = run_in_subprocess(name, input_filename, args.repeat)
+            results['benchmarks'][name] = result
+            peak = f"{result['peak_rss_mb']:.1f}" if result['peak_rss_mb'] is not None else "-"
+            print(f"{name:<12} {result['lines']:>9} {result['seconds']:>9.3f} "
+                  f"{result['lines_per_second']:>11.0f} {peak:>14}")
+    
+    with open(args.output, 'w', encoding='utf-8') as output_file:
+        json.dump(results, output_file, indent=2, ensure_ascii=False)
+    print(f"\nResultados guardados en '{args.output}'")
+    
+    if args.compare is not None:
+        with open(args.compare, 'r', encoding='utf-8') as previous_file:
+            previous = json.load(previous_file)
+        regressions = compare_results(previous, results, args.tolerance)
+        if regressions:
+            print("\nRegresiones:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            sys.exit(1)
+        print("\nSin regresiones")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Benchmark de Compilación con Hilos para Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Compara LittleEnglishCompiler.compile_file con un pool de hilos que comparte
+el compilador (--threads) contra el pool de procesos (--workers), con la
+misma cantidad de hilos o procesos, y verifica que cada reporte sea idéntico
+al serial. También mide el análisis reentrante (SyntaxAnalyzer.parse) con un
+solo analizador compartido por todos los hilos.
+
+Con el GIL los hilos se turnan y no deberían ganarle al serial; la
+comparación interesante es en un intérprete sin GIL (free-threaded, por
+ejemplo python3.13t). Con --python se repite el benchmark en otros
+intérpretes, para comparar ambos en una sola ejecución.
+
+Uso: python benchmark_threads.py [--lines N] [--counts 1,2,4] [--chunk-size N]
+                                 [--python RUTA ...]
+"""
+
+import argparse
+import filecmp
+import os
+import platform
+import subprocess
+import sys
+import sysconfig
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from corpus_generator import write_corpus
+from lexical_analyzer import LexicalAnalyzer
+from main import DEFAULT_CHUNK_SIZE, LittleEnglishCompiler
+from syntax_analyzer import SyntaxAnalyzer
+
+def describe_interpreter() -> str:
+    """Versión del intérprete y si ejecuta con o sin GIL"""
+    free_threaded = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    gil_enabled = is_gil_enabled() if is_gil_enabled is not None else True
+    return (f"Python {platform.python_version()} "
+            f"({'free-threaded' if free_threaded else 'estándar'}, "
+            f"{'con GIL' if gil_enabled else 'sin GIL'})")
+
+def time_compile(input_filename: str, output_filename: str, **options) -> float:
+    """Compila el archivo con un compilador nuevo y devuelve los segundos"""
+    compiler = LittleEnglishCompiler()
+    start = time.perf_counter()
+    compiler.compile_file(input_filename, output_filename, streaming=True, **options)
+    return time.perf_counter() - start
+
+def benchmark_shared_parse(input_filename: str, counts: List[int]) -> bool:
+    """
+    Analiza las oraciones con check() en serie y con parse() desde varios hilos
+    
+    Todos los hilos comparten un solo SyntaxAnalyzer.
+    
+    Returns:
+        True si todos los veredictos coinciden con los de check()
+    """
+    lexical_analyzer = LexicalAnalyzer()
+    streams = []
+    with open(input_filename, 'r', encoding='utf-8') as input_file:
+        for line in input_file:
+            scanned = lexical_analyzer.scan(line)
+            if not scanned.diagnostics:
+                streams.append(scanned.tokens)
+    
+    analyzer = SyntaxAnalyzer()
+    start = time.perf_counter()
+    expected = [analyzer.check(tokens) for tokens in streams]
+    check_seconds = time.perf_counter() - start
+    print(f"Analizador compartido, {len(streams)} oraciones sin errores léxicos:")
+    print(f"{'check (serie)':>20} {check_seconds:>10.3f}")
+    
+    all_equal = True
+    for count in counts:
+        chunks = [streams[index::count] for index in range(count)]
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            start = time.perf_counter()
+            results = list(executor.map(lambda chunk: [analyzer.parse(tokens) for tokens in chunk],
+                                        chunks))
+            elapsed = time.perf_counter() - start
+        
+        equal = all(results[index] == expected[index::count] for index in range(count))
+        all_equal = all_equal and equal
+        print(f"{f'parse ({count} hilos)':>20} {elapsed:>10.3f} "
+              f"{'sí' if equal else 'NO':>9}")
+    return all_equal
+
+def benchmark_threads(total_lines: int, counts: List[int], chunk_size: int) -> bool:
+    """
+    Ejecuta compile_file con hilos y con procesos e imprime la tabla
+    
+    Args:
+        total_lines: Cantidad de líneas del corpus sintético
+        counts: Cantidades de hilos y de procesos a medir
+        chunk_size: Cantidad de líneas por bloque
+        
+    Returns:
+        True si todos los reportes y veredictos coinciden con los seriales
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        input_filename = os.path.join(temp_dir, "entrada.txt")
+        serial_filename = os.path.join(temp_dir, "serial.txt")
+        write_corpus(input_filename, total_lines)
+        
+        serial_seconds = time_compile(input_filename, serial_filename)
+        
+        print(describe_interpreter())
+        print(f"Líneas: {total_lines}  Tamaño de bloque: {chunk_size}  CPUs: {os.cpu_count()}")
+        print(f"{'Modo':>20} {'Segundos':>10} {'Líneas/s':>12} {'Idéntico':>9}")
+        print(f"{'serie':>20} {serial_seconds:>10.3f} {total_lines / serial_seconds:>12.0f}")
+        
+        all_equal = True
+        for count in counts:
+            for label, option in (("hilos", "threads"), ("procesos", "workers")):
+                output_filename = os.path.join(temp_dir, f"{option}_{count}.txt")
+                elapsed = time_compile(input_filename, output_filename,
+                                       chunk_size=chunk_size, **{option: count})
+                identical = filecmp.cmp(serial_filename, output_filename, shallow=False)
+                all_equal = all_equal and identical
+                print(f"{f'{count} {label}':>20} {elapsed:>10.3f} "
+                      f"{total_lines / elapsed:>12.0f} {'sí' if identical else 'NO':>9}")
+        
+        return benchmark_shared_parse(input_filename, counts) and all_equal
+
+def main():
+    """Función principal del benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark de compilación con hilos")
+    parser.add_argument("--lines", type=int, default=200000,
+                        help="líneas del corpus sintético (por defecto 200000)")
+    parser.add_argument("--counts", default="1,2,4",
+                        help="cantidades de hilos y de procesos separadas por coma (por defecto 1,2,4)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"líneas por bloque (por defecto {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("--python", action="append", default=[], metavar="RUTA",
+                        help="repite el benchmark con otro intérprete (se puede repetir; "
+                             "por ejemplo python3.13 y python3.13t)")
+    args = parser.parse_args()
+    
+    counts = [int(value) for value in args.counts.split(",")]
+    success = benchmark_threads(args.lines, counts, args.chunk_size)
+    
+    for interpreter in args.python:
+        print()
+        completed = subprocess.run([interpreter, os.path.abspath(__file__),
+                                    "--lines", str(args.lines), "--counts", args.counts,
+                                    "--chunk-size", str(args.chunk_size)])
+        success = success and completed.returncode == 0
+    
+    if not success:
+        print("FALLA: hay resultados distintos de los seriales")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
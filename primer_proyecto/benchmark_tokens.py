@@ -0,0 +1,75 @@
+"""
+Benchmark de Memoria de Tokens para Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Compara la memoria que ocupan los tokens como lista de objetos Token
+(LexicalAnalyzer.tokenize) y como TokenStream compacto
+(LexicalAnalyzer.tokenize_stream), expresada en MB por millón de tokens.
+
+Uso: python benchmark_tokens.py [--sentences N]
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from benchmark_workers import SAMPLE_SENTENCES
+from lexical_analyzer import LexicalAnalyzer
+
+def valid_sentences(analyzer: LexicalAnalyzer, total: int, seed: int = 7) -> list:
+    """Genera oraciones de muestra sin errores léxicos"""
+    candidates = []
+    for sentence in SAMPLE_SENTENCES:
+        try:
+            analyzer.tokenize(sentence)
+            candidates.append(sentence)
+        except ValueError:
+            pass
+    
+    rng = random.Random(seed)
+    return [rng.choice(candidates) for _ in range(total)]
+
+def measure(tokenize, sentences: list) -> tuple:
+    """
+    Tokeniza todas las oraciones conservando los resultados
+    
+    El tiempo se mide en una pasada sin tracemalloc, que vuelve lenta cada
+    asignación, y la memoria en una segunda pasada con tracemalloc.
+    
+    Returns:
+        Tupla con (bytes asignados, segundos, cantidad de tokens)
+    """
+    start = time.perf_counter()
+    results = [tokenize(sentence) for sentence in sentences]
+    elapsed = time.perf_counter() - start
+    del results
+    
+    tracemalloc.start()
+    results = [tokenize(sentence) for sentence in sentences]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    token_count = sum(len(tokens) for tokens in results)
+    return allocated, elapsed, token_count
+
+def main():
+    """Función principal del benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark de memoria de tokens")
+    parser.add_argument("--sentences", type=int, default=200000,
+                        help="oraciones a tokenizar (por defecto 200000)")
+    args = parser.parse_args()
+    
+    analyzer = LexicalAnalyzer()
+    sentences = valid_sentences(analyzer, args.sentences)
+    
+    print(f"Oraciones: {args.sentences}")
+    print(f"{'Representación':<22} {'Tokens':>10} {'MB por millón de tokens':>24} {'Segundos':>9}")
+    for label, tokenize in (("Lista de Token", analyzer.tokenize),
+                            ("TokenStream", analyzer.tokenize_stream)):
+        allocated, elapsed, token_count = measure(tokenize, sentences)
+        megabytes_per_million = allocated / token_count  # (bytes / 1e6) * (1e6 / tokens)
+        print(f"{label:<22} {token_count:>10} {megabytes_per_million:>24.1f} {elapsed:>9.3f}")
+
+if __name__ == "__main__":
+    main()
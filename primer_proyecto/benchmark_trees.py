@@ -0,0 +1,129 @@
+"""
+Benchmark de los Árboles Sintácticos para Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Genera un corpus con corpus_generator.py y compara, con dos compiladores con
+las mismas opciones:
+
+- la validación: compile_input sin árboles,
+- la validación con árboles: compile_input con record_shapes, cuyos
+  resultados pasan por add_trees, que agrega cada árbol al arena desde la
+  forma producida al compilar y escribe los bloques en el formato binario.
+
+Las dos se miden en tiempo de CPU del proceso y sus repeticiones se
+alternan, para que la carga de otros procesos afecte a ambas por igual. Con
+--max-overhead (por defecto 20), sale con código 1 si los árboles agregan
+más que ese por ciento sobre la validación del motor elegido (--engine, por
+defecto el clásico). El costo por oración de los árboles es parecido en
+todos los motores, así que pesa más sobre los motores rápidos.
+
+También mide la exportación a JSONL y al formato binario, y verifica que
+leer el binario devuelva los mismos árboles que el JSONL.
+
+Uso: python benchmark_trees.py [--sentences N] [--repeat N] [--engine MOTOR]
+                               [--max-overhead PCT]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import List
+
+from corpus_generator import write_corpus
+from main import ENGINES, LittleEnglishCompiler
+from parse_tree import TreeWriter, read_binary
+
+def best_times(functions: List, repeat: int) -> List[float]:
+    """Devuelve el mejor tiempo de CPU de cada función, alternándolas en cada repetición"""
+    best = [float("inf")] * len(functions)
+    for _ in range(repeat):
+        for index, function in enumerate(functions):
+            start = time.process_time()
+            function()
+            best[index] = min(best[index], time.process_time() - start)
+    return best
+
+def validate(compiler: LittleEnglishCompiler, input_filename: str):
+    """Compila todas las líneas sin árboles"""
+    for _ in compiler.compile_input(input_filename):
+        pass
+
+def validate_with_trees(compiler: LittleEnglishCompiler, input_filename: str,
+                        trees_filename: str):
+    """Compila todas las líneas y exporta sus árboles en el formato binario"""
+    with TreeWriter(trees_filename, "binary") as writer:
+        for _ in compiler.add_trees(compiler.compile_input(input_filename), writer):
+            pass
+
+def export(compiler: LittleEnglishCompiler, results: List[dict], filename: str,
+           tree_format: str) -> float:
+    """Agrega los árboles de resultados ya compilados y los exporta; devuelve los segundos"""
+    start = time.perf_counter()
+    with TreeWriter(filename, tree_format) as writer:
+        for _ in compiler.add_trees((dict(result) for result in results), writer):
+            pass
+    return time.perf_counter() - start
+
+def main():
+    """Función principal del benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark de los árboles sintácticos")
+    parser.add_argument("--sentences", type=int, default=200000,
+                        help="oraciones del corpus (por defecto 200000)")
+    parser.add_argument("--repeat", type=int, default=7,
+                        help="repeticiones; se reporta la mejor (por defecto 7)")
+    parser.add_argument("--engine", choices=ENGINES, default="classic",
+                        help="motor de compilación (por defecto classic, el del compilador)")
+    parser.add_argument("--max-overhead", type=float, default=20.0,
+                        help="sobrecosto máximo de los árboles sobre la validación, en por "
+                             "ciento (por defecto 20)")
+    args = parser.parse_args()
+    
+    plain_compiler = LittleEnglishCompiler(engine=args.engine)
+    compiler = LittleEnglishCompiler(engine=args.engine, record_shapes=True)
+    with tempfile.TemporaryDirectory() as directory:
+        input_filename = os.path.join(directory, "oraciones.txt")
+        blocks_filename = os.path.join(directory, "bloques.bin")
+        write_corpus(input_filename, args.sentences)
+        
+        validate_seconds, trees_seconds = best_times(
+            [lambda: validate(plain_compiler, input_filename),
+             lambda: validate_with_trees(compiler, input_filename, blocks_filename)],
+            args.repeat)
+        results = list(compiler.compile_input(input_filename))
+        overhead = (trees_seconds / validate_seconds - 1) * 100
+        
+        print(f"Oraciones: {args.sentences}  Motor: {args.engine}  Formas con plantilla: "
+              f"{len(compiler.get_tree_builder().arena.templates)}")
+        print(f"  {'validación':<26} {validate_seconds:>8.3f} s")
+        print(f"  {'validación + árboles':<26} {trees_seconds:>8.3f} s  "
+              f"{overhead:+.1f}% sobre la validación")
+        
+        jsonl_filename = os.path.join(directory, "arboles.jsonl")
+        binary_filename = os.path.join(directory, "arboles.bin")
+        jsonl_seconds = export(compiler, results, jsonl_filename, "jsonl")
+        binary_seconds = export(compiler, results, binary_filename, "binary")
+        
+        with open(binary_filename, 'rb') as binary_file:
+            from_binary = [tree.to_dict() for arena in read_binary(binary_file) for tree in arena]
+        with open(jsonl_filename, 'r', encoding='utf-8') as jsonl_file:
+            from_jsonl = [json.loads(line) for line in jsonl_file]
+        
+        print(f"Exportación de {len(from_jsonl)} árboles (arena + escritura):")
+        print(f"  {'jsonl':<10} {jsonl_seconds:>8.3f} s  "
+              f"{os.path.getsize(jsonl_filename) / 2**20:>7.1f} MB")
+        print(f"  {'binary':<10} {binary_seconds:>8.3f} s  "
+              f"{os.path.getsize(binary_filename) / 2**20:>7.1f} MB")
+        print("El binario y el JSONL tienen los mismos árboles" if from_binary == from_jsonl
+              else "DIFERENCIAS entre el binario y el JSONL")
+    
+    if from_binary != from_jsonl:
+        sys.exit(1)
+    if overhead > args.max_overhead:
+        print(f"FALLA: los árboles agregan más de {args.max_overhead:.0f}% sobre la validación")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark de Compilación Paralela para Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Mide las líneas por segundo de LittleEnglishCompiler.compile_file según la
+cantidad de procesos trabajadores, y verifica que cada reporte paralelo sea
+idéntico al reporte serial.
+
+Uso: python benchmark_workers.py [--lines N] [--workers 1,2,4] [--chunk-size N]
+"""
+
+import argparse
+import filecmp
+import os
+import random
+import tempfile
+import time
+from typing import List
+
+from main import DEFAULT_CHUNK_SIZE, LittleEnglishCompiler
+
+# Oraciones de muestra: válidas, con error léxico y con error sintáctico
+SAMPLE_SENTENCES = [
+    "the cat runs.",
+    "a big dog walks.",
+    "the man reads a book.",
+    "the cat runs in the house.",
+    "a small cat sleeps on the tree.",
+    "the happy boy sees a small cat.",
+    "the cat.",
+    "runs the cat.",
+    "the big cat runs quickly.",
+    "invalid_word runs."
+]
+
+def write_sample_input(filename: str, total_lines: int, seed: int = 7):
+    """Escribe un archivo de entrada con oraciones de muestra al azar"""
+    rng = random.Random(seed)
+    with open(filename, 'w', encoding='utf-8') as output_file:
+        for _ in range(total_lines):
+            output_file.write(rng.choice(SAMPLE_SENTENCES) + "\n")
+
+def benchmark_workers(total_lines: int, worker_counts: List[int], chunk_size: int):
+    """
+    Ejecuta compile_file con cada cantidad de trabajadores e imprime la tabla
+    
+    Args:
+        total_lines: Cantidad de líneas del archivo de entrada sintético
+        worker_counts: Cantidades de trabajadores a medir
+        chunk_size: Cantidad de líneas por bloque
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        input_filename = os.path.join(temp_dir, "entrada.txt")
+        serial_filename = os.path.join(temp_dir, "serial.txt")
+        write_sample_input(input_filename, total_lines)
+        
+        LittleEnglishCompiler().compile_file(input_filename, serial_filename, streaming=True)
+        
+        print(f"Líneas: {total_lines}  Tamaño de bloque: {chunk_size}  CPUs: {os.cpu_count()}")
+        print(f"{'Trabajadores':>12} {'Segundos':>10} {'Líneas/s':>12} {'Idéntico':>9}")
+        
+        for workers in worker_counts:
+            output_filename = os.path.join(temp_dir, f"paralelo_{workers}.txt")
+            compiler = LittleEnglishCompiler()
+            
+            start = time.perf_counter()
+            compiler.compile_file(input_filename, output_filename, streaming=True,
+                                  workers=workers, chunk_size=chunk_size)
+            elapsed = time.perf_counter() - start
+            
+            identical = filecmp.cmp(serial_filename, output_filename, shallow=False)
+            print(f"{workers:>12} {elapsed:>10.3f} {total_lines / elapsed:>12.0f} "
+                  f"{'sí' if identical else 'NO':>9}")
+
+def main():
+    """Función principal del benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark de compilación paralela")
+    parser.add_argument("--lines", type=int, default=200000,
+                        help="líneas del archivo sintético (por defecto 200000)")
+    parser.add_argument("--workers", default="1,2,4",
+                        help="cantidades de trabajadores separadas por coma (por defecto 1,2,4)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"líneas por bloque (por defecto {DEFAULT_CHUNK_SIZE})")
+    args = parser.parse_args()
+    
+    worker_counts = [int(value) for value in args.workers.split(",")]
+    benchmark_workers(args.lines, worker_counts, args.chunk_size)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Caché LRU para Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Caché acotada que desaloja la entrada usada hace más tiempo y lleva
+contadores de aciertos, fallos y desalojos para las estadísticas de la
+ejecución. Para compartirla entre hilos se activa su candado con
+enable_locking() y se quita con disable_locking() cuando los hilos terminan.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+# Tipos de las anotaciones; typing no se importa al arrancar (ver main.py)
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Dict, Hashable, Optional
+
+class LRUCache:
+    """Caché acotada con política LRU (menos usada recientemente)"""
+    
+    def __init__(self, max_size: int):
+        if max_size < 1:
+            raise ValueError("El tamaño de la caché debe ser al menos 1")
+        
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Candado para compartir la caché entre hilos (None sin enable_locking)
+        self.lock = None
+    
+    def enable_locking(self):
+        """
+        Protege la caché con un candado para compartirla entre hilos
+        
+        get y put se reemplazan en la instancia por versiones que toman el
+        candado hasta que se llama a disable_locking(), así que la caché
+        usada en serie no paga su costo.
+        """
+        if self.lock is not None:
+            return
+        
+        from threading import Lock
+        lock = self.lock = Lock()
+        get = self.get
+        put = self.put
+        
+        def locked_get(key: Hashable) -> Optional[Any]:
+            with lock:
+                return get(key)
+        
+        def locked_put(key: Hashable, value: Any):
+            with lock:
+                put(key, value)
+        
+        self.get = locked_get
+        self.put = locked_put
+    
+    def disable_locking(self):
+        """Quita el candado de enable_locking(): get y put vuelven a ser los de la clase"""
+        if self.lock is None:
+            return
+        
+        del self.get, self.put
+        self.lock = None
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Busca una entrada y la marca como usada recientemente
+        
+        Args:
+            key: Clave de la entrada
+            
+        Returns:
+            El valor guardado, o None si la clave no está en la caché
+        """
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return value
+    
+    def put(self, key: Hashable, value: Any):
+        """
+        Guarda una entrada, desalojando la más antigua si la caché está llena
+        
+        Args:
+            key: Clave de la entrada
+            value: Valor a guardar (no puede ser None)
+        """
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    def clear(self):
+        """Vacía la caché sin poner en cero los contadores"""
+        self.entries.clear()
+    
+    def counters(self) -> Dict[str, int]:
+        """Devuelve los contadores de aciertos, fallos y desalojos"""
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+    
+    def reset_counters(self):
+        """Pone en cero los contadores sin vaciar la caché"""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
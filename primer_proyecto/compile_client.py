@@ -0,0 +1,101 @@
+"""
+Cliente del Servidor de Compilación para Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Envía oraciones a compile_server.py y muestra el veredicto de cada una. Las
+oraciones se envían sin esperar cada respuesta (en tubería) y las respuestas
+llegan en el mismo orden.
+
+Uso: python compile_client.py [archivo | -] [--sentence "the cat runs."]
+                              [--host 127.0.0.1] [--port 8765] [--stats]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from typing import Dict, List, Optional, Sequence
+
+from compile_server import DEFAULT_PORT, STATS_COMMAND
+
+async def compile_remote(sentences: Sequence[str], host: str = "127.0.0.1",
+                         port: int = DEFAULT_PORT, stats: bool = False) -> List[Dict]:
+    """
+    Compila oraciones en el servidor
+    
+    Args:
+        sentences: Oraciones (sin saltos de línea)
+        host: Dirección del servidor
+        port: Puerto del servidor
+        stats: Si es True, pide además las estadísticas del servidor al final
+        
+    Returns:
+        Respuestas del servidor en el orden de las oraciones; con stats, la
+        última respuesta es la de las estadísticas
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    
+    async def send():
+        for sentence in sentences:
+            writer.write((sentence + "\n").encode('utf-8'))
+            await writer.drain()
+        if stats:
+            writer.write((STATS_COMMAND + "\n").encode('utf-8'))
+        writer.write_eof()
+        await writer.drain()
+    
+    sender = asyncio.create_task(send())
+    responses = []
+    expected = len(sentences) + (1 if stats else 0)
+    while len(responses) < expected:
+        line = await reader.readline()
+        if not line:
+            raise ConnectionError("El servidor cerró la conexión antes de responder todo")
+        responses.append(json.loads(line))
+    
+    await sender
+    writer.close()
+    await writer.wait_closed()
+    return responses
+
+def read_sentences(filename: Optional[str]) -> List[str]:
+    """Lee las oraciones de un archivo, o de la entrada estándar con '-'"""
+    if filename == "-":
+        return [line.rstrip("\r\n") for line in sys.stdin]
+    with open(filename, 'r', encoding='utf-8') as input_file:
+        return [line.rstrip("\r\n") for line in input_file]
+
+def main():
+    """Función principal del cliente"""
+    parser = argparse.ArgumentParser(description="Cliente del servidor de compilación")
+    parser.add_argument("input_filename", nargs="?", default=None, metavar="archivo",
+                        help="archivo de oraciones, una por línea ('-' para la entrada estándar)")
+    parser.add_argument("--sentence", action="append", default=[],
+                        help="oración a compilar (se puede repetir)")
+    parser.add_argument("--host", default="127.0.0.1", help="dirección (por defecto 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT,
+                        help=f"puerto (por defecto {DEFAULT_PORT})")
+    parser.add_argument("--stats", action="store_true",
+                        help="muestra las estadísticas del servidor al final")
+    args = parser.parse_args()
+    
+    sentences = list(args.sentence)
+    if args.input_filename is not None:
+        sentences.extend(read_sentences(args.input_filename))
+    if not sentences and not args.stats:
+        parser.error("no hay oraciones: indique un archivo o --sentence")
+    
+    try:
+        responses = asyncio.run(compile_remote(sentences, args.host, args.port, args.stats))
+    except OSError as e:
+        print(f"Error de conexión: {e}")
+        sys.exit(1)
+    
+    for sentence, response in zip(sentences, responses):
+        status = "✓" if response['success'] else "✗"
+        print(f"{response['line']:>6} {status} {sentence} -> {response['message']}")
+    if args.stats:
+        print(json.dumps(responses[-1], indent=2, ensure_ascii=False))
+
+if __name__ == "__main__":
+    main()
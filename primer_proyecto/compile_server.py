@@ -0,0 +1,284 @@
+"""
+Servidor de Compilación para Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Servidor asyncio de larga duración que mantiene un LittleEnglishCompiler
+caliente y evita pagar el arranque del intérprete y la construcción de los
+analizadores en cada ejecución.
+
+Protocolo (TCP, líneas UTF-8):
+- El cliente envía una oración por línea.
+- El servidor responde una línea JSON por oración, en el mismo orden:
+  {"line": n, "success": true/false, "message": "..."}, donde n cuenta las
+  oraciones de la conexión desde 1.
+- La línea "#stats" no se compila: el servidor responde con un JSON de
+  estadísticas (oraciones, lotes y latencias p50/p99 en milisegundos).
+
+Las oraciones de todos los clientes pasan por una cola acotada y se agrupan
+en micro-lotes que se compilan en un ejecutor de un solo hilo. Cuando la cola
+está llena, el servidor deja de leer de las conexiones y TCP frena a los
+clientes (contrapresión).
+
+Uso: python compile_server.py [--host 127.0.0.1] [--port 8765] [--queue-size N]
+                              [--batch-size N] [--batch-delay-ms N] [--engine MOTOR]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+from main import (DEFAULT_CACHE_SIZE, DEFAULT_SHAPE_CACHE_SIZE, ENGINES, LittleEnglishCompiler)
+
+DEFAULT_PORT = 8765
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_BATCH_DELAY_MS = 2.0
+
+# Línea de control que pide las estadísticas en lugar de compilar
+STATS_COMMAND = "#stats"
+
+# Marca de fin de conexión en la cola de respuestas pendientes
+END_OF_CONNECTION = object()
+
+# Cantidad de latencias recientes que se conservan para los percentiles
+LATENCY_WINDOW = 100000
+
+class LatencyTracker:
+    """Latencias recientes (ventana acotada) para calcular percentiles"""
+    
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+    
+    def add(self, seconds: float):
+        """Registra la latencia de una oración"""
+        self.samples.append(seconds)
+        self.count += 1
+    
+    def percentile(self, fraction: float) -> float:
+        """Devuelve el percentil indicado (0.5 = p50) de la ventana, en segundos"""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+class CompileServer:
+    """Servidor de compilación con micro-lotes y cola acotada"""
+    
+    def __init__(self, compiler: LittleEnglishCompiler, queue_size: int = DEFAULT_QUEUE_SIZE,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 batch_delay: float = DEFAULT_BATCH_DELAY_MS / 1000):
+        self.compiler = compiler
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        # Un solo hilo: el compilador y sus cachés no se comparten entre hilos
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.latencies = LatencyTracker()
+        self.batches = 0
+        self.connections = 0
+        self.queue = None
+    
+    def compile_batch(self, sentences: List[str]) -> List[Tuple[bool, str]]:
+        """
+        Compila un micro-lote en el hilo del ejecutor
+        
+        Returns:
+            Lista de (éxito, mensaje) en el orden de las oraciones
+        """
+        compiler = self.compiler
+        if compiler.batch_engine is not None:
+            batch = compiler.compile_batch(sentences)
+            return [(row not in batch.messages, batch.messages.get(row, "Compilación exitosa"))
+                    for row in range(len(sentences))]
+        
+        return [compiler.compile_sentence(sentence, line_number)[1:]
+                for line_number, sentence in enumerate(sentences, 1)]
+    
+    def stats(self) -> Dict:
+        """Estadísticas del servidor desde que arrancó"""
+        return {
+            'sentences': self.latencies.count,
+            'batches': self.batches,
+            'mean_batch_size': self.latencies.count / self.batches if self.batches else 0.0,
+            'connections': self.connections,
+            'queue_depth': self.queue.qsize() if self.queue is not None else 0,
+            'p50_ms': self.latencies.percentile(0.50) * 1000,
+            'p99_ms': self.latencies.percentile(0.99) * 1000
+        }
+    
+    async def batch_loop(self):
+        """Toma oraciones de la cola, arma micro-lotes y los compila"""
+        loop = asyncio.get_running_loop()
+        queue = self.queue
+        
+        while True:
+            batch = [await queue.get()]
+            # Esperar un poco a que lleguen más oraciones, sin pasar de batch_size
+            deadline = loop.time() + self.batch_delay
+            while len(batch) < self.batch_size:
+                if queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    batch.append(queue.get_nowait())
+            
+            sentences = [sentence for sentence, _, _ in batch]
+            try:
+                verdicts = await loop.run_in_executor(self.executor, self.compile_batch, sentences)
+            except Exception as e:
+                verdicts = [(False, f"Error inesperado: {str(e)}")] * len(batch)
+            
+            self.batches += 1
+            now = time.perf_counter()
+            for (_, future, enqueued), verdict in zip(batch, verdicts):
+                self.latencies.add(now - enqueued)
+                if not future.done():
+                    future.set_result(verdict)
+    
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Atiende una conexión: encola sus oraciones y responde en orden"""
+        self.connections += 1
+        loop = asyncio.get_running_loop()
+        # Respuestas pendientes de escribir; acotada para frenar también a los
+        # clientes que envían sin leer las respuestas
+        pending = asyncio.Queue(maxsize=self.queue_size)
+        responder = asyncio.create_task(self.respond(pending, writer))
+        
+        try:
+            while True:
+                raw = await reader.readline()
+                if not raw:
+                    break
+                sentence = raw.decode('utf-8', errors='replace').rstrip('\r\n')
+                
+                if sentence.strip() == STATS_COMMAND:
+                    # Las estadísticas se calculan al llegar su turno de respuesta
+                    await pending.put(None)
+                    continue
+                
+                future = loop.create_future()
+                # put() espera mientras la cola está llena: contrapresión
+                await self.queue.put((sentence, future, time.perf_counter()))
+                await pending.put(future)
+        except (ConnectionError, ValueError):
+            # Conexión cortada o línea más larga que el límite del lector
+            pass
+        finally:
+            await pending.put(END_OF_CONNECTION)
+            await responder
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+    
+    async def respond(self, pending: asyncio.Queue, writer: asyncio.StreamWriter):
+        """
+        Escribe las respuestas de una conexión en el orden de sus oraciones
+        
+        Cada elemento de pending es el futuro de una oración, None para
+        "#stats" o END_OF_CONNECTION al terminar. Si el cliente se desconecta,
+        se siguen consumiendo los elementos sin escribirlos.
+        """
+        line_number = 0
+        connected = True
+        while True:
+            item = await pending.get()
+            if item is END_OF_CONNECTION:
+                return
+            
+            if item is None:
+                response = self.stats()
+            else:
+                success, message = await item
+                line_number += 1
+                response = {'line': line_number, 'success': success, 'message': message}
+            
+            if not connected:
+                continue
+            try:
+                writer.write((json.dumps(response, ensure_ascii=False) + "\n").encode('utf-8'))
+                await writer.drain()
+            except ConnectionError:
+                connected = False
+    
+    async def serve(self, host: str, port: int, report_interval: float = 0.0):
+        """Arranca el servidor y atiende conexiones hasta que se cancele"""
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+        batcher = asyncio.create_task(self.batch_loop())
+        server = await asyncio.start_server(self.handle_client, host, port)
+        
+        addresses = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+        print(f"Servidor de compilación escuchando en {addresses}", flush=True)
+        
+        try:
+            async with server:
+                if report_interval > 0:
+                    while True:
+                        await asyncio.sleep(report_interval)
+                        self.print_stats()
+                else:
+                    await server.serve_forever()
+        finally:
+            batcher.cancel()
+            self.executor.shutdown(wait=False)
+    
+    def print_stats(self):
+        """Imprime las estadísticas en la consola"""
+        stats = self.stats()
+        print(f"Oraciones: {stats['sentences']}  Lotes: {stats['batches']} "
+              f"(promedio {stats['mean_batch_size']:.1f})  Cola: {stats['queue_depth']}  "
+              f"p50: {stats['p50_ms']:.2f} ms  p99: {stats['p99_ms']:.2f} ms", flush=True)
+
+def main():
+    """Función principal del servidor"""
+    parser = argparse.ArgumentParser(description="Servidor de compilación de Little English")
+    parser.add_argument("--host", default="127.0.0.1", help="dirección (por defecto 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT,
+                        help=f"puerto (por defecto {DEFAULT_PORT})")
+    parser.add_argument("--queue-size", type=int, default=DEFAULT_QUEUE_SIZE, metavar="N",
+                        help=f"oraciones en espera antes de frenar a los clientes "
+                             f"(por defecto {DEFAULT_QUEUE_SIZE})")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, metavar="N",
+                        help=f"oraciones máximas por micro-lote (por defecto {DEFAULT_BATCH_SIZE})")
+    parser.add_argument("--batch-delay-ms", type=float, default=DEFAULT_BATCH_DELAY_MS, metavar="MS",
+                        help="espera máxima para completar un micro-lote "
+                             f"(por defecto {DEFAULT_BATCH_DELAY_MS})")
+    parser.add_argument("--engine", choices=ENGINES, default="fused",
+                        help="motor del compilador (por defecto fused)")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE, metavar="N",
+                        help=f"entradas de la caché de oraciones (por defecto {DEFAULT_CACHE_SIZE})")
+    parser.add_argument("--report-interval", type=float, default=10.0, metavar="SEGUNDOS",
+                        help="cada cuánto imprimir p50/p99 en la consola; 0 lo desactiva "
+                             "(por defecto 10)")
+    args = parser.parse_args()
+    
+    if args.queue_size < 1 or args.batch_size < 1 or args.batch_delay_ms < 0:
+        parser.error("--queue-size y --batch-size deben ser al menos 1 y --batch-delay-ms no "
+                     "puede ser negativo")
+    
+    try:
+        compiler = LittleEnglishCompiler(engine=args.engine, cache_size=args.cache_size,
+                                         shape_cache_size=DEFAULT_SHAPE_CACHE_SIZE)
+    except ImportError as e:
+        parser.error(str(e))
+    
+    server = CompileServer(compiler, args.queue_size, args.batch_size, args.batch_delay_ms / 1000)
+    try:
+        asyncio.run(server.serve(args.host, args.port, args.report_interval))
+    except KeyboardInterrupt:
+        print("\nServidor detenido")
+        server.print_stats()
+
+if __name__ == "__main__":
+    main()
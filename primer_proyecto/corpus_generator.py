@@ -0,0 +1,226 @@
+"""
+Generador de Corpus Sintético para Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Genera oraciones a partir de la gramática y el vocabulario de Little English,
+con una mezcla configurable de oraciones válidas, con error léxico y con error
+sintáctico, y una distribución configurable de longitudes (en palabras):
+
+<sentence>      ::= <noun_phrase> <verb_phrase> '.'
+<noun_phrase>   ::= <article> <noun> | <article> <adjective> <noun>
+<verb_phrase>   ::= <verb> | <verb> <noun_phrase> | <verb> <prep_phrase>
+<prep_phrase>   ::= <preposition> <noun_phrase>
+
+Uso: python corpus_generator.py salida.txt [--lines N] [--mix V,L,S]
+                                [--lengths 3:1,4:1,...] [--seed N]
+"""
+
+import argparse
+import random
+from typing import Dict, Iterator, List, Tuple
+
+from lexical_analyzer import LexicalAnalyzer, TokenType
+from fused_engine import FusedEngine
+
+# Frases nominales y verbales de la gramática, como secuencias de tipos
+NOUN_PHRASES = [
+    (TokenType.ARTICLE, TokenType.NOUN),
+    (TokenType.ARTICLE, TokenType.ADJECTIVE, TokenType.NOUN)
+]
+VERB_PHRASES = [(TokenType.VERB,)]
+VERB_PHRASES += [(TokenType.VERB,) + noun_phrase for noun_phrase in NOUN_PHRASES]
+VERB_PHRASES += [(TokenType.VERB, TokenType.PREPOSITION) + noun_phrase for noun_phrase in NOUN_PHRASES]
+
+# Todas las formas de oración válidas (sin el punto final)
+SENTENCE_SHAPES = [noun_phrase + verb_phrase
+                   for noun_phrase in NOUN_PHRASES for verb_phrase in VERB_PHRASES]
+
+# Clases de oración que puede producir el generador
+SENTENCE_KINDS = ("valid", "lexical", "syntax")
+DEFAULT_MIX = (0.8, 0.1, 0.1)
+
+# Palabras que no están en el vocabulario, para los errores léxicos
+UNKNOWN_WORDS = ["quickly", "very", "and", "blorp", "zzz", "hello", "cat2", "dogs", "ran", "xyz"]
+
+def parse_mix(text: str) -> Tuple[float, float, float]:
+    """
+    Interpreta una mezcla 'válidas,léxicas,sintácticas' como proporciones
+    
+    Args:
+        text: Tres pesos no negativos separados por comas (por ejemplo 8,1,1)
+        
+    Returns:
+        Proporciones normalizadas que suman 1
+    """
+    try:
+        weights = [float(part) for part in text.split(",")]
+    except ValueError:
+        raise ValueError(f"Mezcla inválida: '{text}'")
+    if len(weights) != len(SENTENCE_KINDS) or min(weights) < 0 or sum(weights) <= 0:
+        raise ValueError(f"Mezcla inválida: '{text}' (se esperan tres pesos no negativos)")
+    
+    total = sum(weights)
+    return tuple(weight / total for weight in weights)
+
+def parse_lengths(text: str) -> Dict[int, float]:
+    """
+    Interpreta una distribución de longitudes 'palabras:peso,...'
+    
+    Args:
+        text: Pares longitud:peso separados por comas (por ejemplo 3:1,5:2,8:1)
+        
+    Returns:
+        Diccionario longitud -> peso, solo con longitudes que la gramática admite
+    """
+    valid_lengths = {len(shape) for shape in SENTENCE_SHAPES}
+    lengths = {}
+    try:
+        for part in text.split(","):
+            length, weight = part.split(":")
+            lengths[int(length)] = float(weight)
+    except ValueError:
+        raise ValueError(f"Distribución de longitudes inválida: '{text}'")
+    
+    for length, weight in lengths.items():
+        if length not in valid_lengths:
+            raise ValueError(f"La gramática no genera oraciones de {length} palabras "
+                             f"(longitudes posibles: {sorted(valid_lengths)})")
+        if weight < 0:
+            raise ValueError(f"Peso negativo para la longitud {length}")
+    if sum(lengths.values()) <= 0:
+        raise ValueError(f"Distribución de longitudes inválida: '{text}'")
+    return lengths
+
+class CorpusGenerator:
+    """Generador reproducible de oraciones de Little English"""
+    
+    def __init__(self, seed: int = 7, mix: Tuple[float, float, float] = DEFAULT_MIX,
+                 lengths: Dict[int, float] = None):
+        self.rng = random.Random(seed)
+        self.mix = mix
+        self.engine = FusedEngine()
+        
+        # Palabras del vocabulario agrupadas por tipo
+        self.words_by_type: Dict[TokenType, List[str]] = {}
+        for word, token_type in LexicalAnalyzer().vocabulary.items():
+            self.words_by_type.setdefault(token_type, []).append(word)
+        self.vocabulary_words = [word for words in self.words_by_type.values() for word in words]
+        
+        # Formas agrupadas por longitud; sin distribución, todas las formas
+        # son igual de probables
+        self.shapes_by_length: Dict[int, List[tuple]] = {}
+        for shape in SENTENCE_SHAPES:
+            self.shapes_by_length.setdefault(len(shape), []).append(shape)
+        if lengths is None:
+            lengths = {length: len(shapes) for length, shapes in self.shapes_by_length.items()}
+        self.lengths = list(lengths)
+        self.length_weights = list(lengths.values())
+    
+    def valid_words(self) -> List[str]:
+        """Genera las palabras de una oración válida, sin el punto final"""
+        rng = self.rng
+        length = rng.choices(self.lengths, self.length_weights)[0]
+        shape = rng.choice(self.shapes_by_length[length])
+        return [rng.choice(self.words_by_type[token_type]) for token_type in shape]
+    
+    def lexical_words(self) -> List[str]:
+        """Genera una oración válida con una palabra reemplazada por una desconocida"""
+        words = self.valid_words()
+        words[self.rng.randrange(len(words))] = self.rng.choice(UNKNOWN_WORDS)
+        return words
+    
+    def syntax_words(self) -> List[str]:
+        """
+        Genera una oración sin errores léxicos que la gramática rechaza
+        
+        Aplica a una oración válida una mutación al azar (intercambiar dos
+        palabras vecinas, borrar una palabra, insertar una palabra o quitar el
+        punto final) hasta que el motor fusionado la rechace.
+        
+        Returns:
+            Palabras de la oración; la última incluye el punto si lo tiene
+        """
+        rng = self.rng
+        while True:
+            words = self.valid_words()
+            mutation = rng.randrange(4)
+            if mutation == 0:
+                position = rng.randrange(len(words) - 1)
+                words[position], words[position + 1] = words[position + 1], words[position]
+            elif mutation == 1:
+                del words[rng.randrange(len(words))]
+            elif mutation == 2:
+                words.insert(rng.randrange(len(words) + 1), rng.choice(self.vocabulary_words))
+            words[-1] += "" if mutation == 3 else "."
+            
+            success, message = self.engine.compile(" ".join(words))
+            if not success and message.startswith("Error sintáctico"):
+                return words
+    
+    def sentence(self) -> Tuple[str, str]:
+        """
+        Genera una oración según la mezcla configurada
+        
+        Returns:
+            Tupla con (clase de la oración, oración)
+        """
+        kind = self.rng.choices(SENTENCE_KINDS, self.mix)[0]
+        if kind == "valid":
+            words = self.valid_words()
+            words[-1] += "."
+        elif kind == "lexical":
+            words = self.lexical_words()
+            words[-1] += "."
+        else:
+            words = self.syntax_words()
+        return kind, " ".join(words)
+    
+    def generate(self, count: int) -> Iterator[str]:
+        """Genera count oraciones de forma perezosa"""
+        for _ in range(count):
+            yield self.sentence()[1]
+
+def write_corpus(filename: str, count: int, seed: int = 7,
+                 mix: Tuple[float, float, float] = DEFAULT_MIX,
+                 lengths: Dict[int, float] = None):
+    """
+    Escribe un corpus de count oraciones, una por línea
+    
+    Args:
+        filename: Nombre del archivo de salida
+        count: Cantidad de oraciones
+        seed: Semilla del generador (el mismo valor produce el mismo corpus)
+        mix: Proporciones de oraciones válidas, léxicas y sintácticas
+        lengths: Distribución de longitudes (palabras -> peso)
+    """
+    generator = CorpusGenerator(seed, mix, lengths)
+    with open(filename, 'w', encoding='utf-8') as output_file:
+        for sentence in generator.generate(count):
+            output_file.write(sentence + "\n")
+
+def main():
+    """Función principal del generador"""
+    parser = argparse.ArgumentParser(description="Generador de corpus sintético de Little English")
+    parser.add_argument("output_filename", metavar="archivo_salida")
+    parser.add_argument("--lines", type=int, default=1000000,
+                        help="oraciones a generar (por defecto 1000000)")
+    parser.add_argument("--mix", default="0.8,0.1,0.1", metavar="V,L,S",
+                        help="pesos de oraciones válidas, con error léxico y con error "
+                             "sintáctico (por defecto 0.8,0.1,0.1)")
+    parser.add_argument("--lengths", default=None, metavar="N:PESO,...",
+                        help="distribución de longitudes en palabras, por ejemplo 3:1,5:2,8:1 "
+                             "(por defecto, todas las formas de la gramática por igual)")
+    parser.add_argument("--seed", type=int, default=7, help="semilla (por defecto 7)")
+    args = parser.parse_args()
+    
+    try:
+        mix = parse_mix(args.mix)
+        lengths = parse_lengths(args.lengths) if args.lengths else None
+    except ValueError as e:
+        parser.error(str(e))
+    
+    write_corpus(args.output_filename, args.lines, args.seed, mix, lengths)
+    print(f"Corpus de {args.lines} oraciones guardado en '{args.output_filename}'")
+
+if __name__ == "__main__":
+    main()
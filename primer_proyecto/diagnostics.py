@@ -0,0 +1,106 @@
+"""
+Diagnósticos del Compilador de Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Registros livianos que describen un error léxico o sintáctico sin lanzar una
+excepción. Los analizadores los devuelven desde sus métodos sin excepciones
+(LexicalAnalyzer.scan y SyntaxAnalyzer.check); los métodos que lanzan
+excepciones usan el mismo texto como mensaje.
+
+El mensaje se arma solo cuando se pide, a partir del código y los datos del
+token.
+"""
+
+from __future__ import annotations
+
+from collections import namedtuple
+from enum import Enum
+
+# Tipos de las anotaciones; typing no se importa al arrancar (ver main.py)
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Optional
+
+class ErrorCode(Enum):
+    """Códigos de error; los léxicos empiezan con L y los sintácticos con S"""
+    EMPTY_SENTENCE = "L001"     # Oración sin palabras
+    UNKNOWN_TOKEN = "L002"      # Palabra que no está en el vocabulario
+    EMPTY_TOKENS = "S001"       # Lista de tokens vacía
+    UNEXPECTED_TOKEN = "S002"   # Token de un tipo distinto del esperado
+    UNEXPECTED_END = "S003"     # La oración terminó antes de tiempo
+    EXTRA_TOKENS = "S004"       # Tokens después del punto final
+
+# Los códigos como constantes del módulo: en los ciclos internos es más rápido
+# compararlos por identidad que leerlos de la clase ErrorCode
+EMPTY_SENTENCE = ErrorCode.EMPTY_SENTENCE
+UNKNOWN_TOKEN = ErrorCode.UNKNOWN_TOKEN
+EMPTY_TOKENS = ErrorCode.EMPTY_TOKENS
+UNEXPECTED_TOKEN = ErrorCode.UNEXPECTED_TOKEN
+UNEXPECTED_END = ErrorCode.UNEXPECTED_END
+EXTRA_TOKENS = ErrorCode.EXTRA_TOKENS
+
+class Diagnostic(namedtuple("Diagnostic",
+                            ("code", "value", "position", "token_index", "expected", "found"),
+                            defaults=("", -1, -1, None, None))):
+    """Error encontrado en una oración"""
+    __slots__ = ()
+    code: ErrorCode
+    value: str                # Texto del token (o palabra) con el error; por defecto ""
+    position: int             # Posición del token en la oración; por defecto -1
+    token_index: int          # Índice del token en la secuencia de tokens; por defecto -1
+    expected: Optional[str]   # Tipo de token esperado (errores sintácticos); por defecto None
+    found: Optional[str]      # Tipo de token encontrado (errores sintácticos); por defecto None
+    
+    @property
+    def is_lexical(self) -> bool:
+        """Indica si es un error léxico"""
+        code = self.code
+        return code is UNKNOWN_TOKEN or code is EMPTY_SENTENCE
+    
+    @property
+    def message(self) -> str:
+        """Mensaje del error, igual al de la excepción del método que lanza"""
+        code = self.code
+        if code is UNKNOWN_TOKEN:
+            return f"Token no reconocido: '{self.value}' en posición {self.position}"
+        if code is UNEXPECTED_TOKEN:
+            return f"Se esperaba {self.expected}, pero se encontró {self.found}: '{self.value}'"
+        if code is EXTRA_TOKENS:
+            return f"Tokens adicionales después del punto: {self.value}"
+        if code is UNEXPECTED_END:
+            return "Token inesperado: fin de oración"
+        if code is EMPTY_SENTENCE:
+            return "Oración vacía"
+        return "Lista de tokens vacía"
+    
+    def report_message(self) -> str:
+        """Mensaje del error tal como aparece en el reporte, con el prefijo de su categoría"""
+        if self.is_lexical:
+            return f"Error léxico: {self.message}"
+        return f"Error sintáctico: {self.message}"
+
+def test_diagnostics():
+    """Función de prueba: todos los errores de cada oración, sin excepciones"""
+    from main import LittleEnglishCompiler
+    
+    compiler = LittleEnglishCompiler()
+    
+    test_sentences = [
+        "the cat runs.",                    # Válida: NP VP .
+        "the zz cat yy runs.",              # Inválida: dos palabras desconocidas
+        "runs the cat.",                    # Inválida: orden incorrecto (dos errores)
+        "a cat sees the the dog in.",       # Inválida: artículo repetido y preposición final
+        "the cat runs. the dog"             # Inválida: tokens después del punto
+    ]
+    
+    for sentence in test_sentences:
+        print(f"Analizando: '{sentence}'")
+        diagnostics = compiler.diagnose(sentence)
+        if not diagnostics:
+            print("  Sin errores")
+        for diagnostic in diagnostics:
+            print(f"  {diagnostic.code.value} (token {diagnostic.token_index}): {diagnostic.message}")
+        print()
+
+if __name__ == "__main__":
+    test_diagnostics()
@@ -0,0 +1,343 @@
+"""
+Motor Fusionado Léxico-Sintáctico para Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+La gramática de Little English es regular, así que puede reconocerse con un
+autómata finito. Este módulo compila la gramática a una tabla de transiciones
+plana sobre los identificadores de tipo de token y recorre cada oración en un
+solo ciclo: busca cada palabra en el vocabulario y avanza el autómata, sin
+crear objetos Token ni lanzar excepciones.
+
+Los veredictos y mensajes de error son los mismos que produce el camino
+clásico LexicalAnalyzer + SyntaxAnalyzer en LittleEnglishCompiler.
+"""
+
+from array import array
+from typing import Dict, List, Optional, Tuple, Union
+from lexical_analyzer import (LexicalAnalyzer, ReadOnlyDict, TokenType, TOKEN_TYPES, TOKEN_TYPE_IDS,
+                              TYPE_CODES)
+
+# Estados del autómata (lo que ya se reconoció de la oración)
+START = 0               # Inicio: se espera el artículo del sujeto
+SUBJECT_ARTICLE = 1     # Artículo del sujeto
+SUBJECT_ADJECTIVE = 2   # Adjetivo del sujeto
+SUBJECT_NOUN = 3        # Sustantivo del sujeto
+VERB = 4                # Verbo
+PREPOSITION = 5         # Preposición de la frase preposicional
+OBJECT_ARTICLE = 6      # Artículo de la frase nominal del predicado
+OBJECT_ADJECTIVE = 7    # Adjetivo de la frase nominal del predicado
+OBJECT_NOUN = 8         # Sustantivo de la frase nominal del predicado
+ACCEPT = 9              # Punto final: oración completa
+ERROR = 10              # Estado sumidero de error
+STATE_COUNT = 11
+
+# Columna adicional de la tabla que representa el fin de la oración
+END = len(TOKEN_TYPES)
+COLUMN_COUNT = END + 1
+DOT_ID = TOKEN_TYPE_IDS[TokenType.DOT]
+
+# Vocabulario de Little English con claves en bytes (las palabras que no son
+# ASCII no pueden aparecer en una línea ASCII), compartido por los motores
+BYTE_TYPE_CODES = ReadOnlyDict({word.encode('ascii'): type_id
+                                for word, type_id in TYPE_CODES.items() if word.isascii()})
+
+# Transiciones válidas; cualquier otra lleva al estado ERROR
+TRANSITIONS = {
+    START: {TokenType.ARTICLE: SUBJECT_ARTICLE},
+    SUBJECT_ARTICLE: {TokenType.ADJECTIVE: SUBJECT_ADJECTIVE, TokenType.NOUN: SUBJECT_NOUN},
+    SUBJECT_ADJECTIVE: {TokenType.NOUN: SUBJECT_NOUN},
+    SUBJECT_NOUN: {TokenType.VERB: VERB},
+    VERB: {TokenType.PREPOSITION: PREPOSITION, TokenType.ARTICLE: OBJECT_ARTICLE,
+           TokenType.DOT: ACCEPT},
+    PREPOSITION: {TokenType.ARTICLE: OBJECT_ARTICLE},
+    OBJECT_ARTICLE: {TokenType.ADJECTIVE: OBJECT_ADJECTIVE, TokenType.NOUN: OBJECT_NOUN},
+    OBJECT_ADJECTIVE: {TokenType.NOUN: OBJECT_NOUN},
+    OBJECT_NOUN: {TokenType.DOT: ACCEPT},
+    ACCEPT: {}
+}
+
+# Tipo que el analizador sintáctico reporta como esperado en cada estado
+EXPECTED_TYPES = {
+    START: TokenType.ARTICLE,
+    SUBJECT_ARTICLE: TokenType.NOUN,
+    SUBJECT_ADJECTIVE: TokenType.NOUN,
+    SUBJECT_NOUN: TokenType.VERB,
+    VERB: TokenType.DOT,
+    PREPOSITION: TokenType.ARTICLE,
+    OBJECT_ARTICLE: TokenType.NOUN,
+    OBJECT_ADJECTIVE: TokenType.NOUN,
+    OBJECT_NOUN: TokenType.DOT
+}
+
+def build_transition_table() -> array:
+    """
+    Construye la tabla de transiciones plana
+    
+    La celda del estado s y la columna c está en la posición
+    s * COLUMN_COUNT + c. El estado ACCEPT solo acepta la columna END y el
+    estado ERROR es absorbente.
+    
+    Returns:
+        Arreglo de bytes con STATE_COUNT * COLUMN_COUNT celdas
+    """
+    table = array('b', [ERROR]) * (STATE_COUNT * COLUMN_COUNT)
+    for state, transitions in TRANSITIONS.items():
+        for token_type, next_state in transitions.items():
+            table[state * COLUMN_COUNT + TOKEN_TYPE_IDS[token_type]] = next_state
+    table[ACCEPT * COLUMN_COUNT + END] = ACCEPT
+    return table
+
+class FusedEngine:
+    """Reconocedor de una sola pasada que fusiona el análisis léxico y el sintáctico"""
+    
+    def __init__(self, lexical_analyzer: LexicalAnalyzer = None):
+        if lexical_analyzer is None:
+            lexical_analyzer = LexicalAnalyzer()
+        
+        # Vocabulario como palabra -> identificador de tipo, en str y en bytes.
+        # Un léxico externo acepta ambas claves y no se recorre completo
+        self.word_types: Dict[str, int] = lexical_analyzer.type_codes
+        # Léxico externo, con las categorías secundarias de cada palabra
+        self.lexicon = lexical_analyzer.lexicon
+        if lexical_analyzer.lexicon is not None:
+            self.byte_word_types: Dict[bytes, int] = self.word_types
+        else:
+            self.byte_word_types = BYTE_TYPE_CODES
+        self.table = build_transition_table()
+        # Con record_shapes, los veredictos de las oraciones aceptadas llevan
+        # además su forma (ver LittleEnglishCompiler.set_record_shapes)
+        self.record_shapes = False
+    
+    def compile(self, sentence: str) -> Tuple:
+        """
+        Reconoce una oración ya recortada y no vacía
+        
+        Las palabras se siguen buscando en el vocabulario aun después de un
+        error sintáctico, porque un error léxico posterior tiene prioridad
+        (el camino clásico tokeniza la oración completa antes de parsear).
+        
+        Args:
+            sentence: Oración a reconocer
+            
+        Returns:
+            Tupla con (éxito, mensaje) con los mismos mensajes que
+            LittleEnglishCompiler.compile_sentence; con record_shapes, las
+            aceptadas dan (True, mensaje, forma)
+        """
+        return self.compile_words(sentence.split(), self.word_types, '.')
+    
+    def compile_bytes_words(self, words: List[bytes]) -> Tuple:
+        """
+        Reconoce una oración ASCII dada como sus palabras en bytes
+        
+        Args:
+            words: Palabras de la línea (resultado de bytes.split())
+            
+        Returns:
+            Tupla con (éxito, mensaje), igual que compile()
+        """
+        return self.compile_words(words, self.byte_word_types, ord('.'))
+    
+    def compile_words(self, words: List[Union[str, bytes]], word_types: Dict,
+                      dot_char: Union[str, int]) -> Tuple:
+        """
+        Recorre el autómata sobre las palabras de una oración
+        
+        Con record_shapes, el código de tipo de cada token se guarda en la
+        misma pasada, para la forma de las oraciones aceptadas.
+        
+        Args:
+            words: Palabras de la oración, como str o como bytes
+            word_types: Vocabulario con claves del mismo tipo que las palabras
+            dot_char: Último elemento de una palabra terminada en punto
+                ('.' para str, 46 para bytes)
+            
+        Returns:
+            Tupla con (éxito, mensaje), o (True, mensaje, forma)
+        """
+        if not words:
+            return False, "Error léxico: Oración vacía"
+        
+        table = self.table
+        dot = DOT_ID
+        state = START
+        error_state = error_type = None
+        error_value = None
+        position = 0
+        types = [] if self.record_shapes else None
+        record = types.append if types is not None else None
+        
+        for word in words:
+            if word[-1] == dot_char:
+                value = word[:-1]
+                if value:
+                    type_id = word_types.get(value.lower())
+                    if type_id is None:
+                        return False, self.lexical_error(value, position)
+                    if types is not None:
+                        record(type_id)
+                    if error_state is None:
+                        next_state = table[state * COLUMN_COUNT + type_id]
+                        if next_state == ERROR:
+                            error_state, error_type, error_value = state, type_id, value
+                        else:
+                            state = next_state
+                
+                if types is not None:
+                    record(dot)
+                if error_state is None:
+                    next_state = table[state * COLUMN_COUNT + dot]
+                    if next_state == ERROR:
+                        error_state, error_type, error_value = state, dot, '.'
+                    else:
+                        state = next_state
+            else:
+                type_id = word_types.get(word.lower())
+                if type_id is None:
+                    return False, self.lexical_error(word, position)
+                if types is not None:
+                    record(type_id)
+                if error_state is None:
+                    next_state = table[state * COLUMN_COUNT + type_id]
+                    if next_state == ERROR:
+                        error_state, error_type, error_value = state, type_id, word
+                    else:
+                        state = next_state
+            
+            position += len(word) + 1
+        
+        if error_state is None and table[state * COLUMN_COUNT + END] != ERROR:
+            if types is not None:
+                return True, "Compilación exitosa", bytes(types)
+            return True, "Compilación exitosa"
+        
+        # Con un léxico externo, las otras categorías de las palabras pueden aceptarla
+        if self.lexicon is not None:
+            codes = self.word_categories(words, dot_char)
+            if codes is not None:
+                if types is not None:
+                    return True, "Compilación exitosa", bytes(codes)
+                return True, "Compilación exitosa"
+        
+        if error_state is not None:
+            return False, self.syntax_error(error_state, error_type, error_value)
+        return False, "Error sintáctico: Token inesperado: fin de oración"
+    
+    def word_categories(self, words: List[Union[str, bytes]],
+                        dot_char: Union[str, int]) -> Optional[List[int]]:
+        """
+        Busca una categoría de cada palabra con la que la oración se acepte
+        
+        Args:
+            words: Palabras de la oración, todas en el vocabulario
+            dot_char: Último elemento de una palabra terminada en punto
+            
+        Returns:
+            Código de tipo de cada token (ver search_categories), o None si
+            ninguna asignación de categorías llega al fin de oración
+        """
+        type_mask = self.lexicon.type_mask
+        dot_mask = 1 << DOT_ID
+        masks = []
+        for word in words:
+            if word[-1] == dot_char:
+                value = word[:-1]
+                if value:
+                    masks.append(type_mask(value.lower()))
+                masks.append(dot_mask)
+            else:
+                masks.append(type_mask(word.lower()))
+        return self.search_categories(masks)
+    
+    def search_categories(self, masks: List[int]) -> Optional[List[int]]:
+        """
+        Busca una asignación de categorías que el autómata acepte
+        
+        Recorre el autómata con el conjunto de estados alcanzables, avanzando
+        con todas las categorías de la máscara de cada token (ver
+        Lexicon.category_masks), así que no hay que probar las combinaciones
+        una por una. Cada estado recuerda de qué estado y con qué categoría se
+        llegó a él por primera vez, para reconstruir la asignación. Es la
+        búsqueda de todos los motores: el camino clásico la usa con la
+        gramática de Little English.
+        
+        Args:
+            masks: Máscara de categorías de cada token (bit i: código de tipo i)
+            
+        Returns:
+            Código de tipo elegido para cada token, o None si ninguna
+            asignación se acepta
+        """
+        table = self.table
+        states = (START,)
+        steps = []
+        
+        for mask in masks:
+            codes = [code for code in range(END) if mask & (1 << code)]
+            reached: Dict[int, Tuple[int, int]] = {}
+            for state in states:
+                row = state * COLUMN_COUNT
+                for code in codes:
+                    next_state = table[row + code]
+                    if next_state != ERROR and next_state not in reached:
+                        reached[next_state] = (state, code)
+            if not reached:
+                return None
+            steps.append(reached)
+            states = reached
+        
+        state = next((state for state in states if table[state * COLUMN_COUNT + END] != ERROR), None)
+        if state is None:
+            return None
+        codes = []
+        for reached in reversed(steps):
+            state, code = reached[state]
+            codes.append(code)
+        codes.reverse()
+        return codes
+    
+    @staticmethod
+    def lexical_error(value: Union[str, bytes], position: int) -> str:
+        """Construye el mensaje de un token no reconocido"""
+        if isinstance(value, bytes):
+            value = value.decode('ascii')
+        return f"Error léxico: Token no reconocido: '{value}' en posición {position}"
+    
+    @staticmethod
+    def syntax_error(state: int, type_id: int, value: Union[str, bytes]) -> str:
+        """Construye el mensaje del token que no tiene transición desde el estado"""
+        if isinstance(value, bytes):
+            value = value.decode('ascii')
+        if state == ACCEPT:
+            return f"Error sintáctico: Tokens adicionales después del punto: {value}"
+        
+        expected = EXPECTED_TYPES[state].value
+        found = TOKEN_TYPES[type_id].value
+        return f"Error sintáctico: Se esperaba {expected}, pero se encontró {found}: '{value}'"
+
+def test_fused_engine():
+    """Función de prueba: compara el motor fusionado con el camino clásico"""
+    from main import LittleEnglishCompiler
+    
+    classic_compiler = LittleEnglishCompiler()
+    engine = FusedEngine()
+    
+    test_sentences = [
+        "the cat runs.",                    # Válida: NP VP .
+        "a big dog walks.",                 # Válida: NP(con adj) VP .
+        "the man reads a book.",            # Válida: NP VP NP .
+        "the cat runs in the house.",       # Válida: NP VP PP .
+        "a small cat sleeps on the tree.",  # Válida: NP VP PP .
+        "the cat.",                         # Inválida: falta VP
+        "runs the cat.",                    # Inválida: orden incorrecto
+        "the big cat runs quickly."         # Inválida: adverbio no está en gramática
+    ]
+    
+    for sentence in test_sentences:
+        _, expected_success, expected_message = classic_compiler.compile_sentence(sentence, 0)
+        success, message = engine.compile(sentence)
+        status = "OK" if (success, message) == (expected_success, expected_message) else "DIFERENTE"
+        print(f"[{status}] '{sentence}' -> {message}")
+
+if __name__ == "__main__":
+    test_fused_engine()
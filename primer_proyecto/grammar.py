@@ -0,0 +1,611 @@
+"""
+Gramáticas LL(1) para Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Compila una gramática BNF (en el formato del README) a una tabla de análisis
+LL(1) y la ejecuta con un analizador sintáctico dirigido por tabla:
+
+    <sentence>    ::= <noun_phrase> <verb_phrase> '.'
+    <noun_phrase> ::= <article> <noun> | <article> <adjective> <noun>
+
+Los símbolos <x> que tienen regla son no terminales; los demás nombran un tipo
+de token (<article> es ARTICLE) y '.' es el token DOT. Una alternativa vacía
+se escribe ε o ''. Una línea que empieza con | continúa la regla anterior y #
+inicia un comentario. El símbolo inicial es el de la primera regla.
+
+La compilación factoriza por la izquierda las alternativas con prefijos
+comunes, calcula los conjuntos FIRST y FOLLOW y arma la tabla; si la gramática
+no es LL(1) (o es recursiva por la izquierda), se reportan todos los
+conflictos. La tabla compilada se guarda en __pycache__ junto a la gramática,
+con el hash del archivo en el nombre, así que las ejecuciones siguientes solo
+la leen.
+
+Uso: python grammar.py gramatica.bnf
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from lexical_analyzer import TokenType, TOKEN_TYPES, TOKEN_TYPE_IDS
+from syntax_analyzer import END_OF_TOKENS, SyntaxAnalyzer
+
+# Versión del formato de la tabla en caché; cambiarla invalida las anteriores
+TABLE_VERSION = 1
+
+# Gramática de Little English, igual a la que implementa SyntaxAnalyzer
+DEFAULT_GRAMMAR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gramatica.bnf")
+
+# Los terminales son los códigos de tipo de token, END es el fin de oración y
+# los no terminales se numeran a continuación. La columna END de la tabla es
+# la última, así que row[END_OF_TOKENS] (row[-1]) es la entrada de fin de oración
+TERMINAL_COUNT = len(TOKEN_TYPES)
+END = TERMINAL_COUNT
+NONTERMINAL_BASE = END + 1
+
+# Símbolos de una regla BNF: <nombre>, literal entre comillas, | o ε
+BNF_SYMBOL = re.compile(r"<[^<>\s]+>|'[^']*'|\"[^\"]*\"|\||ε|\S+")
+
+class GrammarError(ValueError):
+    """Error en una gramática: sintaxis, símbolos desconocidos o conflictos LL(1)"""
+
+def parse_bnf(text: str) -> Tuple[str, Dict[str, List[List[str]]]]:
+    """
+    Lee las reglas de una gramática BNF
+    
+    Args:
+        text: Contenido del archivo de la gramática
+        
+    Returns:
+        Tupla con (símbolo inicial, no terminal -> alternativas); cada
+        alternativa es una lista de símbolos tal como se escribieron
+        
+    Raises:
+        GrammarError: Si una línea no es una regla válida
+    """
+    rules: Dict[str, List[List[str]]] = {}
+    start = None
+    current = None
+    
+    for line_number, line in enumerate(text.splitlines(), 1):
+        line = line.split('#', 1)[0].strip()
+        if not line:
+            continue
+        
+        if line.startswith('|'):
+            if current is None:
+                raise GrammarError(f"Línea {line_number}: alternativa sin regla")
+            body = line
+        else:
+            head, separator, body = line.partition("::=")
+            head = head.strip()
+            if not separator or not re.fullmatch(r"<[^<>\s]+>", head):
+                raise GrammarError(f"Línea {line_number}: se esperaba '<nombre> ::= ...'")
+            current = head
+            if start is None:
+                start = head
+            body = "| " + body
+        
+        # Cada | abre una alternativa; las reglas repetidas agregan alternativas
+        alternatives = rules.setdefault(current, [])
+        for symbol in BNF_SYMBOL.findall(body):
+            if symbol == '|':
+                alternatives.append([])
+            elif symbol not in ('ε', "''", '""'):
+                alternatives[-1].append(symbol)
+    
+    if start is None:
+        raise GrammarError("La gramática no tiene reglas")
+    return start, rules
+
+def symbol_terminal(symbol: str) -> Optional[int]:
+    """Código de tipo de token de un símbolo terminal, o None si no es terminal"""
+    if symbol[0] in "'\"":
+        literal = symbol[1:-1]
+        return TOKEN_TYPE_IDS[TokenType.DOT] if literal == '.' else None
+    token_type = TokenType.__members__.get(symbol[1:-1].upper())
+    if token_type is None or token_type is TokenType.UNKNOWN:
+        return None
+    return TOKEN_TYPE_IDS[token_type]
+
+def left_factor(rules: Dict[str, List[List[str]]]) -> Dict[str, List[List[str]]]:
+    """
+    Factoriza por la izquierda las alternativas con un prefijo común
+    
+    <a> ::= x y | x z  se convierte en  <a> ::= x <a'>  y  <a'> ::= y | z.
+    Las alternativas nuevas conservan el orden de las originales.
+    
+    Returns:
+        Reglas nuevas (las originales no se modifican)
+    """
+    rules = {name: [list(alternative) for alternative in alternatives]
+             for name, alternatives in rules.items()}
+    pending = list(rules)
+    while pending:
+        name = pending.pop(0)
+        alternatives = rules[name]
+        for alternative in alternatives:
+            if not alternative:
+                continue
+            group = [other for other in alternatives if other and other[0] == alternative[0]]
+            if len(group) < 2:
+                continue
+            
+            prefix = list(alternative)
+            for other in group:
+                length = 0
+                while length < min(len(prefix), len(other)) and prefix[length] == other[length]:
+                    length += 1
+                prefix = prefix[:length]
+            
+            factored = name[:-1] + "'>"
+            while factored in rules:
+                factored = factored[:-1] + "'>"
+            rules[factored] = [other[len(prefix):] for other in group]
+            position = next(index for index, other in enumerate(alternatives) if other is group[0])
+            remaining = [other for other in alternatives if not any(other is member for member in group)]
+            remaining.insert(position, prefix + [factored])
+            rules[name] = remaining
+            pending += [name, factored]
+            break
+    return rules
+
+class LL1Grammar:
+    """Gramática compilada: producciones, tabla LL(1) y producciones por defecto"""
+    
+    def __init__(self, start: int, nonterminals: List[str], productions: List[Tuple[int, Tuple[int, ...]]],
+                 table: List[List[int]], defaults: List[int], digest: str = ""):
+        # Los no terminales se numeran desde NONTERMINAL_BASE; productions[i] es
+        # (no terminal, símbolos de la derecha)
+        self.start = start
+        self.nonterminals = nonterminals
+        self.productions = productions
+        # table[n][t] es la producción del no terminal NONTERMINAL_BASE + n con
+        # el token de código t (columna END al final), o -1
+        self.table = table
+        # Producción que se expande cuando la tabla no tiene entrada: la
+        # alternativa vacía si el no terminal la deriva y, si no, la primera.
+        # Así el error aparece al comparar el siguiente terminal, con el
+        # mismo mensaje que el analizador descendente recursivo
+        self.defaults = defaults
+        self.digest = digest
+    
+    @classmethod
+    def compile(cls, text: str, digest: str = "") -> "LL1Grammar":
+        """
+        Compila el texto de una gramática BNF
+        
+        Raises:
+            GrammarError: Si la gramática tiene errores o conflictos LL(1)
+        """
+        start_name, rules = parse_bnf(text)
+        rules = left_factor(rules)
+        
+        names = list(rules)
+        numbers = {name: NONTERMINAL_BASE + index for index, name in enumerate(names)}
+        productions: List[Tuple[int, Tuple[int, ...]]] = []
+        for name, alternatives in rules.items():
+            for alternative in alternatives:
+                symbols = []
+                for symbol in alternative:
+                    if symbol in numbers:
+                        symbols.append(numbers[symbol])
+                        continue
+                    terminal = symbol_terminal(symbol)
+                    if terminal is None:
+                        raise GrammarError(f"Símbolo desconocido en {name}: {symbol}")
+                    symbols.append(terminal)
+                productions.append((numbers[name], tuple(symbols)))
+        
+        analysis = GrammarAnalysis(names, productions)
+        problems = analysis.left_recursion() + analysis.conflicts()
+        if problems:
+            raise GrammarError("La gramática no es LL(1):\n" + "\n".join(f"  {problem}" for problem in problems))
+        
+        return cls(numbers[start_name], names, productions, analysis.table(), analysis.defaults(), digest)
+    
+    def to_dict(self) -> Dict:
+        """Exporta la gramática compilada como diccionario serializable"""
+        return {
+            'version': TABLE_VERSION,
+            'token_types': [token_type.value for token_type in TOKEN_TYPES],
+            'digest': self.digest,
+            'start': self.start,
+            'nonterminals': self.nonterminals,
+            'productions': [[lhs, list(rhs)] for lhs, rhs in self.productions],
+            'table': self.table,
+            'defaults': self.defaults
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LL1Grammar":
+        """
+        Reconstruye una gramática exportada por to_dict()
+        
+        Raises:
+            ValueError: Si los datos son de otra versión o de otros tipos de token
+        """
+        if (data['version'] != TABLE_VERSION
+                or data['token_types'] != [token_type.value for token_type in TOKEN_TYPES]):
+            raise ValueError("Tabla compilada incompatible")
+        return cls(data['start'], data['nonterminals'],
+                   [(lhs, tuple(rhs)) for lhs, rhs in data['productions']],
+                   data['table'], data['defaults'], data['digest'])
+    
+    def describe(self, symbol: int) -> str:
+        """Nombre de un símbolo como en la gramática"""
+        return describe_symbol(symbol, self.nonterminals)
+
+class GrammarAnalysis:
+    """Conjuntos FIRST y FOLLOW de una gramática y la tabla LL(1) que se deriva de ellos"""
+    
+    def __init__(self, nonterminals: List[str], productions: List[Tuple[int, Tuple[int, ...]]]):
+        self.nonterminals = nonterminals
+        self.productions = productions
+        count = len(nonterminals)
+        self.nullable = [False] * count
+        self.first: List[Set[int]] = [set() for _ in range(count)]
+        self.follow: List[Set[int]] = [set() for _ in range(count)]
+        self.follow[0].add(END)
+        
+        changed = True
+        while changed:
+            changed = False
+            for lhs, rhs in productions:
+                index = lhs - NONTERMINAL_BASE
+                first, nullable = self.first_of(rhs)
+                if not first <= self.first[index]:
+                    self.first[index] |= first
+                    changed = True
+                if nullable and not self.nullable[index]:
+                    self.nullable[index] = True
+                    changed = True
+        
+        changed = True
+        while changed:
+            changed = False
+            for lhs, rhs in productions:
+                for position, symbol in enumerate(rhs):
+                    if symbol < TERMINAL_COUNT:
+                        continue
+                    first, nullable = self.first_of(rhs[position + 1:])
+                    follow = self.follow[symbol - NONTERMINAL_BASE]
+                    additions = first | (self.follow[lhs - NONTERMINAL_BASE] if nullable else set())
+                    if not additions <= follow:
+                        follow |= additions
+                        changed = True
+    
+    def first_of(self, symbols: Sequence[int]) -> Tuple[Set[int], bool]:
+        """FIRST de una secuencia de símbolos y si la secuencia puede ser vacía"""
+        first = set()
+        for symbol in symbols:
+            if symbol < TERMINAL_COUNT:
+                first.add(symbol)
+                return first, False
+            first |= self.first[symbol - NONTERMINAL_BASE]
+            if not self.nullable[symbol - NONTERMINAL_BASE]:
+                return first, False
+        return first, True
+    
+    def predict(self, production: int) -> Set[int]:
+        """Columnas de la tabla que eligen la producción"""
+        lhs, rhs = self.productions[production]
+        first, nullable = self.first_of(rhs)
+        if nullable:
+            first = first | self.follow[lhs - NONTERMINAL_BASE]
+        return first
+    
+    def left_recursion(self) -> List[str]:
+        """Describe los no terminales recursivos por la izquierda"""
+        # Aristas A -> B si B puede aparecer al inicio de una derivación de A
+        edges = [set() for _ in self.nonterminals]
+        for lhs, rhs in self.productions:
+            for symbol in rhs:
+                if symbol < TERMINAL_COUNT:
+                    break
+                edges[lhs - NONTERMINAL_BASE].add(symbol - NONTERMINAL_BASE)
+                if not self.nullable[symbol - NONTERMINAL_BASE]:
+                    break
+        
+        problems = []
+        for index, name in enumerate(self.nonterminals):
+            reachable, pending = set(), list(edges[index])
+            while pending:
+                other = pending.pop()
+                if other not in reachable:
+                    reachable.add(other)
+                    pending.extend(edges[other])
+            if index in reachable:
+                problems.append(f"{name} es recursivo por la izquierda")
+        return problems
+    
+    def conflicts(self) -> List[str]:
+        """Describe cada celda de la tabla que eligen dos o más producciones"""
+        cells: Dict[Tuple[int, int], List[int]] = {}
+        for production in range(len(self.productions)):
+            lhs = self.productions[production][0]
+            for column in self.predict(production):
+                cells.setdefault((lhs, column), []).append(production)
+        
+        problems = []
+        for (lhs, column), productions in sorted(cells.items()):
+            if len(productions) < 2:
+                continue
+            reasons = []
+            for production in productions:
+                first, _ = self.first_of(self.productions[production][1])
+                source = "FIRST" if column in first else f"FOLLOW({self.describe(lhs)})"
+                reasons.append(f"{self.describe_production(production)} [{source}]")
+            problems.append(f"conflicto en {self.describe(lhs)} con {self.describe(column)}: "
+                            + " / ".join(reasons))
+        return problems
+    
+    def table(self) -> List[List[int]]:
+        """Tabla LL(1) sin conflictos: una fila por no terminal, una columna por terminal y END"""
+        table = [[-1] * (TERMINAL_COUNT + 1) for _ in self.nonterminals]
+        for production, (lhs, _) in enumerate(self.productions):
+            for column in self.predict(production):
+                table[lhs - NONTERMINAL_BASE][column] = production
+        return table
+    
+    def defaults(self) -> List[int]:
+        """Producción por defecto de cada no terminal (ver LL1Grammar)"""
+        defaults = [-1] * len(self.nonterminals)
+        for production, (lhs, rhs) in enumerate(self.productions):
+            index = lhs - NONTERMINAL_BASE
+            nullable = self.first_of(rhs)[1]
+            if defaults[index] < 0 or (nullable and not self.first_of(self.productions[defaults[index]][1])[1]):
+                defaults[index] = production
+        return defaults
+    
+    def describe(self, symbol: int) -> str:
+        """Nombre de un símbolo como en la gramática"""
+        return describe_symbol(symbol, self.nonterminals)
+    
+    def describe_production(self, production: int) -> str:
+        """Producción escrita como regla BNF"""
+        lhs, rhs = self.productions[production]
+        return f"{self.describe(lhs)} ::= {' '.join(map(self.describe, rhs)) or 'ε'}"
+
+def describe_symbol(symbol: int, nonterminals: List[str]) -> str:
+    """Nombre de un símbolo: <no_terminal>, <tipo de token>, '.' o fin de oración"""
+    if symbol == END:
+        return "fin de oración"
+    if symbol >= TERMINAL_COUNT:
+        return nonterminals[symbol - NONTERMINAL_BASE]
+    if TOKEN_TYPES[symbol] is TokenType.DOT:
+        return "'.'"
+    return f"<{TOKEN_TYPES[symbol].value.lower()}>"
+
+def cache_filename(filename: str, digest: str) -> str:
+    """Archivo de la tabla compilada de una gramática con el hash dado"""
+    directory, name = os.path.split(os.path.abspath(filename))
+    return os.path.join(directory, "__pycache__", f"{name}.{digest[:16]}.ll1.json")
+
+def load_grammar(filename: str = DEFAULT_GRAMMAR, use_cache: bool = True) -> LL1Grammar:
+    """
+    Carga una gramática, compilándola solo si no hay una tabla en caché
+    
+    Args:
+        filename: Archivo BNF de la gramática
+        use_cache: Si es False, compila siempre y no escribe la caché
+        
+    Returns:
+        Gramática compilada
+        
+    Raises:
+        GrammarError: Si la gramática tiene errores o conflictos LL(1)
+    """
+    with open(filename, 'rb') as grammar_file:
+        content = grammar_file.read()
+    digest = hashlib.sha256(content).hexdigest()
+    cached = cache_filename(filename, digest)
+    
+    if use_cache:
+        try:
+            with open(cached, 'r', encoding='utf-8') as cache_file:
+                grammar = LL1Grammar.from_dict(json.load(cache_file))
+            if grammar.digest == digest:
+                return grammar
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+    
+    grammar = LL1Grammar.compile(content.decode('utf-8'), digest)
+    if use_cache:
+        # Sin permiso de escritura se sigue sin caché
+        try:
+            os.makedirs(os.path.dirname(cached), exist_ok=True)
+            temporary_filename = cached + ".tmp"
+            with open(temporary_filename, 'w', encoding='utf-8') as cache_file:
+                json.dump(grammar.to_dict(), cache_file)
+            os.replace(temporary_filename, cached)
+        except OSError:
+            pass
+    return grammar
+
+class TableDrivenAnalyzer(SyntaxAnalyzer):
+    """
+    Analizador sintáctico dirigido por una tabla LL(1)
+    
+    Reemplaza las reglas escritas a mano de SyntaxAnalyzer por una pila de
+    símbolos; un terminal que no coincide con el token actual se delega a
+    expect(), así que los diagnósticos, la recuperación con collect_all y los
+    métodos que lanzan excepciones son los de SyntaxAnalyzer. Con la gramática de gramatica.bnf
+    da los mismos resultados y mensajes.
+    """
+    
+    def __init__(self, grammar: LL1Grammar = None):
+        super().__init__()
+        self.grammar = grammar if grammar is not None else load_grammar()
+        # expansions[símbolo][código] es el lado derecho (invertido, para
+        # apilarlo) de la producción que se expande, con la producción por
+        # defecto en las celdas vacías; las filas de los terminales y END
+        # quedan en None para indexar directamente por el símbolo
+        reversed_productions = [tuple(reversed(rhs)) for _, rhs in self.grammar.productions]
+        self.expansions = [None] * NONTERMINAL_BASE
+        for row, default in zip(self.grammar.table, self.grammar.defaults):
+            self.expansions.append([reversed_productions[production if production >= 0 else default]
+                                    for production in row])
+        # predictions es como expansions pero sin las producciones por
+        # defecto: None en las celdas vacías, para search_categories
+        self.predictions = [None] * NONTERMINAL_BASE
+        for row in self.grammar.table:
+            self.predictions.append([reversed_productions[production] if production >= 0 else None
+                                     for production in row])
+    
+    def parse_sentence(self) -> bool:
+        """
+        Analiza la oración desde el símbolo inicial de la gramática
+        
+        El índice y el tipo del token actual se llevan en variables locales;
+        solo se sincronizan con el analizador cuando expect() maneja un error.
+        
+        Returns:
+            False si el análisis no puede continuar
+        """
+        expansions = self.expansions
+        token_types = self.token_types
+        length = len(token_types)
+        index = self.current_token_index
+        current = self.current_type
+        stack = [self.grammar.start]
+        pop = stack.pop
+        extend = stack.extend
+        
+        while stack:
+            symbol = pop()
+            if symbol == current:
+                # Terminal esperado (END_OF_TOKENS nunca es un símbolo)
+                index += 1
+                current = token_types[index] if index < length else END_OF_TOKENS
+            elif symbol < TERMINAL_COUNT:
+                self.current_token_index = index
+                self.current_type = current
+                if not self.expect(symbol):
+                    return False
+                index = self.current_token_index
+                current = self.current_type
+            else:
+                # Con END_OF_TOKENS (-1) se lee la columna END, que es la última
+                extend(expansions[symbol][current])
+        
+        self.current_token_index = index
+        self.current_type = current
+        return True
+    
+    def search_categories(self, masks: List[int]) -> Optional[List[int]]:
+        """
+        Busca una asignación de categorías que la gramática acepte
+        
+        Es la búsqueda de FusedEngine.search_categories con las pilas del
+        análisis LL(1) en lugar de los estados del autómata: se avanzan a la
+        vez todas las pilas alcanzables con alguna categoría de cada token y
+        las pilas iguales se unen, así que no hay que probar las
+        combinaciones una por una.
+        
+        Args:
+            masks: Máscara de categorías de cada token (bit i: código de tipo i)
+            
+        Returns:
+            Código de tipo elegido para cada token, o None si ninguna
+            asignación se acepta
+        """
+        predictions = self.predictions
+        
+        def advance(stack: Tuple[int, ...], code: int) -> Optional[Tuple[int, ...]]:
+            """Pila después de consumir un token de tipo code (o el fin de oración), o None"""
+            stack = list(stack)
+            while stack:
+                symbol = stack.pop()
+                if symbol < TERMINAL_COUNT:
+                    return tuple(stack) if symbol == code else None
+                expansion = predictions[symbol][code]
+                if expansion is None:
+                    return None
+                stack.extend(expansion)
+            return () if code == END_OF_TOKENS else None
+        
+        stacks = ((self.grammar.start,),)
+        steps = []
+        for mask in masks:
+            codes = [code for code in range(TERMINAL_COUNT) if mask & (1 << code)]
+            reached: Dict[Tuple[int, ...], Tuple[Tuple[int, ...], int]] = {}
+            for stack in stacks:
+                for code in codes:
+                    next_stack = advance(stack, code)
+                    if next_stack is not None and next_stack not in reached:
+                        reached[next_stack] = (stack, code)
+            if not reached:
+                return None
+            steps.append(reached)
+            stacks = reached
+        
+        stack = next((stack for stack in stacks if advance(stack, END_OF_TOKENS) is not None), None)
+        if stack is None:
+            return None
+        codes = []
+        for reached in reversed(steps):
+            stack, code = reached[stack]
+            codes.append(code)
+        codes.reverse()
+        return codes
+
+def test_grammar():
+    """Función de prueba: compara el analizador por tabla con SyntaxAnalyzer"""
+    from lexical_analyzer import LexicalAnalyzer
+    
+    lexical_analyzer = LexicalAnalyzer()
+    recursive = SyntaxAnalyzer()
+    table_driven = TableDrivenAnalyzer()
+    
+    test_sentences = [
+        "the cat runs.",                    # Válida: NP VP .
+        "a big dog walks.",                 # Válida: NP(con adj) VP .
+        "the man reads a book.",            # Válida: NP VP NP .
+        "the cat runs in the house.",       # Válida: NP VP PP .
+        "the cat.",                         # Inválida: falta VP
+        "runs the cat.",                    # Inválida: orden incorrecto
+        "the cat runs. the dog"             # Inválida: tokens después del punto
+    ]
+    
+    for sentence in test_sentences:
+        tokens = lexical_analyzer.analyze_stream(sentence)
+        expected = recursive.check(tokens, collect_all=True)
+        result = table_driven.check(tokens, collect_all=True)
+        status = "OK" if result == expected else "DIFERENTE"
+        messages = "; ".join(diagnostic.message for diagnostic in result.diagnostics) or "Correcta"
+        print(f"[{status}] '{sentence}' -> {messages}")
+
+def main():
+    """Compila una gramática y muestra sus conjuntos FIRST/FOLLOW o sus conflictos"""
+    if len(sys.argv) > 2:
+        print("Uso: python grammar.py [gramatica.bnf]")
+        sys.exit(1)
+    if len(sys.argv) < 2:
+        test_grammar()
+        return
+    
+    filename = sys.argv[1]
+    try:
+        grammar = load_grammar(filename)
+    except (OSError, GrammarError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    
+    analysis = GrammarAnalysis(grammar.nonterminals, grammar.productions)
+    print(f"Gramática LL(1): {len(grammar.nonterminals)} no terminales, "
+          f"{len(grammar.productions)} producciones")
+    for production in range(len(grammar.productions)):
+        print(f"  {analysis.describe_production(production)}")
+    for index, name in enumerate(grammar.nonterminals):
+        first = ", ".join(sorted(map(analysis.describe, analysis.first[index])))
+        follow = ", ".join(sorted(map(analysis.describe, analysis.follow[index])))
+        print(f"FIRST({name}) = {{{first}}}{' + ε' if analysis.nullable[index] else ''}  "
+              f"FOLLOW({name}) = {{{follow}}}")
+    print(f"Tabla en caché: '{cache_filename(filename, grammar.digest)}'")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Recompilación Incremental para Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Guarda junto al reporte un índice con el resultado de cada oración, indexado
+por un hash de su contenido. En la siguiente ejecución solo se compilan las
+líneas nuevas o modificadas; las demás toman su resultado del índice, y el
+reporte y sus estadísticas se reconstruyen igual que en una compilación
+completa.
+
+El índice registra una huella del vocabulario y de la gramática; si cambian,
+se descarta completo.
+"""
+
+import json
+import os
+from hashlib import blake2b
+from typing import Dict, Optional, Tuple
+
+from fused_engine import build_transition_table
+
+# Versión del formato del índice; cambiarla invalida los índices anteriores
+INDEX_VERSION = 4
+
+# Sufijo del índice respecto del archivo de salida
+INDEX_SUFFIX = ".idx.json"
+
+def index_filename(output_filename: str) -> str:
+    """Devuelve el nombre del índice que acompaña a un archivo de salida"""
+    return output_filename + INDEX_SUFFIX
+
+def sentence_key(sentence: str) -> str:
+    """Hash del contenido de una oración ya recortada"""
+    return blake2b(sentence.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+
+def compiler_fingerprint(compiler) -> str:
+    """
+    Huella de todo lo que determina el resultado de una oración
+    
+    Args:
+        compiler: LittleEnglishCompiler cuyo vocabulario y gramática se usan
+        
+    Returns:
+        Hash hexadecimal del formato, el vocabulario y la gramática
+    """
+    lexical_analyzer = compiler.lexical_analyzer
+    if lexical_analyzer.lexicon is not None:
+        # Un léxico externo se identifica por el contenido de su archivo
+        vocabulary = lexical_analyzer.lexicon.fingerprint()
+    else:
+        vocabulary = sorted((word, token_type.value)
+                            for word, token_type in lexical_analyzer.vocabulary.items())
+    digest = blake2b(digest_size=16)
+    digest.update(json.dumps([INDEX_VERSION, vocabulary]).encode('utf-8'))
+    if compiler.grammar is not None:
+        # Una gramática externa se identifica por el hash de su archivo
+        digest.update(compiler.grammar.digest.encode('ascii'))
+    else:
+        digest.update(build_transition_table().tobytes())
+    return digest.hexdigest()
+
+class IncrementalIndex:
+    """
+    Índice hash de oración -> veredicto persistido en JSON
+    
+    Los veredictos son (éxito, mensaje), o (True, mensaje, forma) si se
+    compilaron con record_shapes (ver LittleEnglishCompiler.set_record_shapes);
+    la forma se guarda en hexadecimal.
+    """
+    
+    def __init__(self, fingerprint: str, entries: Dict[str, Tuple] = None):
+        self.fingerprint = fingerprint
+        # Resultados de la ejecución anterior y los usados en esta; al
+        # guardar solo se conservan los de esta ejecución
+        self.previous: Dict[str, Tuple] = entries or {}
+        self.current: Dict[str, Tuple] = {}
+        self.reused = 0
+        self.compiled = 0
+    
+    @classmethod
+    def load(cls, filename: str, fingerprint: str) -> "IncrementalIndex":
+        """
+        Carga un índice; si no existe, está dañado o su huella no coincide,
+        devuelve uno vacío
+        
+        Args:
+            filename: Nombre del archivo del índice
+            fingerprint: Huella del compilador actual
+        """
+        try:
+            with open(filename, 'r', encoding='utf-8') as index_file:
+                data = json.load(index_file)
+        except (OSError, ValueError):
+            return cls(fingerprint)
+        
+        try:
+            if data['version'] != INDEX_VERSION or data['fingerprint'] != fingerprint:
+                return cls(fingerprint)
+            
+            # Los resultados se guardan una sola vez; cada entrada apunta a uno
+            results = [(bool(success), message) + tuple(bytes.fromhex(shape) for shape in shapes)
+                       for success, message, *shapes in data['results']]
+            entries = {key: results[position] for key, position in data['entries'].items()}
+        except (KeyError, TypeError, ValueError, IndexError):
+            return cls(fingerprint)
+        return cls(fingerprint, entries)
+    
+    def get(self, key: str, shapes: bool = False) -> Optional[Tuple]:
+        """
+        Busca el resultado de una oración y lo marca como usado en esta ejecución
+        
+        Args:
+            key: Hash de la oración (ver sentence_key)
+            shapes: Si es True, un resultado aceptado de la ejecución anterior
+                guardado sin forma cuenta como no encontrado
+        """
+        result = self.current.get(key)
+        if result is None:
+            result = self.previous.get(key)
+            if result is None or (shapes and result[0] and len(result) < 3):
+                return None
+            self.current[key] = result
+        self.reused += 1
+        return result
+    
+    def put(self, key: str, result: Tuple):
+        """Guarda el resultado de una oración recién compilada"""
+        self.current[key] = result
+        self.compiled += 1
+    
+    def save(self, filename: str):
+        """Escribe el índice de esta ejecución (reemplaza el archivo de forma atómica)"""
+        positions: Dict[Tuple, int] = {}
+        entries = {}
+        for key, result in self.current.items():
+            position = positions.get(result)
+            if position is None:
+                position = positions[result] = len(positions)
+            entries[key] = position
+        
+        data = {
+            'version': INDEX_VERSION,
+            'fingerprint': self.fingerprint,
+            'results': [list(result[:2]) + [shape.hex() for shape in result[2:]]
+                        for result in positions],
+            'entries': entries
+        }
+        temporary_filename = filename + ".tmp"
+        with open(temporary_filename, 'w', encoding='utf-8') as index_file:
+            json.dump(data, index_file, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temporary_filename, filename)
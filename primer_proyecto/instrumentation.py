@@ -0,0 +1,262 @@
+"""
+Instrumentación del Compilador de Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Mide cuánto tiempo se va en cada fase de la compilación (análisis léxico,
+análisis sintáctico, motores alternativos y escritura del reporte), con un
+histograma de latencias por fase, y cuenta los tokens por tipo y los errores
+devueltos por cada fase (diagnósticos por código y oraciones rechazadas). La
+compilación no lanza excepciones por las oraciones con errores, así que los
+errores se cuentan desde los resultados; las funciones registradas con
+add_callback reciben además la excepción de una llamada que falló.
+
+Un Profiler se instala en un LittleEnglishCompiler reemplazando, solo en esa
+instancia, los métodos medidos por versiones envueltas. Sin Profiler no se
+envuelve nada, así que la instrumentación desactivada no cuesta nada.
+"""
+
+import json
+import time
+from collections import Counter
+from typing import Callable, Dict, List, Optional
+
+from lexical_analyzer import TOKEN_TYPES, TokenStream
+
+# Cantidad de cubetas del histograma de latencias. La cubeta 0 cuenta las
+# llamadas de menos de 1 µs y la cubeta i, las de [2^(i-1), 2^i) µs; la
+# última también acumula todo lo más lento
+HISTOGRAM_BUCKETS = 32
+
+# Función que recibe (fase, segundos, excepción o None) después de cada llamada
+PhaseCallback = Callable[[str, float, Optional[BaseException]], None]
+
+class PhaseMetrics:
+    """Tiempo acumulado e histograma de latencias de una fase"""
+    
+    __slots__ = ('calls', 'total_seconds', 'max_seconds', 'histogram')
+    
+    def __init__(self):
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.histogram = [0] * HISTOGRAM_BUCKETS
+    
+    def record(self, seconds: float):
+        """Registra una llamada que tardó seconds segundos"""
+        self.calls += 1
+        self.total_seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+        bucket = int(seconds * 1e6).bit_length()
+        self.histogram[min(bucket, HISTOGRAM_BUCKETS - 1)] += 1
+    
+    def merge(self, data: Dict):
+        """Suma las métricas exportadas por to_dict() de otro proceso"""
+        self.calls += data['calls']
+        self.total_seconds += data['total_seconds']
+        self.max_seconds = max(self.max_seconds, data['max_seconds'])
+        for bucket, count in enumerate(data['histogram']):
+            self.histogram[bucket] += count
+    
+    def to_dict(self) -> Dict:
+        """Exporta las métricas como diccionario serializable"""
+        return {
+            'calls': self.calls,
+            'total_seconds': self.total_seconds,
+            'mean_seconds': self.total_seconds / self.calls if self.calls else 0.0,
+            'max_seconds': self.max_seconds,
+            'histogram': list(self.histogram)
+        }
+
+class Profiler:
+    """Recolector de métricas por fase de un LittleEnglishCompiler"""
+    
+    def __init__(self):
+        self.phases: Dict[str, PhaseMetrics] = {}
+        self.token_counts: Counter = Counter()
+        # Errores devueltos sin lanzar excepciones, por "fase:código" (o
+        # "fase:rejected" para los motores que solo devuelven un veredicto)
+        self.errors: Counter = Counter()
+        self.callbacks: List[PhaseCallback] = []
+        # Fases en curso, para no medir dos veces una llamada anidada de la
+        # misma fase (por ejemplo, write_result dentro de generate_output_file)
+        self.active = set()
+    
+    def add_callback(self, callback: PhaseCallback):
+        """
+        Registra una función que se llama después de cada llamada medida
+        
+        Solo se llama en este proceso, así que un compilador con funciones
+        registradas no acepta trabajadores (ver LittleEnglishCompiler.compile_file).
+        """
+        self.callbacks.append(callback)
+    
+    def record(self, phase: str, seconds: float, error: Optional[BaseException] = None):
+        """Registra una llamada de una fase y avisa a las funciones registradas"""
+        metrics = self.phases.get(phase)
+        if metrics is None:
+            metrics = self.phases[phase] = PhaseMetrics()
+        metrics.record(seconds)
+        for callback in self.callbacks:
+            callback(phase, seconds, error)
+    
+    def count_tokens(self, tokens):
+        """Cuenta por tipo los tokens de una lista de Token o de un TokenStream"""
+        if isinstance(tokens, TokenStream):
+            for code, count in Counter(tokens.types).items():
+                self.token_counts[TOKEN_TYPES[code].value] += count
+        else:
+            self.token_counts.update(token.type.value for token in tokens)
+    
+    def wrap(self, phase: str, function: Callable, counter: Callable = None,
+             materialize: bool = False, errors: Callable = None) -> Callable:
+        """
+        Envuelve una función para medirla como parte de una fase
+        
+        Args:
+            phase: Nombre de la fase
+            function: Función (o método ligado) a medir
+            counter: Función opcional que recibe el resultado para contar tokens
+            materialize: Si es True, convierte el resultado en lista dentro de
+                la medición (para funciones generadoras)
+            errors: Función opcional que recibe la fase y el resultado para
+                contar los errores devueltos
+                
+        Returns:
+            Función con la misma firma que registra cada llamada
+        """
+        perf_counter = time.perf_counter
+        active = self.active
+        
+        def wrapped(*args, **kwargs):
+            if phase in active:
+                return function(*args, **kwargs)
+            
+            active.add(phase)
+            start = perf_counter()
+            try:
+                result = function(*args, **kwargs)
+                if materialize:
+                    result = list(result)
+            except Exception as e:
+                active.discard(phase)
+                self.record(phase, perf_counter() - start, e)
+                raise
+            active.discard(phase)
+            self.record(phase, perf_counter() - start)
+            
+            if counter is not None:
+                counter(result)
+            if errors is not None:
+                errors(phase, result)
+            return result
+        
+        wrapped.__wrapped__ = function
+        return wrapped
+    
+    def instrument(self, compiler):
+        """
+        Instala las mediciones en un LittleEnglishCompiler
+        
+        Fases medidas:
+            lexer: LexicalAnalyzer.scan, analyze, analyze_stream y scan_buffer
+            parser: SyntaxAnalyzer.check y analyze
+            fused: FusedEngine.compile y compile_bytes_words
+            batch: BatchEngine.compile_batch
+            report: generate_output_file, o write_result en modo streaming
+        """
+        lexical_analyzer = compiler.lexical_analyzer
+        lexical_analyzer.scan = self.wrap("lexer", lexical_analyzer.scan, self.count_scan_result,
+                                          errors=self.count_diagnostics)
+        lexical_analyzer.analyze = self.wrap("lexer", lexical_analyzer.analyze, self.count_tokens)
+        lexical_analyzer.analyze_stream = self.wrap("lexer", lexical_analyzer.analyze_stream,
+                                                    self.count_tokens)
+        lexical_analyzer.scan_buffer = self.wrap("lexer", lexical_analyzer.scan_buffer,
+                                                 self.count_scanned, materialize=True,
+                                                 errors=self.count_scanned_errors)
+        
+        syntax_analyzer = compiler.syntax_analyzer
+        syntax_analyzer.check = self.wrap("parser", syntax_analyzer.check,
+                                          errors=self.count_diagnostics)
+        syntax_analyzer.analyze = self.wrap("parser", syntax_analyzer.analyze)
+        
+        if compiler.fused_engine is not None:
+            self.instrument_fused_engine(compiler.fused_engine)
+        if compiler.batch_engine is not None:
+            self.instrument_batch_engine(compiler.batch_engine)
+        
+        compiler.generate_output_file = self.wrap("report", compiler.generate_output_file)
+        compiler.write_result = self.wrap("report", compiler.write_result)
+    
+    def instrument_fused_engine(self, engine):
+        """Instala las mediciones en un FusedEngine (también en los que el compilador crea al usarlos)"""
+        engine.compile = self.wrap("fused", engine.compile, errors=self.count_rejected)
+        engine.compile_bytes_words = self.wrap("fused", engine.compile_bytes_words,
+                                               errors=self.count_rejected)
+    
+    def instrument_batch_engine(self, engine):
+        """Instala las mediciones en un BatchEngine"""
+        engine.compile_batch = self.wrap("batch", engine.compile_batch,
+                                         errors=self.count_batch_rejected)
+    
+    def count_scan_result(self, result):
+        """Cuenta los tokens de un ScanResult sin errores (como analyze_stream)"""
+        if not result.diagnostics:
+            self.count_tokens(result.tokens)
+    
+    def count_scanned(self, scanned_lines):
+        """Cuenta los tokens de las líneas producidas por scan_buffer"""
+        for scanned in scanned_lines:
+            self.count_tokens(scanned.tokens)
+    
+    def count_diagnostics(self, phase: str, result):
+        """Cuenta por código los diagnósticos de un ScanResult o un ParseResult"""
+        for diagnostic in result.diagnostics:
+            self.errors[f"{phase}:{diagnostic.code.name}"] += 1
+    
+    def count_scanned_errors(self, phase: str, scanned_lines):
+        """Cuenta las líneas con error léxico producidas por scan_buffer"""
+        rejected = sum(1 for scanned in scanned_lines if scanned.error is not None)
+        if rejected:
+            self.errors[f"{phase}:rejected"] += rejected
+    
+    def count_rejected(self, phase: str, result):
+        """Cuenta una oración rechazada por un motor que devuelve (éxito, mensaje)"""
+        if not result[0]:
+            self.errors[f"{phase}:rejected"] += 1
+    
+    def count_batch_rejected(self, phase: str, verdicts):
+        """Cuenta las oraciones rechazadas de un lote de BatchEngine"""
+        rejected = int((~verdicts.accepted).sum())
+        if rejected:
+            self.errors[f"{phase}:rejected"] += rejected
+    
+    def to_dict(self) -> Dict:
+        """Exporta todas las métricas como diccionario serializable"""
+        return {
+            'phases': {phase: metrics.to_dict() for phase, metrics in sorted(self.phases.items())},
+            'token_counts': dict(sorted(self.token_counts.items())),
+            'errors': dict(sorted(self.errors.items())),
+            # Límite inferior en µs de cada cubeta del histograma
+            'histogram_lower_bounds_us': [0] + [2 ** bucket for bucket in range(HISTOGRAM_BUCKETS - 1)]
+        }
+    
+    def merge(self, data: Dict):
+        """Suma las métricas exportadas por to_dict() o take() de otro proceso"""
+        for phase, metrics in data['phases'].items():
+            self.phases.setdefault(phase, PhaseMetrics()).merge(metrics)
+        self.token_counts.update(data['token_counts'])
+        self.errors.update(data['errors'])
+    
+    def take(self) -> Dict:
+        """Exporta las métricas y las pone en cero"""
+        data = self.to_dict()
+        self.phases = {}
+        self.token_counts = Counter()
+        self.errors = Counter()
+        return data
+    
+    def write_json(self, filename: str):
+        """Escribe las métricas en un archivo JSON"""
+        with open(filename, 'w', encoding='utf-8') as output_file:
+            json.dump(self.to_dict(), output_file, indent=2, ensure_ascii=False)
@@ -3,9 +3,18 @@ Analizador Léxico para Little English
 Paradigmas de Programación - Proyecto Programado 1
 """
 
-import re
+from __future__ import annotations
+
+from array import array
+from collections import namedtuple
 from enum import Enum
-from typing import List, Tuple, NamedTuple
+from diagnostics import Diagnostic, ErrorCode, UNKNOWN_TOKEN
+
+# Tipos de las anotaciones; typing no se importa al arrancar (ver main.py)
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterator, List, Optional, Tuple
+    from lexicon import Lexicon
 
 class TokenType(Enum):
     """Tipos de tokens para Little English"""
@@ -17,146 +26,384 @@ class TokenType(Enum):
     DOT = "DOT"
     UNKNOWN = "UNKNOWN"
 
-class Token(NamedTuple):
+# Identificadores enteros de los tipos de token, en el orden de TokenType
+TOKEN_TYPES = tuple(TokenType)
+TOKEN_TYPE_IDS = {token_type: type_id for type_id, token_type in enumerate(TOKEN_TYPES)}
+DOT_CODE = TOKEN_TYPE_IDS[TokenType.DOT]
+
+class Token(namedtuple("Token", ("type", "value", "position"))):
     """Representación de un token"""
+    __slots__ = ()
     type: TokenType
     value: str
     position: int
 
+class TokenStream:
+    """
+    Secuencia compacta de tokens de una oración
+    
+    En lugar de un objeto Token por palabra, guarda el código entero de cada
+    tipo en un arreglo de bytes y los desplazamientos de inicio y fin de su
+    valor en el texto fuente, intercalados, en un segundo arreglo. Los objetos Token solo se construyen cuando se
+    indexa la secuencia (por ejemplo, para un mensaje de error). El texto
+    fuente es la oración con los espacios normalizados, así que el inicio de
+    cada token coincide con la posición que asigna tokenize().
+    """
+    
+    __slots__ = ('source', 'types', 'spans')
+    
+    def __init__(self, source: str, types: array, spans: array):
+        self.source = source
+        # types[i] es el código del token i; spans[2*i] y spans[2*i + 1] son
+        # el inicio y el fin de su valor en source
+        self.types = types
+        self.spans = spans
+    
+    def __len__(self) -> int:
+        return len(self.types)
+    
+    def __getitem__(self, index: int) -> Token:
+        if index < 0:
+            index += len(self.types)
+        start = self.spans[2 * index]
+        end = self.spans[2 * index + 1]
+        return Token(TOKEN_TYPES[self.types[index]], self.source[start:end], start)
+    
+    def __iter__(self) -> Iterator[Token]:
+        for index in range(len(self.types)):
+            yield self[index]
+    
+    def shape(self) -> bytes:
+        """Devuelve la secuencia de códigos de tipo como bytes"""
+        return self.types.tobytes()
+    
+    def to_tokens(self) -> List[Token]:
+        """Convierte la secuencia en una lista de objetos Token"""
+        return list(self)
+
+class ScannedLine(namedtuple("ScannedLine", ("line_number", "tokens", "error"))):
+    """Resultado del escáner para una línea de un bloque de entrada"""
+    __slots__ = ()
+    line_number: int
+    tokens: List[Token]
+    error: Optional[str]    # Mensaje del error léxico tal como va en el reporte, o None
+
+class ScanResult(namedtuple("ScanResult", ("tokens", "diagnostics"))):
+    """Resultado de LexicalAnalyzer.scan"""
+    __slots__ = ()
+    tokens: Optional[TokenStream]        # Tokens reconocidos (None si se detuvo en un error)
+    diagnostics: Tuple[Diagnostic, ...]  # Errores léxicos; vacía si no hubo
+
+# Diagnósticos de una oración sin palabras
+EMPTY_SENTENCE_ERRORS = (Diagnostic(ErrorCode.EMPTY_SENTENCE),)
+
+# Constructor directo de tuplas con nombre, más rápido en los ciclos internos
+new_tuple = tuple.__new__
+
+class ReadOnlyDict(dict):
+    """
+    Diccionario de solo lectura para las tablas compartidas del módulo
+    
+    Es un dict, así que get() y las búsquedas mantienen la velocidad de un
+    dict común (un MappingProxyType agrega una llamada por búsqueda en los
+    ciclos internos); solo se bloquean los métodos que lo modifican.
+    """
+    
+    __slots__ = ()
+    
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("La tabla es de solo lectura")
+    
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+    
+    def __reduce__(self):
+        # pickle y copy reconstruyen la tabla sin pasar por __setitem__
+        return type(self), (dict(self),)
+
+# Vocabulario de Little English: una sola tabla inmutable del módulo,
+# compartida por todos los analizadores que no usan un léxico externo
+VOCABULARY = ReadOnlyDict({
+    # Artículos
+    'a': TokenType.ARTICLE,
+    'the': TokenType.ARTICLE,
+    
+    # Sustantivos
+    'cat': TokenType.NOUN,
+    'dog': TokenType.NOUN,
+    'man': TokenType.NOUN,
+    'woman': TokenType.NOUN,
+    'boy': TokenType.NOUN,
+    'girl': TokenType.NOUN,
+    'book': TokenType.NOUN,
+    'house': TokenType.NOUN,
+    'car': TokenType.NOUN,
+    'tree': TokenType.NOUN,
+    
+    # Verbos
+    'runs': TokenType.VERB,
+    'walks': TokenType.VERB,
+    'reads': TokenType.VERB,
+    'sees': TokenType.VERB,
+    'likes': TokenType.VERB,
+    'has': TokenType.VERB,
+    'is': TokenType.VERB,
+    'goes': TokenType.VERB,
+    'comes': TokenType.VERB,
+    'sleeps': TokenType.VERB,
+    
+    # Adjetivos
+    'big': TokenType.ADJECTIVE,
+    'small': TokenType.ADJECTIVE,
+    'red': TokenType.ADJECTIVE,
+    'blue': TokenType.ADJECTIVE,
+    'happy': TokenType.ADJECTIVE,
+    'sad': TokenType.ADJECTIVE,
+    'old': TokenType.ADJECTIVE,
+    'new': TokenType.ADJECTIVE,
+    'good': TokenType.ADJECTIVE,
+    'bad': TokenType.ADJECTIVE,
+    
+    # Preposiciones
+    'in': TokenType.PREPOSITION,
+    'on': TokenType.PREPOSITION,
+    'at': TokenType.PREPOSITION,
+    'to': TokenType.PREPOSITION,
+    'with': TokenType.PREPOSITION,
+    'by': TokenType.PREPOSITION,
+    'from': TokenType.PREPOSITION,
+    'under': TokenType.PREPOSITION,
+    'over': TokenType.PREPOSITION,
+    'near': TokenType.PREPOSITION
+})
+
+# Vocabulario como palabra -> código entero del tipo de token
+TYPE_CODES = ReadOnlyDict({word: TOKEN_TYPE_IDS[token_type] for word, token_type in VOCABULARY.items()})
+
 class LexicalAnalyzer:
     """Analizador Léxico para Little English"""
     
-    def __init__(self):
-        # Definición del vocabulario de Little English
-        self.vocabulary = {
-            # Artículos
-            'a': TokenType.ARTICLE,
-            'the': TokenType.ARTICLE,
+    def __init__(self, lexicon: "Lexicon" = None):
+        """
+        Args:
+            lexicon: Léxico externo (ver lexicon.py); por defecto se usa el
+                vocabulario de Little English
+        """
+        self.lexicon = lexicon
+        if lexicon is None:
+            self.vocabulary = VOCABULARY
+            self.type_codes = TYPE_CODES
+        else:
+            # Vistas que buscan directamente en el archivo mapeado
+            self.vocabulary = lexicon.token_types
+            self.type_codes = lexicon.type_codes
+    
+    def tokenize(self, sentence: str) -> List[Token]:
+        """
+        Realiza el análisis léxico de una oración
+        
+        Args:
+            sentence: Oración a analizar
             
-            # Sustantivos
-            'cat': TokenType.NOUN,
-            'dog': TokenType.NOUN,
-            'man': TokenType.NOUN,
-            'woman': TokenType.NOUN,
-            'boy': TokenType.NOUN,
-            'girl': TokenType.NOUN,
-            'book': TokenType.NOUN,
-            'house': TokenType.NOUN,
-            'car': TokenType.NOUN,
-            'tree': TokenType.NOUN,
+        Returns:
+            Lista de tokens identificados
             
-            # Verbos
-            'runs': TokenType.VERB,
-            'walks': TokenType.VERB,
-            'reads': TokenType.VERB,
-            'sees': TokenType.VERB,
-            'likes': TokenType.VERB,
-            'has': TokenType.VERB,
-            'is': TokenType.VERB,
-            'goes': TokenType.VERB,
-            'comes': TokenType.VERB,
-            'sleeps': TokenType.VERB,
+        Raises:
+            ValueError: Si se encuentra un token no reconocido
+        """
+        return self.tokenize_stream(sentence).to_tokens()
+    
+    def analyze(self, sentence: str) -> List[Token]:
+        """
+        Método principal para el análisis léxico
+        
+        Args:
+            sentence: Oración a analizar
             
-            # Adjetivos
-            'big': TokenType.ADJECTIVE,
-            'small': TokenType.ADJECTIVE,
-            'red': TokenType.ADJECTIVE,
-            'blue': TokenType.ADJECTIVE,
-            'happy': TokenType.ADJECTIVE,
-            'sad': TokenType.ADJECTIVE,
-            'old': TokenType.ADJECTIVE,
-            'new': TokenType.ADJECTIVE,
-            'good': TokenType.ADJECTIVE,
-            'bad': TokenType.ADJECTIVE,
+        Returns:
+            Lista de tokens
             
-            # Preposiciones
-            'in': TokenType.PREPOSITION,
-            'on': TokenType.PREPOSITION,
-            'at': TokenType.PREPOSITION,
-            'to': TokenType.PREPOSITION,
-            'with': TokenType.PREPOSITION,
-            'by': TokenType.PREPOSITION,
-            'from': TokenType.PREPOSITION,
-            'under': TokenType.PREPOSITION,
-            'over': TokenType.PREPOSITION,
-            'near': TokenType.PREPOSITION
-        }
+        Raises:
+            ValueError: Si hay errores léxicos
+        """
+        return self.analyze_stream(sentence).to_tokens()
     
-    def tokenize(self, sentence: str) -> List[Token]:
+    def tokenize_stream(self, sentence: str) -> TokenStream:
         """
-        Realiza el análisis léxico de una oración
+        Realiza el análisis léxico de una oración y devuelve un TokenStream
+        
+        Produce los mismos tokens y errores que tokenize(), pero sin crear un
+        objeto Token por palabra.
         
         Args:
             sentence: Oración a analizar
             
         Returns:
-            Lista de tokens identificados
+            Secuencia compacta de tokens
             
         Raises:
             ValueError: Si se encuentra un token no reconocido
         """
-        # Normalizar la oración: convertir a minúsculas y limpiar espacios
-        sentence = sentence.strip()
-        if not sentence:
-            raise ValueError("Oración vacía")
+        result = self.scan(sentence)
+        if result.diagnostics:
+            raise ValueError(result.diagnostics[0].message)
+        return result.tokens
+    
+    def scan(self, sentence: str, collect_all: bool = False) -> ScanResult:
+        """
+        Realiza el análisis léxico de una oración sin lanzar excepciones
         
-        tokens = []
-        position = 0
+        Los tokens y las posiciones son los de tokenize_stream(); los errores
+        se devuelven como diagnósticos en lugar de lanzarse.
         
-        # Dividir la oración en palabras y procesar cada una
+        Args:
+            sentence: Oración a analizar
+            collect_all: Si es True, sigue después de una palabra desconocida
+                y reporta todas; si es False, se detiene en la primera
+                
+        Returns:
+            ScanResult con los tokens reconocidos y los errores encontrados;
+            sin collect_all, los tokens son None si hubo un error
+        """
         words = sentence.split()
+        if not words:
+            return ScanResult(TokenStream("", array('B'), array('I')), EMPTY_SENTENCE_ERRORS)
         
-        for i, word in enumerate(words):
-            # Verificar si la palabra termina con punto
-            if word.endswith('.'):
-                # Separar la palabra del punto
-                word_without_dot = word[:-1]
-                
-                # Procesar la palabra sin el punto
-                if word_without_dot:
-                    word_lower = word_without_dot.lower()
-                    if word_lower in self.vocabulary:
-                        token_type = self.vocabulary[word_lower]
-                        tokens.append(Token(token_type, word_without_dot, position))
+        source = " ".join(words)
+        lookup = self.type_codes.get
+        types = array('B')
+        spans = array('I')
+        diagnostics = []
+        position = 0
+        
+        for word in words:
+            end = position + len(word)
+            if word[-1] == '.':
+                value = word[:-1]
+                if value:
+                    type_code = lookup(value.lower())
+                    if type_code is None:
+                        diagnostic = new_tuple(Diagnostic, (UNKNOWN_TOKEN, value, position, -1, None, None))
+                        if not collect_all:
+                            return new_tuple(ScanResult, (None, (diagnostic,)))
+                        diagnostics.append(diagnostic)
                     else:
-                        raise ValueError(f"Token no reconocido: '{word_without_dot}' en posición {position}")
-                
-                # Agregar el token del punto
-                tokens.append(Token(TokenType.DOT, '.', position + len(word_without_dot)))
-                position += len(word)
+                        types.append(type_code)
+                        spans.extend((position, end - 1))
+                types.append(DOT_CODE)
+                spans.extend((end - 1, end))
             else:
-                # Procesar palabra normal
-                word_lower = word.lower()
-                if word_lower in self.vocabulary:
-                    token_type = self.vocabulary[word_lower]
-                    tokens.append(Token(token_type, word, position))
+                type_code = lookup(word.lower())
+                if type_code is None:
+                    diagnostic = new_tuple(Diagnostic, (UNKNOWN_TOKEN, word, position, -1, None, None))
+                    if not collect_all:
+                        return new_tuple(ScanResult, (None, (diagnostic,)))
+                    diagnostics.append(diagnostic)
                 else:
-                    raise ValueError(f"Token no reconocido: '{word}' en posición {position}")
-                position += len(word)
-            
-            # Agregar espacio entre palabras (excepto para la última)
-            if i < len(words) - 1:
-                position += 1
+                    types.append(type_code)
+                    spans.extend((position, end))
+            position = end + 1
         
-        return tokens
+        return new_tuple(ScanResult, (TokenStream(source, types, spans),
+                                      tuple(diagnostics) if diagnostics else ()))
     
-    def analyze(self, sentence: str) -> List[Token]:
+    def analyze_stream(self, sentence: str) -> TokenStream:
         """
-        Método principal para el análisis léxico
+        Igual que analyze(), pero devuelve un TokenStream
+        
+        Raises:
+            ValueError: Si hay errores léxicos
+        """
+        result = self.scan(sentence)
+        if result.diagnostics:
+            raise ValueError(f"Error léxico: {result.diagnostics[0].message}")
+        return result.tokens
+    
+    def scan_buffer(self, text: str, first_line: int = 1) -> Iterator[ScannedLine]:
+        """
+        Tokeniza en una sola pasada un bloque con muchas líneas
+        
+        El bloque completo se convierte a minúsculas una sola vez y se divide
+        con las primitivas de str (implementadas en C), en lugar de hacer
+        lower() por palabra; las posiciones se calculan a partir de las
+        longitudes de las palabras. Las posiciones y los mensajes de error son
+        los mismos que producen tokenize() y analyze().
         
         Args:
-            sentence: Oración a analizar
+            text: Bloque de texto con líneas separadas por '\n'
+            first_line: Número de la primera línea del bloque
             
         Returns:
-            Lista de tokens
-            
-        Raises:
-            ValueError: Si hay errores léxicos
+            Iterador con un ScannedLine por línea; si la línea tiene un error
+            léxico, error contiene el mensaje tal como lo lanzaría analyze()
         """
-        try:
-            return self.tokenize(sentence)
-        except ValueError as e:
-            raise ValueError(f"Error léxico: {str(e)}")
+        lowered = text.lower()
+        # lower() puede cambiar la longitud de algunos caracteres Unicode; en
+        # ese caso las palabras originales y en minúsculas ya no se alinean
+        if len(lowered) != len(text):
+            yield from self._scan_lines(text.split('\n'), first_line)
+            return
+        
+        lowered_lines = lowered.split('\n')
+        original_lines = text.split('\n')
+        # Un salto de línea final no abre una línea nueva
+        if text.endswith('\n') or not text:
+            lowered_lines.pop()
+            original_lines.pop()
+        
+        lookup = self.vocabulary.get
+        new_token = tuple.__new__
+        dot_type = TokenType.DOT
+        
+        for line_number, (lowered_line, original_line) in enumerate(
+                zip(lowered_lines, original_lines), first_line):
+            tokens = []
+            position = 0
+            error = None
+            
+            for word, original_word in zip(lowered_line.split(), original_line.split()):
+                if word[-1] == '.':
+                    word = word[:-1]
+                    if word:
+                        token_type = lookup(word)
+                        if token_type is None:
+                            error = self._unknown_token_error(original_word[:-1], position)
+                            break
+                        tokens.append(new_token(Token, (token_type, original_word[:-1], position)))
+                    tokens.append(new_token(Token, (dot_type, '.', position + len(word))))
+                else:
+                    token_type = lookup(word)
+                    if token_type is None:
+                        error = self._unknown_token_error(original_word, position)
+                        break
+                    tokens.append(new_token(Token, (token_type, original_word, position)))
+                position += len(original_word) + 1
+            
+            yield self._scanned_line(line_number, tokens, error)
+    
+    def _scan_lines(self, lines: List[str], first_line: int) -> Iterator[ScannedLine]:
+        """Escanea línea por línea con analyze(); respaldo de scan_buffer"""
+        if lines and lines[-1] == '':
+            lines.pop()
+        
+        for line_number, line in enumerate(lines, first_line):
+            result = self.scan(line)
+            if result.diagnostics:
+                yield ScannedLine(line_number, [], result.diagnostics[0].report_message())
+            else:
+                yield ScannedLine(line_number, result.tokens.to_tokens(), None)
+    
+    @staticmethod
+    def _unknown_token_error(word: str, position: int) -> str:
+        """Mensaje del reporte para un token no reconocido (ver Diagnostic.report_message)"""
+        return f"Error léxico: Token no reconocido: '{word}' en posición {position}"
+    
+    @staticmethod
+    def _scanned_line(line_number: int, tokens: List[Token], error: Optional[str]) -> ScannedLine:
+        """Empaqueta una línea escaneada, marcando las líneas vacías como error"""
+        if error is None and not tokens:
+            error = "Error léxico: Oración vacía"
+        return ScannedLine(line_number, tokens, error)
 
 def test_lexical_analyzer():
     """Función de prueba para el analizador léxico"""
@@ -0,0 +1,477 @@
+"""
+Léxico Externo para Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Permite usar un vocabulario externo en lugar del vocabulario fijo del
+analizador léxico. El léxico se escribe como texto, una palabra por línea
+seguida de sus categorías gramaticales:
+
+    # comentario
+    the   ARTICLE
+    run   VERB NOUN
+
+La primera categoría es la principal: es el tipo de token que recibe la
+palabra. Todas quedan registradas en una máscara de bits por palabra; si una
+oración se rechaza con las categorías principales, el compilador prueba las
+otras categorías de sus palabras con las máscaras (ver
+Lexicon.category_masks), así que con "book NOUN VERB" se aceptan "the boy
+reads a book." y "the boy book.".
+
+El texto se compila a un formato binario (tabla de cadenas ordenada con un
+índice hash) que se abre con mmap sin construir un diccionario de Python; las
+búsquedas se hacen directamente sobre el archivo mapeado:
+
+    encabezado   'LEXC', versión, cantidad de tipos, cantidad de palabras y
+                 cantidad de ranuras del índice
+    offsets      cantidad + 1 enteros de 32 bits con el inicio de cada
+                 palabra en la zona de cadenas
+    ranuras      tabla hash de direccionamiento abierto (sondeo lineal sobre
+                 crc32 de la palabra): posición de la palabra, o EMPTY_SLOT
+    principales  un byte por palabra: código del tipo principal
+    máscaras     un byte por palabra: bit i encendido si la palabra puede
+                 ser del tipo de código i
+    cadenas      palabras en UTF-8, concatenadas en orden de bytes
+
+Los enteros se guardan en little-endian.
+
+Uso: python lexicon.py lexico.txt [lexico.lexc]
+     python lexicon.py          (prueba los motores con un léxico ambiguo)
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Mapping
+from hashlib import blake2b
+from typing import Callable, Dict, Iterable, Iterator, List, Union
+from zlib import crc32
+
+from cache import LRUCache
+from lexical_analyzer import Token, TokenStream, TokenType, TOKEN_TYPES, TOKEN_TYPE_IDS
+
+# Encabezado: firma, versión, cantidad de tipos de token, cantidad de palabras
+# y cantidad de ranuras del índice hash
+MAGIC = b"LEXC"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHHII")
+
+# Ranura vacía del índice hash
+EMPTY_SLOT = 0xFFFFFFFF
+
+# Extensión del léxico compilado que acompaña a un léxico de texto
+COMPILED_SUFFIX = ".lexc"
+
+# Palabras encontradas que recuerda cada LexiconView (LRU acotada)
+LOOKUP_CACHE_SIZE = 65536
+
+# Categorías que puede tener una palabra del léxico
+WORD_TYPES = tuple(token_type for token_type in TOKEN_TYPES
+                   if token_type not in (TokenType.DOT, TokenType.UNKNOWN))
+
+# Nombre de categoría -> código de tipo de token
+CATEGORY_CODES = {token_type.value: TOKEN_TYPE_IDS[token_type] for token_type in WORD_TYPES}
+
+def parse_lexicon(lines: Iterable[str]) -> Dict[str, List[int]]:
+    """
+    Lee un léxico de texto
+    
+    Las palabras se guardan en minúsculas. Si una palabra aparece varias
+    veces, sus categorías se acumulan y la principal es la primera que se leyó.
+    
+    Args:
+        lines: Líneas del léxico
+        
+    Returns:
+        Diccionario palabra -> códigos de tipo de sus categorías, la principal
+        primero
+        
+    Raises:
+        ValueError: Si una línea no tiene categorías o usa una desconocida
+    """
+    entries: Dict[str, List[int]] = {}
+    for line_number, line in enumerate(lines, 1):
+        if '#' in line:
+            line = line.split('#', 1)[0]
+        fields = line.split()
+        if not fields:
+            continue
+        if len(fields) < 2:
+            raise ValueError(f"Línea {line_number}: falta la categoría de '{fields[0]}'")
+        
+        word = fields[0].lower()
+        codes = entries.get(word)
+        if codes is None:
+            codes = entries[word] = []
+        for name in fields[1:]:
+            code = CATEGORY_CODES.get(name.upper())
+            if code is None:
+                raise ValueError(f"Línea {line_number}: categoría desconocida '{name}'")
+            if code not in codes:
+                codes.append(code)
+    return entries
+
+def recategorize(tokens: Union[List[Token], TokenStream], codes: List[int]) -> List[Token]:
+    """Copia de los tokens con el tipo de código codes[i] en el token i"""
+    return [Token(TOKEN_TYPES[code], tokens[index].value, tokens[index].position)
+            for index, code in enumerate(codes)]
+
+def slot_count_for(count: int) -> int:
+    """Cantidad de ranuras del índice: potencia de 2 con carga de a lo sumo 2/3"""
+    slot_count = 1
+    while slot_count * 2 < count * 3:
+        slot_count *= 2
+    return slot_count
+
+def compile_lexicon(source_filename: str, target_filename: str) -> int:
+    """
+    Compila un léxico de texto al formato binario
+    
+    El archivo destino se reemplaza de forma atómica.
+    
+    Args:
+        source_filename: Léxico de texto
+        target_filename: Archivo binario a escribir
+        
+    Returns:
+        Cantidad de palabras compiladas
+    """
+    with open(source_filename, 'r', encoding='utf-8') as source_file:
+        entries = parse_lexicon(source_file)
+    
+    words = sorted(word.encode('utf-8', 'surrogatepass') for word in entries)
+    count = len(words)
+    offsets = array('I', [0]) * (count + 1)
+    primaries = bytearray(count)
+    masks = bytearray(count)
+    slot_count = slot_count_for(count)
+    slot_mask = slot_count - 1
+    slots = array('I', [EMPTY_SLOT]) * slot_count
+    end = 0
+    
+    for index, word in enumerate(words):
+        end += len(word)
+        offsets[index + 1] = end
+        codes = entries[word.decode('utf-8', 'surrogatepass')]
+        primaries[index] = codes[0]
+        mask = 0
+        for code in codes:
+            mask |= 1 << code
+        masks[index] = mask
+        
+        slot = crc32(word) & slot_mask
+        while slots[slot] != EMPTY_SLOT:
+            slot = (slot + 1) & slot_mask
+        slots[slot] = index
+    
+    if sys.byteorder != 'little':
+        offsets.byteswap()
+        slots.byteswap()
+    
+    temporary_filename = target_filename + ".tmp"
+    with open(temporary_filename, 'wb') as target_file:
+        target_file.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(TOKEN_TYPES), count, slot_count))
+        target_file.write(offsets.tobytes())
+        target_file.write(slots.tobytes())
+        target_file.write(primaries)
+        target_file.write(masks)
+        target_file.write(b"".join(words))
+    os.replace(temporary_filename, target_filename)
+    return count
+
+class LexiconView(Mapping):
+    """
+    Vista de un Lexicon como diccionario palabra -> valor
+    
+    Acepta claves str o bytes (UTF-8). Las últimas LOOKUP_CACHE_SIZE palabras
+    encontradas se recuerdan en una caché LRU, así que las palabras
+    frecuentes no se vuelven a buscar en el archivo y la memoria no crece con
+    el tamaño del léxico ni de la entrada; las desconocidas no se recuerdan.
+    """
+    
+    def __init__(self, lexicon: "Lexicon", convert: Callable[[int], object],
+                 cache_size: int = LOOKUP_CACHE_SIZE):
+        self.lexicon = lexicon
+        self.convert = convert
+        self.found = LRUCache(cache_size)
+    
+    def get(self, word: Union[str, bytes], default=None):
+        found = self.found
+        value = found.get(word)
+        if value is None:
+            index = self.lexicon.find(word)
+            if index < 0:
+                return default
+            value = self.convert(self.lexicon.primaries[index])
+            found.put(word, value)
+        return value
+    
+    def __getitem__(self, word: Union[str, bytes]):
+        value = self.get(word)
+        if value is None:
+            raise KeyError(word)
+        return value
+    
+    def __contains__(self, word) -> bool:
+        return self.get(word) is not None
+    
+    def __iter__(self) -> Iterator[str]:
+        return self.lexicon.words()
+    
+    def __len__(self) -> int:
+        return len(self.lexicon)
+
+class Lexicon:
+    """Léxico compilado, abierto con mmap"""
+    
+    def __init__(self, filename: str):
+        """
+        Abre un léxico compilado
+        
+        Raises:
+            ValueError: Si el archivo no es un léxico compilado compatible
+        """
+        self.filename = filename
+        with open(filename, 'rb') as lexicon_file:
+            self.buffer = mmap.mmap(lexicon_file.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        if len(self.buffer) < HEADER.size:
+            self.close()
+            raise ValueError(f"'{filename}' no es un léxico compilado")
+        magic, version, type_count, count, slot_count = HEADER.unpack_from(self.buffer)
+        if magic != MAGIC or version != FORMAT_VERSION or type_count != len(TOKEN_TYPES):
+            self.close()
+            raise ValueError(f"'{filename}' no es un léxico compilado compatible")
+        
+        self.count = count
+        self.slot_mask = slot_count - 1
+        view = memoryview(self.buffer)
+        offsets_end = HEADER.size + 4 * (count + 1)
+        slots_end = offsets_end + 4 * slot_count
+        self.offsets = self.integers(view[HEADER.size:offsets_end])
+        self.slots = self.integers(view[offsets_end:slots_end])
+        self.primaries = view[slots_end:slots_end + count]
+        self.masks = view[slots_end + count:slots_end + 2 * count]
+        self.strings = slots_end + 2 * count
+        
+        # Vistas para el analizador léxico: palabra -> código de tipo y
+        # palabra -> TokenType
+        self.type_codes = LexiconView(self, int)
+        self.token_types = LexiconView(self, TOKEN_TYPES.__getitem__)
+    
+    @staticmethod
+    def integers(view: memoryview):
+        """Enteros de 32 bits little-endian de una zona del archivo, sin copiarlos si se puede"""
+        if sys.byteorder == 'little':
+            return view.cast('I')
+        values = array('I', view)
+        values.byteswap()
+        return values
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def word(self, index: int) -> bytes:
+        """Devuelve la palabra de la posición index, en UTF-8"""
+        start = self.strings + self.offsets[index]
+        return self.buffer[start:self.strings + self.offsets[index + 1]]
+    
+    def find(self, word: Union[str, bytes]) -> int:
+        """
+        Busca una palabra (ya en minúsculas) en el índice hash
+        
+        Returns:
+            Posición de la palabra en el orden del léxico, o -1 si no está
+        """
+        if isinstance(word, str):
+            word = word.encode('utf-8', 'surrogatepass')
+        buffer = self.buffer
+        offsets = self.offsets
+        slots = self.slots
+        strings = self.strings
+        slot_mask = self.slot_mask
+        slot = crc32(word) & slot_mask
+        while True:
+            index = slots[slot]
+            if index == EMPTY_SLOT:
+                return -1
+            if buffer[strings + offsets[index]:strings + offsets[index + 1]] == word:
+                return index
+            slot = (slot + 1) & slot_mask
+    
+    def type_mask(self, word: Union[str, bytes]) -> int:
+        """
+        Máscara de categorías de una palabra (ya en minúsculas)
+        
+        Returns:
+            Entero con el bit i encendido si la palabra puede ser del tipo de
+            código i, o 0 si la palabra no está
+        """
+        index = self.find(word)
+        return self.masks[index] if index >= 0 else 0
+    
+    def parts_of_speech(self, word: Union[str, bytes]) -> List[TokenType]:
+        """Devuelve todas las categorías de una palabra (vacía si no está)"""
+        mask = self.type_mask(word)
+        return [token_type for token_type in WORD_TYPES if mask & (1 << TOKEN_TYPE_IDS[token_type])]
+    
+    def category_masks(self, tokens: Union[List[Token], TokenStream]) -> List[int]:
+        """
+        Máscaras de categorías de los tokens de una oración
+        
+        Las palabras tienen la máscara del léxico (ver type_mask) y el punto
+        solo puede ser DOT. Los motores buscan con ellas una asignación de
+        categorías que la gramática acepte (ver FusedEngine.search_categories).
+        
+        Args:
+            tokens: Tokens de la oración, todos en el léxico
+            
+        Returns:
+            Una máscara por token
+        """
+        dot_mask = 1 << TOKEN_TYPE_IDS[TokenType.DOT]
+        return [dot_mask if token.type is TokenType.DOT else self.type_mask(token.value.lower())
+                for token in (tokens[index] for index in range(len(tokens)))]
+    
+    def words(self) -> Iterator[str]:
+        """Recorre las palabras del léxico en orden"""
+        for index in range(self.count):
+            yield self.word(index).decode('utf-8', 'surrogatepass')
+    
+    def fingerprint(self) -> str:
+        """Hash del contenido del léxico"""
+        return blake2b(self.buffer, digest_size=16).hexdigest()
+    
+    def close(self):
+        """Libera el archivo mapeado"""
+        for name in ('offsets', 'slots', 'primaries', 'masks'):
+            view = getattr(self, name, None)
+            if isinstance(view, memoryview):
+                view.release()
+        self.buffer.close()
+
+def is_compiled_lexicon(filename: str) -> bool:
+    """Indica si un archivo empieza con la firma del formato binario"""
+    with open(filename, 'rb') as lexicon_file:
+        return lexicon_file.read(len(MAGIC)) == MAGIC
+
+def open_lexicon(filename: str) -> Lexicon:
+    """
+    Abre un léxico compilado o de texto
+    
+    Un léxico de texto se compila a archivo + '.lexc' la primera vez, y de
+    nuevo cuando el texto es más reciente que el compilado o el compilado
+    tiene un formato anterior.
+    
+    Args:
+        filename: Léxico compilado o de texto
+        
+    Returns:
+        Lexicon abierto con mmap
+    """
+    if is_compiled_lexicon(filename):
+        return Lexicon(filename)
+    
+    compiled_filename = filename + COMPILED_SUFFIX
+    try:
+        stale = os.path.getmtime(compiled_filename) < os.path.getmtime(filename)
+    except OSError:
+        stale = True
+    if not stale:
+        try:
+            return Lexicon(compiled_filename)
+        except ValueError:
+            pass
+    compile_lexicon(filename, compiled_filename)
+    return Lexicon(compiled_filename)
+
+def test_lexicon():
+    """Función de prueba: compara los motores con un léxico de palabras con varias categorías"""
+    import tempfile
+    from main import LittleEnglishCompiler
+    
+    # Casi todas las palabras tienen tres categorías; "x" es artículo solo
+    # como categoría secundaria
+    test_lexicon_text = """
+        the   ARTICLE ADJECTIVE NOUN
+        x     NOUN ARTICLE
+        cat   NOUN VERB ADJECTIVE
+        dog   NOUN VERB ADJECTIVE
+        boy   NOUN VERB ADJECTIVE
+        book  NOUN VERB ADJECTIVE
+        big   ADJECTIVE NOUN VERB
+        runs  VERB NOUN ADJECTIVE
+        on    PREPOSITION NOUN VERB
+    """
+    test_sentences = [
+        "the cat runs.",                    # Válida con las categorías principales
+        "the boy book.",                    # Válida con book VERB
+        "x cat runs on the big dog.",       # Válida con x ARTICLE (1458 combinaciones)
+        "runs on the.",                     # Inválida con cualquier categoría
+        "the cat runs quickly."             # Inválida: palabra desconocida
+    ]
+    configurations = [
+        ("classic", {}, {}),
+        ("fused", {'engine': "fused"}, {}),
+        ("batch", {'engine': "batch"}, {}),
+        ("mmap", {}, {'mmap_input': True}),
+        ("grammar", {'grammar': os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                             "gramatica.bnf")}, {})
+    ]
+    
+    with tempfile.TemporaryDirectory() as directory:
+        lexicon_filename = os.path.join(directory, "lexico.txt")
+        input_filename = os.path.join(directory, "oraciones.txt")
+        output_filename = os.path.join(directory, "resultados.txt")
+        with open(lexicon_filename, 'w', encoding='utf-8') as lexicon_file:
+            lexicon_file.write(test_lexicon_text)
+        with open(input_filename, 'w', encoding='utf-8') as input_file:
+            input_file.write("\n".join(test_sentences) + "\n")
+        
+        expected = None
+        for name, compiler_options, compile_options in configurations:
+            try:
+                compiler = LittleEnglishCompiler(lexicon=lexicon_filename, **compiler_options)
+            except ImportError as e:
+                print(f"[OMITIDO] {name}: {e}")
+                continue
+            compiler.compile_file(input_filename, output_filename, **compile_options)
+            results = [(result['success'], result['message']) for result in compiler.results]
+            if expected is None:
+                expected = results
+            status = "OK" if results == expected else "DIFERENTE"
+            print(f"[{status}] {name}: " + ", ".join("sí" if success else "no"
+                                                     for success, _ in results))
+        
+        compiler = LittleEnglishCompiler(lexicon=lexicon_filename)
+        compiler.compile_file(input_filename, output_filename,
+                              trees=os.path.join(directory, "arboles.jsonl"))
+        status = "OK" if compiler.tree_count == compiler.stats['successful'] else "DIFERENTE"
+        print(f"[{status}] árboles: {compiler.tree_count} de {compiler.stats['successful']} "
+              f"oraciones correctas")
+
+def main():
+    """Compila un léxico de texto desde la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Compilador de léxicos de Little English")
+    parser.add_argument("source_filename", nargs="?", default=None, metavar="lexico.txt",
+                        help="léxico de texto (sin él, se prueban los motores con un léxico ambiguo)")
+    parser.add_argument("target_filename", nargs="?", default=None, metavar="lexico.lexc",
+                        help=f"archivo compilado (por defecto lexico.txt{COMPILED_SUFFIX})")
+    args = parser.parse_args()
+    
+    if args.source_filename is None:
+        test_lexicon()
+        return
+    
+    target_filename = args.target_filename or args.source_filename + COMPILED_SUFFIX
+    try:
+        count = compile_lexicon(args.source_filename, target_filename)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    print(f"Léxico compilado: {count} palabras en '{target_filename}'")
+
+if __name__ == "__main__":
+    main()
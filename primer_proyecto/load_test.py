@@ -0,0 +1,154 @@
+"""
+Prueba de Carga del Servidor de Compilación para Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Arranca compile_server.py en localhost (o usa uno ya iniciado con --port),
+abre muchos clientes concurrentes que envían oraciones de corpus_generator.py
+en tubería, mide el rendimiento y las latencias p50/p99 vistas por los
+clientes y verifica cada veredicto contra un LittleEnglishCompiler local.
+
+Uso: python load_test.py [--clients N] [--sentences N] [--port PUERTO]
+                         [--queue-size N] [--batch-size N] [--engine MOTOR]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+from compile_server import DEFAULT_BATCH_SIZE, DEFAULT_QUEUE_SIZE, STATS_COMMAND
+from corpus_generator import CorpusGenerator
+from main import ENGINES, LittleEnglishCompiler
+
+def free_port() -> int:
+    """Pide al sistema un puerto TCP libre en localhost"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+def start_server(port: int, queue_size: int, batch_size: int, engine: str) -> subprocess.Popen:
+    """Arranca el servidor en un subproceso y espera a que escuche"""
+    server_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "compile_server.py")
+    process = subprocess.Popen(
+        [sys.executable, server_path, "--port", str(port), "--queue-size", str(queue_size),
+         "--batch-size", str(batch_size), "--engine", engine, "--report-interval", "0"],
+        stdout=subprocess.PIPE, text=True, encoding='utf-8')
+    line = process.stdout.readline()
+    if "escuchando" not in line:
+        process.kill()
+        raise RuntimeError(f"El servidor no arrancó: {line.strip()}")
+    return process
+
+async def run_client(host: str, port: int, sentences: List[str]) -> Tuple[List[float], List[Tuple[bool, str]]]:
+    """
+    Envía las oraciones en tubería y mide la latencia de cada respuesta
+    
+    Returns:
+        Tupla con (latencias en segundos, veredictos (éxito, mensaje))
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    sent_at = []
+    
+    async def send():
+        for sentence in sentences:
+            sent_at.append(time.perf_counter())
+            writer.write((sentence + "\n").encode('utf-8'))
+            await writer.drain()
+        writer.write_eof()
+    
+    sender = asyncio.create_task(send())
+    latencies = []
+    verdicts = []
+    for index in range(len(sentences)):
+        response = json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - sent_at[index])
+        verdicts.append((response['success'], response['message']))
+    
+    await sender
+    writer.close()
+    await writer.wait_closed()
+    return latencies, verdicts
+
+async def server_stats(host: str, port: int) -> dict:
+    """Pide las estadísticas al servidor"""
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write((STATS_COMMAND + "\n").encode('utf-8'))
+    writer.write_eof()
+    stats = json.loads(await reader.readline())
+    writer.close()
+    await writer.wait_closed()
+    return stats
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Percentil de una lista de muestras (0.5 = p50)"""
+    ordered = sorted(samples)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)] if ordered else 0.0
+
+async def load_test(host: str, port: int, clients: List[List[str]]):
+    """Ejecuta todos los clientes a la vez y devuelve sus resultados y la duración"""
+    start = time.perf_counter()
+    results = await asyncio.gather(*(run_client(host, port, sentences) for sentences in clients))
+    return results, time.perf_counter() - start
+
+def main():
+    """Función principal de la prueba de carga"""
+    parser = argparse.ArgumentParser(description="Prueba de carga del servidor de compilación")
+    parser.add_argument("--clients", type=int, default=50, help="clientes concurrentes (por defecto 50)")
+    parser.add_argument("--sentences", type=int, default=2000,
+                        help="oraciones por cliente (por defecto 2000)")
+    parser.add_argument("--host", default="127.0.0.1", help="dirección (por defecto 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=None,
+                        help="puerto de un servidor ya iniciado (por defecto arranca uno propio)")
+    parser.add_argument("--queue-size", type=int, default=DEFAULT_QUEUE_SIZE,
+                        help=f"cola del servidor propio (por defecto {DEFAULT_QUEUE_SIZE})")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"micro-lote del servidor propio (por defecto {DEFAULT_BATCH_SIZE})")
+    parser.add_argument("--engine", choices=ENGINES, default="fused",
+                        help="motor del servidor propio (por defecto fused)")
+    parser.add_argument("--seed", type=int, default=7, help="semilla del corpus (por defecto 7)")
+    args = parser.parse_args()
+    
+    generator = CorpusGenerator(args.seed)
+    clients = [list(generator.generate(args.sentences)) for _ in range(args.clients)]
+    
+    process = None
+    port = args.port
+    if port is None:
+        port = free_port()
+        process = start_server(port, args.queue_size, args.batch_size, args.engine)
+    
+    try:
+        results, elapsed = asyncio.run(load_test(args.host, port, clients))
+        stats = asyncio.run(server_stats(args.host, port))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+    
+    # Verificar los veredictos contra un compilador local
+    compiler = LittleEnglishCompiler()
+    mismatches = 0
+    for sentences, (_, verdicts) in zip(clients, results):
+        for sentence, verdict in zip(sentences, verdicts):
+            if tuple(verdict) != compiler.compile_sentence(sentence, 0)[1:]:
+                mismatches += 1
+    
+    latencies = [latency for client_latencies, _ in results for latency in client_latencies]
+    total = len(latencies)
+    print(f"Clientes: {args.clients}  Oraciones por cliente: {args.sentences}  Total: {total}")
+    print(f"Duración: {elapsed:.3f} s  Rendimiento: {total / elapsed:.0f} oraciones/s")
+    print(f"Latencia en el cliente: p50 {percentile(latencies, 0.50) * 1000:.2f} ms  "
+          f"p99 {percentile(latencies, 0.99) * 1000:.2f} ms")
+    print(f"Servidor: {stats['batches']} lotes (promedio {stats['mean_batch_size']:.1f} oraciones), "
+          f"p50 {stats['p50_ms']:.2f} ms  p99 {stats['p99_ms']:.2f} ms")
+    print(f"Veredictos distintos del compilador local: {mismatches}")
+    if mismatches:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
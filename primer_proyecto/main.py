@@ -6,19 +6,296 @@ Este programa realiza análisis léxico y sintáctico de oraciones en Little Eng
 procesando un archivo de entrada línea por línea y generando un reporte de resultados.
 """
 
+from __future__ import annotations
+
 import sys
 import os
-from typing import List, Tuple
-from lexical_analyzer import LexicalAnalyzer, Token
+from itertools import islice
+from lexical_analyzer import LexicalAnalyzer, ScannedLine, Token, TokenStream, TOKEN_TYPE_IDS
 from syntax_analyzer import SyntaxAnalyzer
+from cache import LRUCache
+from diagnostics import Diagnostic
+from report import DEFAULT_FORMAT, REPORT_FORMATS, new_stats, open_report
+
+# typing importa re y es la mayor parte del arranque: los tipos de las
+# anotaciones solo se importan al revisar el código (ver benchmark_startup.py)
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+    from batch_engine import BatchResult
+    from fused_engine import FusedEngine
+    from incremental import IncrementalIndex
+    from instrumentation import Profiler
+    from parse_tree import ParseTree, ParseTreeBuilder, TreeWriter
+    from suggestions import Suggestion
+
+# Los módulos de funciones opcionales (motores fusionado y por lotes,
+# compilación en paralelo, entrada mapeada, instrumentación, compilación
+# incremental, léxico externo y gramáticas) se importan cuando se usan, para
+# que el arranque solo cargue lo necesario (ver benchmark_startup.py)
+
+# Motores de compilación disponibles
+ENGINES = ("classic", "fused", "batch")
+
+# Analizadores léxicos disponibles para el motor clásico
+LEXERS = ("split", "scanner")
+
+# Tamaños por defecto de las cachés de oraciones y de formas de oración
+DEFAULT_CACHE_SIZE = 10000
+DEFAULT_SHAPE_CACHE_SIZE = 256
+
+# Cantidad de líneas que se envían a un trabajador en cada tarea
+DEFAULT_CHUNK_SIZE = 2000
+
+# Veredicto de una línea sin palabras
+EMPTY_LINE_VERDICT = (False, "Línea vacía")
+
+def token_shape(tokens: Union[List[Token], TokenStream]) -> bytes:
+    """Forma de una oración: el código de tipo de cada token, como bytes"""
+    if isinstance(tokens, TokenStream):
+        return tokens.shape()
+    return bytes(TOKEN_TYPE_IDS[token.type] for token in tokens)
+
+def split_chunks(lines: Iterable[str], chunk_size: int) -> Iterator[Tuple[int, List[str]]]:
+    """
+    Agrupa las líneas en bloques consecutivos sin leer toda la entrada
+    
+    Args:
+        lines: Líneas de entrada (puede ser un archivo abierto)
+        chunk_size: Cantidad máxima de líneas por bloque
+        
+    Returns:
+        Iterador de tuplas (número de la primera línea, líneas del bloque)
+    """
+    if chunk_size < 1:
+        raise ValueError("El tamaño de bloque debe ser al menos 1")
+    
+    lines = iter(lines)
+    line_number = 1
+    while True:
+        chunk = list(islice(lines, chunk_size))
+        if not chunk:
+            return
+        yield line_number, chunk
+        line_number += len(chunk)
+
+def verdict_result(line_number: int, sentence: str, verdict: Tuple) -> Dict:
+    """
+    Empaqueta el veredicto de una línea como resultado del reporte
+    
+    Args:
+        line_number: Número de línea en el archivo
+        sentence: Oración recortada
+        verdict: Tupla (éxito, mensaje), o (True, mensaje, forma) con
+            record_shapes (ver LittleEnglishCompiler.set_record_shapes)
+        
+    Returns:
+        Diccionario con número de línea, oración, éxito y mensaje, y la
+        forma en 'shape' si el veredicto la tiene
+    """
+    result = {
+        'line_number': line_number,
+        'sentence': sentence,
+        'success': verdict[0],
+        'message': verdict[1]
+    }
+    if len(verdict) > 2:
+        result['shape'] = verdict[2]
+    return result
 
 class LittleEnglishCompiler:
     """Compilador principal que integra análisis léxico y sintáctico"""
     
-    def __init__(self):
-        self.lexical_analyzer = LexicalAnalyzer()
-        self.syntax_analyzer = SyntaxAnalyzer()
+    def __init__(self, engine: str = "classic", lexer: str = "split",
+                 cache_size: int = DEFAULT_CACHE_SIZE,
+                 shape_cache_size: int = DEFAULT_SHAPE_CACHE_SIZE,
+                 profiler: Optional["Profiler"] = None, lexicon: Optional[str] = None,
+                 grammar: Optional[str] = None, suggest: int = 0, record_shapes: bool = False):
+        if engine not in ENGINES:
+            raise ValueError(f"Motor desconocido: '{engine}'")
+        if lexer not in LEXERS:
+            raise ValueError(f"Analizador léxico desconocido: '{lexer}'")
+        if lexer == "scanner" and engine != "classic":
+            raise ValueError("El escáner de bloques solo se usa con el motor 'classic'")
+        if grammar and engine != "classic":
+            raise ValueError("Una gramática externa solo se usa con el motor 'classic'")
+        if suggest < 0:
+            raise ValueError("La cantidad de sugerencias no puede ser negativa")
+        
+        self.engine = engine
+        self.lexer = lexer
+        # Léxico externo opcional (texto o compilado), abierto con mmap
+        self.lexicon_filename = lexicon
+        if lexicon:
+            from lexicon import open_lexicon
+            self.lexical_analyzer = LexicalAnalyzer(open_lexicon(lexicon))
+        else:
+            self.lexical_analyzer = LexicalAnalyzer()
+        # Gramática BNF opcional, compilada a una tabla LL(1) (con caché en disco)
+        self.grammar_filename = grammar
+        if grammar:
+            from grammar import TableDrivenAnalyzer, load_grammar
+            self.grammar = load_grammar(grammar)
+            self.syntax_analyzer = TableDrivenAnalyzer(self.grammar)
+        else:
+            self.grammar = None
+            self.syntax_analyzer = SyntaxAnalyzer()
+        # Motor fusionado: autómata de una sola pasada sobre el vocabulario. El
+        # motor por lotes lo usa para los mensajes de las oraciones rechazadas
+        self.fused_engine = None
+        if engine in ("fused", "batch"):
+            from fused_engine import FusedEngine
+            self.fused_engine = FusedEngine(self.lexical_analyzer)
+        # Motor por lotes con NumPy (valida bloques de oraciones a la vez)
+        self.batch_engine = None
+        if engine == "batch":
+            from batch_engine import BatchEngine
+            self.batch_engine = BatchEngine(self.lexical_analyzer)
+        # Motor para las líneas leídas como bytes y búsqueda de los bytes que
+        # ese motor no compila (se crean al primer uso, ver get_bytes_engine)
+        self.bytes_engine = None
+        self.non_simple_ascii = None
+        # Sugerencias por token no reconocido en el reporte (0 = ninguna); el
+        # índice del vocabulario se abre al primer token que las necesita
+        self.suggest = suggest
+        self.suggestion_index = None
+        # Constructor de árboles sintácticos (se crea al primer uso) y
+        # cantidad de árboles exportados por la última compilación
+        self.tree_builder = None
+        self.tree_count = 0
+        
+        # Caché de resultados por oración normalizada y caché de veredictos
+        # sintácticos por forma (secuencia de tipos de token); tamaño 0 la desactiva
+        self.cache_size = cache_size
+        self.shape_cache_size = shape_cache_size
+        self.sentence_cache = LRUCache(cache_size) if cache_size > 0 else None
+        self.shape_cache = LRUCache(shape_cache_size) if shape_cache_size > 0 else None
+        # Forma de las oraciones aceptadas en sus veredictos (ver set_record_shapes)
+        self.record_shapes = False
+        self.set_record_shapes(record_shapes)
+        # Contadores de caché acumulados por los procesos trabajadores
+        self.worker_cache_counters = {}
         self.results = []
+        self.stats = new_stats()
+        
+        # Índice de la última compilación incremental (ver compile_file)
+        self.incremental_index = None
+        
+        # Instrumentación opcional: sin Profiler no se envuelve ningún método
+        self.profiler = profiler
+        if profiler is not None:
+            profiler.instrument(self)
+    
+    def options(self) -> Dict:
+        """Opciones de construcción, para replicar el compilador en otros procesos"""
+        return {
+            'engine': self.engine,
+            'lexer': self.lexer,
+            'cache_size': self.cache_size,
+            'shape_cache_size': self.shape_cache_size,
+            'profiler': type(self.profiler)() if self.profiler is not None else None,
+            'lexicon': self.lexicon_filename,
+            'grammar': self.grammar_filename,
+            'suggest': self.suggest,
+            'record_shapes': self.record_shapes
+        }
+    
+    def fork(self) -> "LittleEnglishCompiler":
+        """
+        Copia del compilador para compilar un bloque en otro hilo
+        
+        La copia comparte el vocabulario, los motores y las cachés; solo el
+        analizador sintáctico se copia con SyntaxAnalyzer.fork, porque es el
+        único que guarda estado mientras analiza. Las cachés compartidas
+        deben tener su candado activo (ver share_caches).
+        """
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone.syntax_analyzer = self.syntax_analyzer.fork()
+        return clone
+    
+    def shared_caches(self) -> List[LRUCache]:
+        """Cachés que comparten los hilos de una compilación con threads"""
+        caches = [self.sentence_cache, self.shape_cache]
+        lexicon = self.lexical_analyzer.lexicon
+        if lexicon is not None:
+            # Palabras recordadas por las vistas del léxico externo
+            caches += [lexicon.type_codes.found, lexicon.token_types.found]
+        return [cache for cache in caches if cache is not None]
+    
+    def share_caches(self):
+        """Activa el candado de las cachés para compartirlas entre hilos"""
+        for cache in self.shared_caches():
+            cache.enable_locking()
+    
+    def unshare_caches(self):
+        """Quita el candado de las cachés cuando los hilos terminan"""
+        for cache in self.shared_caches():
+            cache.disable_locking()
+    
+    def set_record_shapes(self, record_shapes: bool):
+        """
+        Activa o desactiva la forma en los veredictos de las oraciones aceptadas
+        
+        Con record_shapes, el veredicto de una oración aceptada es
+        (True, mensaje, forma) y su resultado lleva la forma en 'shape'. La
+        forma sale de la misma pasada que compila la oración, en el proceso o
+        hilo que la compila; add_trees la usa para el árbol. Al activarla se
+        vacía la caché de oraciones, cuyos veredictos no tienen forma.
+        """
+        if record_shapes and not self.record_shapes and self.sentence_cache is not None:
+            self.sentence_cache.clear()
+        self.record_shapes = record_shapes
+        for engine in (self.fused_engine, self.bytes_engine, self.batch_engine):
+            if engine is not None:
+                engine.record_shapes = record_shapes
+    
+    def cache_counters(self) -> Dict[str, Dict[str, int]]:
+        """
+        Devuelve los contadores de las cachés activas
+        
+        Incluye lo acumulado por los procesos trabajadores, si los hubo.
+        
+        Returns:
+            Diccionario 'sentence'/'shape' -> contadores de aciertos, fallos y desalojos
+        """
+        counters = {}
+        for name, cache in (('sentence', self.sentence_cache), ('shape', self.shape_cache)):
+            if cache is None:
+                continue
+            counters[name] = cache.counters()
+            for key, value in self.worker_cache_counters.get(name, {}).items():
+                counters[name][key] += value
+        return counters
+    
+    def take_cache_counters(self) -> Dict[str, Dict[str, int]]:
+        """Devuelve los contadores de caché locales y los pone en cero"""
+        counters = {}
+        for name, cache in (('sentence', self.sentence_cache), ('shape', self.shape_cache)):
+            if cache is not None:
+                counters[name] = cache.counters()
+                cache.reset_counters()
+        return counters
+    
+    def take_worker_counters(self) -> Dict:
+        """Devuelve los contadores de caché y las métricas locales, y los pone en cero"""
+        return {
+            'cache': self.take_cache_counters(),
+            'profile': self.profiler.take() if self.profiler is not None else None
+        }
+    
+    def add_worker_counters(self, counters: Dict):
+        """Acumula los contadores de caché y las métricas reportados por un trabajador"""
+        self.add_worker_cache_counters(counters['cache'])
+        if counters['profile'] is not None and self.profiler is not None:
+            self.profiler.merge(counters['profile'])
+    
+    def add_worker_cache_counters(self, counters: Dict[str, Dict[str, int]]):
+        """Acumula los contadores de caché reportados por un proceso trabajador"""
+        for name, values in counters.items():
+            totals = self.worker_cache_counters.setdefault(name, {})
+            for key, value in values.items():
+                totals[key] = totals.get(key, 0) + value
     
     def compile_sentence(self, sentence: str, line_number: int) -> Tuple[str, bool, str]:
         """
@@ -37,155 +314,1054 @@ class LittleEnglishCompiler:
         if not sentence:
             return sentence, False, "Línea vacía"
         
+        verdict = self.sentence_verdict(sentence)
+        return sentence, verdict[0], verdict[1]
+    
+    def sentence_verdict(self, sentence: str) -> Tuple:
+        """
+        Compila una oración ya recortada y no vacía, con la caché de oraciones
+        
+        Args:
+            sentence: Oración a compilar
+            
+        Returns:
+            Veredicto (éxito, mensaje), o (True, mensaje, forma) con record_shapes
+        """
+        if self.sentence_cache is None:
+            return self.compile_stripped(sentence)
+        
+        # Las oraciones que solo difieren en espacios dan el mismo resultado
+        key = " ".join(sentence.split())
+        cached = self.sentence_cache.get(key)
+        if cached is None:
+            cached = self.compile_stripped(sentence)
+            self.sentence_cache.put(key, cached)
+        return cached
+    
+    def compile_stripped(self, sentence: str) -> Tuple:
+        """
+        Compila una oración ya recortada y no vacía, sin usar la caché de oraciones
+        
+        Args:
+            sentence: Oración a compilar
+            
+        Returns:
+            Veredicto (éxito, mensaje), o (True, mensaje, forma) con record_shapes
+        """
+        if self.fused_engine is not None:
+            return self.fused_engine.compile(sentence)
+        
         try:
-            # Fase 1: Análisis Léxico
-            tokens = self.lexical_analyzer.analyze(sentence)
+            # Fase 1: Análisis Léxico (los errores se devuelven, no se lanzan)
+            scanned = self.lexical_analyzer.scan(sentence)
+            if scanned.diagnostics:
+                return False, scanned.diagnostics[0].report_message()
             
             # Fase 2: Análisis Sintáctico
-            self.syntax_analyzer.analyze(tokens)
+            return self.check_syntax(scanned.tokens)
+            
+        except Exception as e:
+            # Error inesperado
+            return False, f"Error inesperado: {str(e)}"
+    
+    def diagnose(self, sentence: str) -> List[Diagnostic]:
+        """
+        Busca todos los errores de una oración, no solo el primero
+        
+        Si hay errores léxicos, devuelve todas las palabras desconocidas; si
+        no, todos los errores sintácticos, recuperándose de cada uno
+        descartando tokens. El primer diagnóstico corresponde siempre al
+        mensaje de compile_sentence.
+        
+        Args:
+            sentence: Oración a revisar
+            
+        Returns:
+            Lista de diagnósticos (vacía si la oración es correcta)
+        """
+        scanned = self.lexical_analyzer.scan(sentence, collect_all=True)
+        if scanned.diagnostics:
+            return list(scanned.diagnostics)
+        return list(self.syntax_analyzer.check(scanned.tokens, collect_all=True).diagnostics)
+    
+    def get_tree_builder(self) -> "ParseTreeBuilder":
+        """
+        Devuelve el constructor de árboles sintácticos, creándolo la primera vez
+        
+        Raises:
+            ValueError: Si se usa una gramática externa (los árboles siguen
+                las frases de la gramática de Little English)
+        """
+        if self.grammar is not None:
+            raise ValueError("Los árboles sintácticos solo se construyen con la gramática de Little English")
+        if self.tree_builder is None:
+            from parse_tree import ParseTreeBuilder
+            self.tree_builder = ParseTreeBuilder()
+        return self.tree_builder
+    
+    def parse_tree(self, sentence: str) -> Optional["ParseTree"]:
+        """
+        Analiza una oración y devuelve su árbol sintáctico
+        
+        Args:
+            sentence: Oración a analizar
             
-            # Si llegamos aquí, ambos análisis fueron exitosos
-            return sentence, True, "Compilación exitosa"
+        Returns:
+            ParseTree con las frases de la oración, o None si tiene errores
+        """
+        builder = self.get_tree_builder()
+        builder.arena.reset()
+        if not self.build_tree(sentence):
+            return None
+        return builder.arena.tree(0)
+    
+    def build_tree(self, sentence: str, line_number: int = 0) -> bool:
+        """
+        Agrega al arena del constructor el árbol de una oración, si es correcta
+        
+        Con un léxico externo, si la oración se rechaza con la categoría
+        principal de cada palabra, el árbol es el de la asignación de
+        categorías que encuentra search_categories.
+        
+        Args:
+            sentence: Oración a analizar
+            line_number: Número de línea que se guarda con el árbol
             
-        except ValueError as e:
-            # Error en análisis léxico
-            return sentence, False, f"Error léxico: {str(e)}"
+        Returns:
+            True si se agregó el árbol
+        """
+        scanned = self.lexical_analyzer.scan(sentence)
+        if scanned.diagnostics:
+            return False
+        build = self.get_tree_builder().build
+        if build(scanned.tokens, line_number).accepted:
+            return True
+        if self.lexical_analyzer.lexicon is None:
+            return False
+        from lexicon import recategorize
+        codes = self.search_categories(scanned.tokens)
+        if codes is None:
+            return False
+        return build(recategorize(scanned.tokens, codes), line_number).accepted
+    
+    def add_trees(self, results: Iterable[Dict], tree_writer: "TreeWriter",
+                  trees_per_block: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Agrega el árbol de cada resultado exitoso a medida que los resultados pasan
+        
+        Los resultados vienen de una compilación con record_shapes (ver
+        set_record_shapes): el árbol sale de la forma que produjo la pasada
+        que compiló la oración, en su proceso o hilo, así que aquí no se
+        vuelve a tokenizar ni a analizar nada (salvo la primera oración de
+        cada forma, para su plantilla). Los árboles se acumulan en el arena
+        del constructor y se escriben por bloques; entre bloques el arena se
+        vacía y se reutiliza. La forma se quita de cada resultado, que sigue
+        hacia el reporte igual que sin árboles.
+        
+        Args:
+            results: Resultados de la compilación, en el orden de las líneas
+            tree_writer: Escritor del archivo de árboles
+            trees_per_block: Árboles por bloque (por defecto DEFAULT_TREES_PER_BLOCK)
             
-        except SyntaxError as e:
-            # Error en análisis sintáctico
-            return sentence, False, f"Error sintáctico: {str(e)}"
+        Returns:
+            Iterador de los mismos resultados
+        """
+        from parse_tree import DEFAULT_TREES_PER_BLOCK
+        
+        builder = self.get_tree_builder()
+        arena = builder.arena
+        known_templates = arena.template_ids
+        template_id = builder.template_id
+        trees_per_block = trees_per_block or DEFAULT_TREES_PER_BLOCK
+        # Número de línea y plantilla de cada árbol del bloque; se pasan al
+        # arena de una vez al escribir el bloque
+        line_numbers, template_ids = [], []
+        add_line_number, add_template_id = line_numbers.append, template_ids.append
+        
+        def write_block():
+            arena.reset()
+            arena.add_trees(line_numbers, template_ids)
+            tree_writer.write(arena)
+            arena.reset()
+            line_numbers.clear()
+            template_ids.clear()
+        
+        for result in results:
+            if result['success']:
+                shape = result.pop('shape')
+                known = known_templates.get(shape)
+                add_template_id(known if known is not None else template_id(shape))
+                add_line_number(result['line_number'])
+                if len(line_numbers) >= trees_per_block:
+                    write_block()
+            yield result
+        write_block()
+    
+    def check_syntax(self, tokens: Union[List[Token], TokenStream]) -> Tuple:
+        """
+        Realiza el análisis sintáctico de los tokens de una oración
+        
+        Con un léxico externo, si la oración se rechaza con la categoría
+        principal de cada palabra, se buscan las otras categorías de las
+        palabras que tienen varias (ver search_categories); el mensaje de
+        error es el de las categorías principales, y con record_shapes la
+        forma es la de las categorías encontradas.
+        
+        Args:
+            tokens: Lista de tokens o TokenStream del análisis léxico
             
-        except Exception as e:
-            # Error inesperado
-            return sentence, False, f"Error inesperado: {str(e)}"
+        Returns:
+            Veredicto (éxito, mensaje), o (True, mensaje, forma) con record_shapes
+        """
+        success, message = self.check_primary_syntax(tokens)
+        if success:
+            if self.record_shapes:
+                return success, message, token_shape(tokens)
+            return success, message
+        if self.lexical_analyzer.lexicon is None:
+            return success, message
+        
+        codes = self.search_categories(tokens)
+        if codes is None:
+            return success, message
+        if self.record_shapes:
+            return True, "Compilación exitosa", bytes(codes)
+        return True, "Compilación exitosa"
+    
+    def search_categories(self, tokens: Union[List[Token], TokenStream]) -> Optional[List[int]]:
+        """
+        Busca una asignación de categorías del léxico externo que la gramática acepte
+        
+        Con la gramática de Little English es la búsqueda del motor fusionado
+        (FusedEngine.search_categories), así que el camino clásico acepta las
+        mismas oraciones que los motores rápidos; con una gramática externa,
+        la del analizador por tabla (TableDrivenAnalyzer.search_categories).
+        Ninguna limita la cantidad de combinaciones.
+        
+        Args:
+            tokens: Tokens de la oración, todos en el léxico
+            
+        Returns:
+            Código de tipo elegido para cada token, o None si ninguna
+            asignación se acepta
+        """
+        masks = self.lexical_analyzer.lexicon.category_masks(tokens)
+        if self.grammar is not None:
+            return self.syntax_analyzer.search_categories(masks)
+        return self.get_bytes_engine().search_categories(masks)
     
-    def compile_file(self, input_filename: str, output_filename: str):
+    def check_primary_syntax(self, tokens: Union[List[Token], TokenStream]) -> Tuple[bool, str]:
+        """
+        Analiza los tokens con la categoría principal de cada palabra
+        
+        Con la caché de formas activa, el veredicto se busca por la secuencia
+        de tipos de token; si la forma ya se analizó, no se vuelve a parsear y
+        solo se reconstruye el mensaje con el valor del token que falló.
+        
+        Args:
+            tokens: Lista de tokens o TokenStream del análisis léxico
+            
+        Returns:
+            Tupla con (éxito, mensaje)
+        """
+        if self.shape_cache is None:
+            result = self.syntax_analyzer.check(tokens)
+            if result.accepted:
+                return True, "Compilación exitosa"
+            return False, result.diagnostics[0].report_message()
+        
+        shape = token_shape(tokens)
+        verdict = self.shape_cache.get(shape)
+        if verdict is None:
+            verdict = self.parse_shape(tokens)
+            self.shape_cache.put(shape, verdict)
+        
+        success, index, prefix, suffix = verdict
+        if success:
+            return True, "Compilación exitosa"
+        if index < 0:
+            return False, prefix
+        return False, prefix + tokens[index].value + suffix
+    
+    def parse_shape(self, tokens: Union[List[Token], TokenStream]) -> Tuple[bool, int, str, str]:
+        """
+        Parsea los tokens y describe el veredicto de forma independiente de los valores
+        
+        Los mensajes de error sintáctico terminan con el valor del token en el
+        que falló el análisis, así que el mensaje se guarda partido alrededor
+        de ese valor.
+        
+        Args:
+            tokens: Tokens del análisis léxico
+            
+        Returns:
+            Tupla con (éxito, índice del token que falló o -1, prefijo, sufijo)
+        """
+        result = self.syntax_analyzer.check(tokens)
+        if result.accepted:
+            return True, -1, "", ""
+        
+        diagnostic = result.diagnostics[0]
+        message = diagnostic.report_message()
+        index = diagnostic.token_index
+        if index >= 0:
+            value = tokens[index].value
+            cut = message.rfind(value)
+            if cut >= 0:
+                return False, index, message[:cut], message[cut + len(value):]
+        return False, -1, message, ""
+    
+    def compile_file(self, input_filename: str, output_filename: str, streaming: bool = False,
+                     workers: int = 1, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     mmap_input: bool = False, incremental: bool = False,
+                     report_format: str = DEFAULT_FORMAT, threads: int = 1,
+                     trees: Optional[str] = None, tree_format: str = "jsonl"):
         """
         Compila todas las oraciones de un archivo
         
+        Con trees, la compilación se hace con record_shapes (ver
+        set_record_shapes) y los árboles se agregan con add_trees.
+        
         Args:
             input_filename: Nombre del archivo de entrada
             output_filename: Nombre del archivo de salida
+            streaming: Si es True, escribe cada resultado en cuanto se produce
+                y conserva solo contadores en memoria (ver compile_file_streaming)
+            workers: Cantidad de procesos trabajadores (1 compila en serie)
+            chunk_size: Cantidad de líneas por bloque enviado a cada trabajador
+            mmap_input: Si es True, lee la entrada como bytes con mmap
+                (ver compile_input)
+            incremental: Si es True, reutiliza los resultados guardados en el
+                índice junto al archivo de salida y solo compila las líneas
+                nuevas o modificadas; el reporte es idéntico al de una
+                compilación completa (solo en serie y sin mmap)
+            report_format: Formato del reporte: "text", "jsonl" o "csv"
+            threads: Cantidad de hilos del pool compartido (1 compila en
+                serie); no se combina con workers, incremental ni el Profiler
+            trees: Archivo donde exportar el árbol sintáctico de cada oración
+                correcta, construido en la misma pasada que el reporte (la
+                cantidad queda en self.tree_count), o None
+            tree_format: Formato de trees: "jsonl" o "binary" (ver parse_tree.py)
         """
         # Verificar que el archivo de entrada existe
         if not os.path.exists(input_filename):
             raise FileNotFoundError(f"El archivo de entrada '{input_filename}' no existe")
         
-        # Leer y procesar el archivo línea por línea
-        self.results = []
+        if workers > 1 and self.profiler is not None and self.profiler.callbacks:
+            raise ValueError("Las funciones registradas en el Profiler no se llaman desde los "
+                             "procesos trabajadores")
+        if threads < 1:
+            raise ValueError("La cantidad de hilos debe ser al menos 1")
+        if threads > 1 and (workers > 1 or incremental or self.profiler is not None):
+            raise ValueError("Los hilos no se combinan con trabajadores, con la compilación "
+                             "incremental ni con el Profiler")
+        
+        index = None
+        if incremental:
+            if workers > 1 or mmap_input:
+                raise ValueError("La compilación incremental no se combina con trabajadores ni con mmap")
+            from incremental import IncrementalIndex, compiler_fingerprint, index_filename
+            index = IncrementalIndex.load(index_filename(output_filename), compiler_fingerprint(self))
+        self.incremental_index = index
+        
+        tree_writer = None
+        self.tree_count = 0
+        record_shapes = self.record_shapes
+        if trees is not None:
+            from parse_tree import TreeWriter
+            self.get_tree_builder()
+            tree_writer = TreeWriter(trees, tree_format)
+            self.set_record_shapes(True)
         
         try:
-            with open(input_filename, 'r', encoding='utf-8') as input_file:
-                lines = input_file.readlines()
+            if streaming:
+                self.compile_file_streaming(input_filename, output_filename, workers, chunk_size,
+                                            mmap_input, index, report_format, threads, tree_writer)
+            else:
+                # Leer y procesar el archivo línea por línea
+                self.results = []
+                
+                try:
+                    self.results.extend(self.compile_input_with_suggestions(
+                        input_filename, workers, chunk_size, mmap_input, index, threads,
+                        tree_writer))
+                
+                except IOError as e:
+                    raise IOError(f"Error al leer el archivo de entrada: {str(e)}")
                 
-                for line_number, line in enumerate(lines, 1):
-                    sentence, success, message = self.compile_sentence(line, line_number)
-                    self.results.append({
-                        'line_number': line_number,
-                        'sentence': sentence,
-                        'success': success,
-                        'message': message
-                    })
+                # Generar archivo de salida
+                self.generate_output_file(output_filename, report_format)
+        finally:
+            if tree_writer is not None:
+                tree_writer.close()
+                self.tree_count = tree_writer.count
+                self.set_record_shapes(record_shapes)
         
-        except IOError as e:
-            raise IOError(f"Error al leer el archivo de entrada: {str(e)}")
+        if index is not None:
+            index.save(index_filename(output_filename))
+    
+    def compile_line(self, line: str, line_number: int) -> Dict:
+        """
+        Compila una línea y empaqueta el resultado para el reporte
+        
+        Args:
+            line: Línea leída del archivo de entrada
+            line_number: Número de línea en el archivo
+            
+        Returns:
+            Diccionario con número de línea, oración, éxito y mensaje (ver
+            verdict_result)
+        """
+        sentence = line.strip()
+        verdict = self.sentence_verdict(sentence) if sentence else EMPTY_LINE_VERDICT
+        return verdict_result(line_number, sentence, verdict)
+    
+    def compile_lines(self, lines: Iterable[str], workers: int = 1,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE, threads: int = 1) -> Iterator[Dict]:
+        """
+        Compila una secuencia de líneas de forma perezosa
+        
+        Args:
+            lines: Líneas de entrada (puede ser un archivo abierto)
+            workers: Cantidad de procesos trabajadores (1 compila en serie)
+            chunk_size: Cantidad de líneas por bloque enviado a cada trabajador
+            threads: Cantidad de hilos que comparten este compilador (1 compila en serie)
+            
+        Returns:
+            Iterador de resultados en el orden de las líneas de entrada
+        """
+        if threads > 1:
+            from parallel_compiler import compile_chunks_threaded
+            return compile_chunks_threaded(self, split_chunks(lines, chunk_size), threads)
+        
+        if workers > 1:
+            from parallel_compiler import compile_chunks_parallel
+            return compile_chunks_parallel(split_chunks(lines, chunk_size), workers,
+                                           self.options(), self.add_worker_counters)
+        
+        if self.lexer == "scanner" or self.batch_engine is not None:
+            return (result
+                    for first_line_number, chunk in split_chunks(lines, chunk_size)
+                    for result in self.compile_block(chunk, first_line_number))
         
-        # Generar archivo de salida
-        self.generate_output_file(output_filename)
+        return (self.compile_line(line, line_number)
+                for line_number, line in enumerate(lines, 1))
     
-    def generate_output_file(self, output_filename: str):
+    def compile_input(self, input_filename: str, workers: int = 1,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE,
+                      mmap_input: bool = False,
+                      index: Optional["IncrementalIndex"] = None,
+                      threads: int = 1) -> Iterator[Dict]:
+        """
+        Compila las líneas de un archivo de entrada de forma perezosa
+        
+        Con mmap_input, el archivo se mapea en memoria y cada línea se compila
+        como bytes con compile_raw_line; los trabajadores mapean el mismo
+        archivo y solo reciben rangos de bytes. Sin mmap_input, el archivo se
+        lee como texto y se compila con compile_lines, o con
+        compile_lines_incremental si se indica un índice. Con threads > 1,
+        los bloques se compilan en el pool de hilos compartido.
+        
+        Args:
+            input_filename: Nombre del archivo de entrada
+            workers: Cantidad de procesos trabajadores (1 compila en serie)
+            chunk_size: Cantidad de líneas por bloque enviado a cada trabajador
+            mmap_input: Si es True, lee la entrada como bytes con mmap
+            index: Índice de la compilación incremental, o None
+            threads: Cantidad de hilos que comparten este compilador (1 compila en serie)
+            
+        Returns:
+            Iterador de resultados en el orden de las líneas de entrada
+        """
+        if not mmap_input:
+            with open(input_filename, 'r', encoding='utf-8') as input_file:
+                if index is not None:
+                    yield from self.compile_lines_incremental(input_file, index)
+                else:
+                    yield from self.compile_lines(input_file, workers, chunk_size, threads)
+            return
+        
+        if threads > 1:
+            from parallel_compiler import compile_mapped_threaded
+            yield from compile_mapped_threaded(self, input_filename, threads, chunk_size)
+            return
+        
+        if workers > 1:
+            from parallel_compiler import compile_mapped_parallel
+            yield from compile_mapped_parallel(input_filename, workers, chunk_size, self.options(),
+                                               self.add_worker_counters)
+            return
+        
+        from mmap_input import iter_lines, mapped_file
+        with mapped_file(input_filename) as buffer:
+            for line_number, raw in enumerate(iter_lines(buffer), 1):
+                yield self.compile_raw_line(raw, line_number)
+    
+    def compile_input_with_suggestions(self, input_filename: str, workers: int = 1,
+                                       chunk_size: int = DEFAULT_CHUNK_SIZE,
+                                       mmap_input: bool = False,
+                                       index: Optional["IncrementalIndex"] = None,
+                                       threads: int = 1,
+                                       tree_writer: Optional["TreeWriter"] = None) -> Iterator[Dict]:
+        """
+        Igual que compile_input(), pero con self.suggest > 0 agrega al mensaje
+        de cada token no reconocido las palabras más parecidas del vocabulario
+        
+        Las sugerencias se agregan en este proceso después de compilar, así
+        que no cambian lo que guardan las cachés ni el índice incremental.
+        Con tree_writer, los árboles de las oraciones correctas se construyen
+        y se escriben a medida que pasan los resultados (ver add_trees).
+        """
+        results = self.compile_input(input_filename, workers, chunk_size, mmap_input, index,
+                                     threads)
+        if tree_writer is not None:
+            results = self.add_trees(results, tree_writer)
+        if not self.suggest:
+            return results
+        return self.add_suggestions(results)
+    
+    def add_suggestions(self, results: Iterable[Dict]) -> Iterator[Dict]:
+        """Agrega las sugerencias a los resultados con un token no reconocido"""
+        from suggestions import format_suggestions, unknown_word
+        
+        for result in results:
+            if not result['success']:
+                word = unknown_word(result['message'])
+                if word is not None:
+                    # Copia: el resultado puede estar en la caché de oraciones
+                    result = dict(result, message=result['message'] +
+                                  format_suggestions(self.suggest_words(word)))
+            yield result
+    
+    def suggest_words(self, word: str, count: Optional[int] = None) -> List["Suggestion"]:
+        """
+        Palabras del vocabulario más parecidas a un token no reconocido
+        
+        El índice de sugerencias se construye (o se lee de su caché en disco)
+        la primera vez que se usa.
+        
+        Args:
+            word: Token no reconocido
+            count: Cantidad máxima de sugerencias (por defecto self.suggest,
+                o DEFAULT_SUGGESTIONS si es 0)
+            
+        Returns:
+            Lista de Suggestion ordenada de la más parecida a la menos
+        """
+        from suggestions import DEFAULT_SUGGESTIONS, load_suggestion_index
+        
+        if self.suggestion_index is None:
+            self.suggestion_index = load_suggestion_index(self.lexical_analyzer)
+        if count is None:
+            count = self.suggest or DEFAULT_SUGGESTIONS
+        return self.suggestion_index.lookup(word, count)
+    
+    def compile_lines_incremental(self, lines: Iterable[str],
+                                  index: "IncrementalIndex") -> Iterator[Dict]:
+        """
+        Compila una secuencia de líneas reutilizando los resultados del índice
+        
+        Solo las oraciones cuyo hash no está en el índice pasan por
+        sentence_verdict; su veredicto se agrega al índice. Con
+        record_shapes, un veredicto aceptado guardado sin forma se vuelve a
+        compilar.
+        
+        Args:
+            lines: Líneas de entrada (puede ser un archivo abierto)
+            index: Índice de resultados por hash de oración
+            
+        Returns:
+            Iterador de resultados en el orden de las líneas de entrada
+        """
+        from incremental import sentence_key
+        
+        for line_number, line in enumerate(lines, 1):
+            sentence = line.strip()
+            if not sentence:
+                yield self.compile_line(line, line_number)
+                continue
+            
+            key = sentence_key(sentence)
+            cached = index.get(key, self.record_shapes)
+            if cached is None:
+                cached = self.sentence_verdict(sentence)
+                index.put(key, cached)
+            
+            yield verdict_result(line_number, sentence, cached)
+    
+    def compile_raw_line(self, raw: bytes, line_number: int) -> Dict:
+        """
+        Compila una línea leída como bytes, sin decodificarla para el análisis
+        
+        Las líneas ASCII se reconocen palabra por palabra en bytes y solo se
+        decodifica el texto de la oración para el reporte; las demás se
+        decodifican y se compilan con compile_line. Los resultados son los
+        mismos que los de compile_line.
+        
+        Args:
+            raw: Línea sin el salto de línea final
+            line_number: Número de línea en el archivo
+            
+        Returns:
+            Diccionario con número de línea, oración, éxito y mensaje (ver
+            verdict_result)
+        """
+        if self.non_simple_ascii is None:
+            self.get_bytes_engine()
+        # El autómata de bytes solo conoce la gramática de Little English
+        if self.non_simple_ascii(raw) or self.grammar is not None:
+            return self.compile_line(raw.decode('utf-8'), line_number)
+        
+        words = raw.split()
+        if not words:
+            sentence, verdict = "", EMPTY_LINE_VERDICT
+        else:
+            sentence = raw.strip().decode('ascii')
+            verdict = self.compile_byte_words(words)
+        return verdict_result(line_number, sentence, verdict)
+    
+    def compile_byte_words(self, words: List[bytes]) -> Tuple:
+        """
+        Compila una oración ASCII dada como sus palabras en bytes
+        
+        Args:
+            words: Palabras de la línea (resultado de bytes.split())
+            
+        Returns:
+            Veredicto (éxito, mensaje), o (True, mensaje, forma) con record_shapes
+        """
+        bytes_engine = self.get_bytes_engine()
+        if self.sentence_cache is None:
+            return bytes_engine.compile_bytes_words(words)
+        
+        # Misma clave que compile_sentence, en bytes
+        key = b" ".join(words)
+        cached = self.sentence_cache.get(key)
+        if cached is None:
+            cached = bytes_engine.compile_bytes_words(words)
+            self.sentence_cache.put(key, cached)
+        return cached
+    
+    def get_bytes_engine(self) -> "FusedEngine":
+        """
+        Devuelve el motor de las líneas leídas como bytes, creándolo la primera vez
+        
+        También busca las categorías del léxico externo para el camino
+        clásico (ver search_categories). Al crearlo se carga la búsqueda de
+        los bytes que el motor no compila (NON_SIMPLE_ASCII), que usa
+        compile_raw_line.
+        """
+        if self.bytes_engine is None:
+            from mmap_input import NON_SIMPLE_ASCII
+            self.non_simple_ascii = NON_SIMPLE_ASCII.search
+            self.bytes_engine = self.fused_engine
+            if self.bytes_engine is None:
+                from fused_engine import FusedEngine
+                self.bytes_engine = FusedEngine(self.lexical_analyzer)
+                self.bytes_engine.record_shapes = self.record_shapes
+                if self.profiler is not None:
+                    self.profiler.instrument_fused_engine(self.bytes_engine)
+        return self.bytes_engine
+    
+    def compile_block(self, lines: List[str], first_line_number: int) -> List[Dict]:
+        """
+        Compila un bloque de líneas consecutivas
+        
+        Con el escáner de bloques, todas las líneas se tokenizan en una sola
+        pasada con LexicalAnalyzer.scan_buffer; los resultados son los mismos
+        que los de compile_line.
+        
+        Args:
+            lines: Líneas tal como se leen de un archivo (terminadas en '\n')
+            first_line_number: Número de la primera línea del bloque
+            
+        Returns:
+            Lista de resultados en el orden de las líneas
+        """
+        if self.batch_engine is not None:
+            return self.compile_batch_block(lines, first_line_number)
+        
+        if self.lexer != "scanner":
+            return [self.compile_line(line, line_number)
+                    for line_number, line in enumerate(lines, first_line_number)]
+        
+        results = []
+        scanned_lines = self.lexical_analyzer.scan_buffer("".join(lines), first_line_number)
+        
+        for line, scanned in zip(lines, scanned_lines):
+            sentence = line.strip()
+            
+            if not sentence:
+                verdict = EMPTY_LINE_VERDICT
+            elif self.sentence_cache is None:
+                verdict = self.check_scanned(scanned)
+            else:
+                key = " ".join(sentence.split())
+                verdict = self.sentence_cache.get(key)
+                if verdict is None:
+                    verdict = self.check_scanned(scanned)
+                    self.sentence_cache.put(key, verdict)
+            
+            results.append(verdict_result(scanned.line_number, sentence, verdict))
+        
+        return results
+    
+    def compile_batch(self, lines: List[str], first_line_number: int = 1) -> "BatchResult":
+        """
+        Valida un lote de oraciones con el motor por lotes
+        
+        Todas las oraciones se validan a la vez; los mensajes completos solo
+        se construyen para las rechazadas, con sentence_verdict, que también
+        acepta las que un léxico externo admite con otra categoría. Con
+        record_shapes, también se devuelve la forma de las aceptadas.
+        
+        Args:
+            lines: Oraciones o líneas leídas del archivo de entrada
+            first_line_number: Número de línea de la primera oración
+            
+        Returns:
+            BatchResult con los veredictos, la primera columna rechazada de
+            cada fila, los mensajes de las filas rechazadas y, con
+            record_shapes, las formas de las aceptadas
+        """
+        from batch_engine import BatchEngine, BatchResult
+        
+        if self.batch_engine is None:
+            self.batch_engine = BatchEngine(self.lexical_analyzer)
+            self.batch_engine.record_shapes = self.record_shapes
+            if self.profiler is not None:
+                self.profiler.instrument_batch_engine(self.batch_engine)
+        
+        verdicts = self.batch_engine.compile_batch(lines)
+        accepted, failing_columns, shapes = verdicts
+        messages = {}
+        for row in (~accepted).nonzero()[0].tolist():
+            sentence = lines[row].strip()
+            verdict = self.sentence_verdict(sentence) if sentence else EMPTY_LINE_VERDICT
+            if verdict[0]:
+                # Aceptada con otra categoría de una palabra del léxico externo
+                accepted[row] = True
+                failing_columns[row] = -1
+                if shapes is not None:
+                    shapes[row] = verdict[2]
+            else:
+                messages[row] = verdict[1]
+        return BatchResult(accepted, failing_columns, messages, shapes)
+    
+    def compile_batch_block(self, lines: List[str], first_line_number: int) -> List[Dict]:
+        """Compila un bloque de líneas con compile_batch y arma los resultados del reporte"""
+        batch = self.compile_batch(lines, first_line_number)
+        messages = batch.messages
+        results = [{
+                       'line_number': first_line_number + row,
+                       'sentence': line.strip(),
+                       'success': row not in messages,
+                       'message': messages.get(row, "Compilación exitosa")
+                   }
+                   for row, line in enumerate(lines)]
+        if batch.shapes is not None:
+            for row, shape in batch.shapes.items():
+                results[row]['shape'] = shape
+        return results
+    
+    def check_scanned(self, scanned: ScannedLine) -> Tuple:
+        """Completa la compilación de una línea ya tokenizada por el escáner"""
+        if scanned.error is not None:
+            return False, scanned.error
+        return self.check_syntax(scanned.tokens)
+    
+    def compile_file_streaming(self, input_filename: str, output_filename: str,
+                               workers: int = 1, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                               mmap_input: bool = False,
+                               index: Optional["IncrementalIndex"] = None,
+                               report_format: str = DEFAULT_FORMAT, threads: int = 1,
+                               tree_writer: Optional["TreeWriter"] = None):
+        """
+        Compila un archivo en modo streaming, con memoria constante
+        
+        Las líneas se leen de forma perezosa, se compilan una a una y cada
+        resultado se escribe en el reporte en cuanto se produce. Solo se
+        conservan los contadores de self.stats, por lo que self.results queda
+        vacío; en el reporte de texto las estadísticas generales y el resumen
+        de errores se escriben al final.
+        
+        Args:
+            input_filename: Nombre del archivo de entrada
+            output_filename: Nombre del archivo de salida
+            workers: Cantidad de procesos trabajadores (1 compila en serie)
+            chunk_size: Cantidad de líneas por bloque enviado a cada trabajador
+            mmap_input: Si es True, lee la entrada como bytes con mmap
+            index: Índice de la compilación incremental, o None
+            report_format: Formato del reporte (ver report.py)
+            threads: Cantidad de hilos que comparten este compilador (1 compila en serie)
+            tree_writer: Escritor de los árboles sintácticos, o None (ver add_trees)
+        """
+        self.results = []
+        self.stats = new_stats()
+        
+        try:
+            with open_report(output_filename, report_format, streaming=True) as report:
+                self.stats = report.stats
+                write_result = self.write_result
+                for result in self.compile_input_with_suggestions(
+                        input_filename, workers, chunk_size, mmap_input, index, threads,
+                        tree_writer):
+                    write_result(report, result)
+        
+        except IOError as e:
+            raise IOError(f"Error al procesar el archivo en modo streaming: {str(e)}")
+    
+    def generate_output_file(self, output_filename: str, report_format: str = DEFAULT_FORMAT):
         """
         Genera el archivo de salida con los resultados de la compilación
         
+        Las estadísticas se acumulan en la misma pasada que escribe los
+        resultados.
+        
         Args:
             output_filename: Nombre del archivo de salida
+            report_format: Formato del reporte (ver report.py)
         """
         try:
-            with open(output_filename, 'w', encoding='utf-8') as output_file:
-                # Escribir encabezado
-                output_file.write("REPORTE DE COMPILACIÓN - LITTLE ENGLISH\n")
-                output_file.write("=" * 50 + "\n\n")
-                
-                # Estadísticas generales
-                total_lines = len(self.results)
-                successful_lines = sum(1 for result in self.results if result['success'])
-                failed_lines = total_lines - successful_lines
-                
-                output_file.write(f"ESTADÍSTICAS GENERALES:\n")
-                output_file.write(f"Total de líneas procesadas: {total_lines}\n")
-                output_file.write(f"Compilaciones exitosas: {successful_lines}\n")
-                output_file.write(f"Compilaciones fallidas: {failed_lines}\n")
-                output_file.write(f"Tasa de éxito: {(successful_lines/total_lines)*100:.1f}%\n\n")
-                
-                # Resultados detallados
-                output_file.write("RESULTADOS DETALLADOS:\n")
-                output_file.write("-" * 30 + "\n\n")
-                
-                for result in self.results:
-                    output_file.write(f"Línea {result['line_number']}: ")
-                    
-                    if result['sentence'].strip():
-                        output_file.write(f"'{result['sentence']}'\n")
-                    else:
-                        output_file.write("(línea vacía)\n")
-                    
-                    status = "✓ ÉXITO" if result['success'] else "✗ FALLO"
-                    output_file.write(f"Estado: {status}\n")
-                    
-                    if not result['success']:
-                        output_file.write(f"Error: {result['message']}\n")
-                    
-                    output_file.write("\n")
-                
-                # Resumen de errores
-                if failed_lines > 0:
-                    output_file.write("RESUMEN DE ERRORES:\n")
-                    output_file.write("-" * 20 + "\n")
-                    
-                    lexical_errors = 0
-                    syntax_errors = 0
-                    other_errors = 0
-                    
-                    for result in self.results:
-                        if not result['success']:
-                            if 'léxico' in result['message']:
-                                lexical_errors += 1
-                            elif 'sintáctico' in result['message']:
-                                syntax_errors += 1
-                            else:
-                                other_errors += 1
-                    
-                    output_file.write(f"Errores léxicos: {lexical_errors}\n")
-                    output_file.write(f"Errores sintácticos: {syntax_errors}\n")
-                    output_file.write(f"Otros errores: {other_errors}\n")
+            with open_report(output_filename, report_format) as report:
+                report.write_all(self.results)
+            self.stats = report.stats
         
         except IOError as e:
             raise IOError(f"Error al escribir el archivo de salida: {str(e)}")
+    
+    @staticmethod
+    def write_result(report, result: Dict):
+        """Escribe el resultado de una línea en el reporte y lo cuenta en las estadísticas"""
+        report.write(result)
+
+def serve_stdin(compiler: LittleEnglishCompiler, compile_options: Dict,
+                input_stream: TextIO = None, output_stream: TextIO = None) -> int:
+    """
+    Compila pares de archivos leídos de la entrada estándar con un solo compilador
+    
+    Cada línea de entrada tiene un archivo de entrada y uno de salida
+    separados por un tabulador (o por espacios, si ninguna ruta los
+    contiene). Por cada par se responde una línea JSON con input, output,
+    success y, según el caso, las estadísticas (total, successful) o el
+    error. El proceso, los módulos importados y las cachés del compilador se
+    reutilizan entre pares; los reportes son los mismos que con una
+    ejecución por par.
+    
+    Args:
+        compiler: Compilador a reutilizar
+        compile_options: Argumentos de compile_file para cada par
+        input_stream: Entrada de los pares (por defecto sys.stdin)
+        output_stream: Salida de las respuestas (por defecto sys.stdout)
+        
+    Returns:
+        Cantidad de pares que no se pudieron compilar
+    """
+    import json
+    
+    input_stream = input_stream if input_stream is not None else sys.stdin
+    output_stream = output_stream if output_stream is not None else sys.stdout
+    failures = 0
+    
+    for line in input_stream:
+        line = line.rstrip('\r\n')
+        if not line.strip():
+            continue
+        
+        paths = line.split('\t') if '\t' in line else line.split()
+        if len(paths) != 2:
+            response = {'input': line, 'output': None, 'success': False,
+                        'error': "Se esperaba 'archivo_entrada<TAB>archivo_salida'"}
+        else:
+            input_filename, output_filename = paths
+            response = {'input': input_filename, 'output': output_filename}
+            try:
+                compiler.compile_file(input_filename, output_filename, **compile_options)
+                response.update(success=True, total=compiler.stats['total'],
+                                successful=compiler.stats['successful'])
+            except (OSError, ValueError) as e:
+                response.update(success=False, error=str(e))
+            # El reporte ya tiene los resultados; no se guardan entre pares
+            compiler.results = []
+        
+        if not response['success']:
+            failures += 1
+        output_stream.write(json.dumps(response, ensure_ascii=False) + "\n")
+        output_stream.flush()
+    return failures
 
 def main():
     """Función principal del programa"""
+    import argparse
+    
     # Verificar argumentos de línea de comandos
-    if len(sys.argv) != 3:
-        print("Uso: python main.py <archivo_entrada> <archivo_salida>")
-        print("Ejemplo: python main.py oraciones.txt resultados.txt")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Compilador de oraciones en Little English",
+        epilog="Ejemplo: python main.py oraciones.txt resultados.txt"
+    )
+    parser.add_argument("input_filename", metavar="archivo_entrada", nargs="?")
+    parser.add_argument("output_filename", metavar="archivo_salida", nargs="?")
+    parser.add_argument("--stream", action="store_true",
+                        help="escribe cada resultado al producirse, con memoria constante; "
+                             "las estadísticas van al final del reporte")
+    parser.add_argument("--workers", type=int, default=1, metavar="N",
+                        help="cantidad de procesos trabajadores (por defecto 1, en serie)")
+    parser.add_argument("--threads", type=int, default=1, metavar="N",
+                        help="compila los bloques en un pool de N hilos que comparten el "
+                             "compilador y sus cachés (por defecto 1, en serie); rinde en un "
+                             "intérprete sin GIL")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, metavar="LÍNEAS",
+                        help=f"líneas por bloque enviado a cada trabajador (por defecto {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("--engine", choices=ENGINES, default="classic",
+                        help="classic: analizadores léxico y sintáctico por separado; "
+                             "fused: autómata de una sola pasada (mismos resultados); "
+                             "batch: valida bloques de --chunk-size líneas a la vez con NumPy")
+    parser.add_argument("--lexer", choices=LEXERS, default="split",
+                        help="split: tokeniza línea por línea; scanner: tokeniza bloques de "
+                             "--chunk-size líneas en una sola pasada (solo motor classic)")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE, metavar="N",
+                        help="entradas de la caché LRU de oraciones; 0 la desactiva "
+                             f"(por defecto {DEFAULT_CACHE_SIZE})")
+    parser.add_argument("--shape-cache-size", type=int, default=DEFAULT_SHAPE_CACHE_SIZE, metavar="N",
+                        help="entradas de la caché LRU de formas de oración; 0 la desactiva "
+                             f"(por defecto {DEFAULT_SHAPE_CACHE_SIZE})")
+    parser.add_argument("--profile", default=None, metavar="ARCHIVO",
+                        help="mide el tiempo de cada fase, los tokens por tipo y los "
+                             "errores, y guarda las métricas como JSON en ARCHIVO")
+    parser.add_argument("--incremental", action="store_true",
+                        help="guarda un índice de resultados junto al archivo de salida y, en "
+                             "la siguiente ejecución, solo compila las líneas nuevas o "
+                             "modificadas (mismo reporte)")
+    parser.add_argument("--lexicon", default=None, metavar="ARCHIVO",
+                        help="usa un léxico externo en lugar del vocabulario de Little English: "
+                             "un léxico de texto (se compila a ARCHIVO.lexc) o uno ya compilado "
+                             "con lexicon.py")
+    parser.add_argument("--grammar", default=None, metavar="ARCHIVO",
+                        help="usa una gramática BNF (formato del README) compilada a una tabla "
+                             "LL(1); solo con --engine classic")
+    parser.add_argument("--format", choices=REPORT_FORMATS, default=DEFAULT_FORMAT,
+                        dest="report_format",
+                        help="formato del reporte: text (legible), jsonl (un objeto JSON por "
+                             "línea) o csv (por defecto text)")
+    parser.add_argument("--mmap", action="store_true",
+                        help="lee la entrada con mmap y analiza las líneas ASCII como bytes, "
+                             "sin decodificar el archivo completo (mismos resultados)")
+    parser.add_argument("--suggest", type=int, default=0, metavar="K",
+                        help="agrega al mensaje de cada token no reconocido las K palabras "
+                             "más parecidas del vocabulario (por defecto 0, ninguna)")
+    parser.add_argument("--trees", default=None, metavar="ARCHIVO",
+                        help="exporta a ARCHIVO el árbol sintáctico de cada oración correcta "
+                             "(no se combina con --grammar)")
+    parser.add_argument("--tree-format", choices=("jsonl", "binary"), default="jsonl",
+                        help="formato de --trees: jsonl (un objeto JSON por árbol) o binary "
+                             "(ver parse_tree.py; por defecto jsonl)")
+    parser.add_argument("--serve-stdin", action="store_true",
+                        help="en lugar de un par de archivos, lee de la entrada estándar una "
+                             "línea 'archivo_entrada<TAB>archivo_salida' por compilación y "
+                             "responde una línea JSON por cada una, con un solo proceso y "
+                             "compilador para todas")
+    args = parser.parse_args()
     
-    input_filename = sys.argv[1]
-    output_filename = sys.argv[2]
+    if args.serve_stdin:
+        if args.input_filename or args.output_filename:
+            parser.error("--serve-stdin lee los archivos de la entrada estándar")
+    elif not args.output_filename:
+        parser.error("se requieren archivo_entrada y archivo_salida")
+    if args.workers < 1 or args.chunk_size < 1 or args.threads < 1:
+        parser.error("--workers, --threads y --chunk-size deben ser al menos 1")
+    if args.threads > 1 and (args.workers > 1 or args.incremental or args.profile):
+        parser.error("--threads no se combina con --workers, --incremental ni --profile")
+    if args.lexer == "scanner" and args.engine != "classic":
+        parser.error("--lexer scanner solo se usa con --engine classic")
+    if args.grammar and args.engine != "classic":
+        parser.error("--grammar solo se usa con --engine classic")
+    if args.grammar and not os.path.isfile(args.grammar):
+        parser.error(f"no se encontró la gramática '{args.grammar}'")
+    if args.cache_size < 0 or args.shape_cache_size < 0:
+        parser.error("los tamaños de caché no pueden ser negativos")
+    if args.suggest < 0:
+        parser.error("--suggest no puede ser negativo")
+    if args.trees and args.grammar:
+        parser.error("--trees no se combina con --grammar")
+    if args.trees and args.serve_stdin:
+        parser.error("--trees no se combina con --serve-stdin")
+    if args.incremental and (args.workers > 1 or args.mmap):
+        parser.error("--incremental no se combina con --workers ni con --mmap")
+    
+    input_filename = args.input_filename
+    output_filename = args.output_filename
     
     # Crear compilador e iniciar procesamiento
-    compiler = LittleEnglishCompiler()
+    profiler = None
+    if args.profile:
+        from instrumentation import Profiler
+        profiler = Profiler()
+    try:
+        compiler = LittleEnglishCompiler(engine=args.engine, lexer=args.lexer,
+                                         cache_size=args.cache_size,
+                                         shape_cache_size=args.shape_cache_size,
+                                         profiler=profiler,
+                                         lexicon=args.lexicon, grammar=args.grammar,
+                                         suggest=args.suggest)
+    except ImportError as e:
+        parser.error(str(e))
+    except (OSError, ValueError) as e:
+        from grammar import GrammarError
+        if isinstance(e, GrammarError):
+            parser.error(f"gramática inválida: {e}")
+        parser.error(f"no se pudo cargar el léxico: {e}")
+    
+    compile_options = {
+        'streaming': args.stream,
+        'workers': args.workers,
+        'chunk_size': args.chunk_size,
+        'mmap_input': args.mmap,
+        'incremental': args.incremental,
+        'report_format': args.report_format,
+        'threads': args.threads
+    }
+    if args.serve_stdin:
+        failures = serve_stdin(compiler, compile_options)
+        if compiler.profiler is not None:
+            compiler.profiler.write_json(args.profile)
+        sys.exit(1 if failures else 0)
     
     try:
         print(f"Iniciando compilación de '{input_filename}'...")
-        compiler.compile_file(input_filename, output_filename)
+        compiler.compile_file(input_filename, output_filename, trees=args.trees,
+                              tree_format=args.tree_format, **compile_options)
         print(f"Compilación completada. Resultados guardados en '{output_filename}'")
+        if args.trees:
+            print(f"Árboles sintácticos: {compiler.tree_count} guardados en '{args.trees}'")
         
         # Mostrar estadísticas básicas en consola
-        total = len(compiler.results)
-        successful = sum(1 for r in compiler.results if r['success'])
+        total = compiler.stats['total']
+        successful = compiler.stats['successful']
         print(f"\nEstadísticas: {successful}/{total} oraciones compiladas exitosamente")
         
+        cache_labels = {'sentence': "oraciones", 'shape': "formas"}
+        for name, counters in compiler.cache_counters().items():
+            lookups = counters['hits'] + counters['misses']
+            hit_rate = (counters['hits'] / lookups) * 100 if lookups else 0.0
+            print(f"Caché de {cache_labels[name]}: {counters['hits']} aciertos, "
+                  f"{counters['misses']} fallos, {counters['evictions']} desalojos "
+                  f"({hit_rate:.1f}% de aciertos)")
+        
+        index = compiler.incremental_index
+        if index is not None:
+            from incremental import index_filename
+            print(f"Compilación incremental: {index.reused} líneas reutilizadas, "
+                  f"{index.compiled} compiladas ('{index_filename(output_filename)}')")
+        
+        if compiler.profiler is not None:
+            compiler.profiler.write_json(args.profile)
+            for phase, metrics in sorted(compiler.profiler.phases.items()):
+                print(f"Fase {phase}: {metrics.calls} llamadas, {metrics.total_seconds:.3f} s")
+            if compiler.profiler.errors:
+                print(f"Errores devueltos: {sum(compiler.profiler.errors.values())} "
+                      f"(por fase y código en '{args.profile}')")
+            print(f"Métricas guardadas en '{args.profile}'")
+        
     except FileNotFoundError as e:
         print(f"Error: {e}")
         sys.exit(1)
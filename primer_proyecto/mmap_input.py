@@ -0,0 +1,107 @@
+"""
+Entrada Mapeada en Memoria para Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Lee el archivo de entrada con mmap en lugar de decodificarlo completo a str.
+Los límites de línea se buscan directamente en los bytes y, como todo el
+vocabulario de Little English es ASCII, las palabras se buscan como bytes;
+solo el texto que aparece en el reporte se decodifica. Varios procesos
+trabajadores pueden mapear el mismo archivo y compartir sus páginas sin
+copiar los datos entre procesos.
+
+Las líneas se separan únicamente por b'\\n' (un '\\r' final se elimina al
+recortar la línea).
+"""
+
+import mmap
+import os
+import re
+from contextlib import contextmanager
+from typing import Iterator, Tuple, Union
+
+# Bytes fuera de ASCII imprimible y de los espacios que bytes.split() reconoce;
+# una línea que los contenga se decodifica y se compila por el camino de str
+NON_SIMPLE_ASCII = re.compile(rb'[^\t\x0b\x0c\r\x20-\x7e]')
+
+def map_file(filename: str) -> Union[mmap.mmap, bytes]:
+    """
+    Mapea un archivo en memoria en modo de solo lectura
+    
+    El mapeo conserva su propio descriptor, así que el archivo se puede
+    cerrar en cuanto se crea.
+    
+    Args:
+        filename: Nombre del archivo
+        
+    Returns:
+        El mapeo del archivo, o b'' si el archivo está vacío (mmap no admite
+        archivos de tamaño cero)
+    """
+    with open(filename, 'rb') as input_file:
+        if os.fstat(input_file.fileno()).st_size == 0:
+            return b''
+        return mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+@contextmanager
+def mapped_file(filename: str) -> Iterator[Union[mmap.mmap, bytes]]:
+    """Contexto que mapea un archivo con map_file() y cierra el mapeo al salir"""
+    buffer = map_file(filename)
+    try:
+        yield buffer
+    finally:
+        if isinstance(buffer, mmap.mmap):
+            buffer.close()
+
+def iter_lines(buffer: Union[mmap.mmap, bytes], start: int = 0, end: int = None) -> Iterator[bytes]:
+    """
+    Recorre las líneas de un rango del mapeo, sin el salto de línea final
+    
+    Args:
+        buffer: Mapeo del archivo
+        start: Desplazamiento donde empieza la primera línea
+        end: Desplazamiento donde termina el rango (por defecto, el final)
+        
+    Returns:
+        Iterador de líneas como bytes
+    """
+    if end is None:
+        end = len(buffer)
+    
+    find = buffer.find
+    position = start
+    while position < end:
+        newline = find(b'\n', position, end)
+        if newline < 0:
+            yield buffer[position:end]
+            return
+        yield buffer[position:newline]
+        position = newline + 1
+
+def line_chunks(buffer: Union[mmap.mmap, bytes], chunk_size: int) -> Iterator[Tuple[int, int, int]]:
+    """
+    Divide el mapeo en rangos de chunk_size líneas
+    
+    Args:
+        buffer: Mapeo del archivo
+        chunk_size: Cantidad de líneas por rango
+        
+    Returns:
+        Iterador de tuplas (número de la primera línea, inicio, fin)
+    """
+    if chunk_size < 1:
+        raise ValueError("El tamaño de bloque debe ser al menos 1")
+    
+    find = buffer.find
+    size = len(buffer)
+    line_number = 1
+    start = 0
+    while start < size:
+        end = start
+        lines = 0
+        while lines < chunk_size and end < size:
+            newline = find(b'\n', end)
+            end = size if newline < 0 else newline + 1
+            lines += 1
+        yield line_number, start, end
+        line_number += lines
+        start = end
@@ -0,0 +1,288 @@
+"""
+Compilación Paralela para Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Reparte las líneas de entrada en bloques entre un pool de procesos. Cada
+proceso trabajador construye su propio compilador (y con él sus analizadores
+léxico y sintáctico) una sola vez, y los resultados se devuelven en el mismo
+orden de las líneas de entrada, de modo que el reporte es idéntico al serial.
+
+Con hilos, los bloques se reparten en un pool de hilos compartido entre
+compilaciones y todos los hilos usan el mismo compilador: sus cachés se
+protegen con un candado mientras dura la compilación y cada bloque se analiza con una copia del
+compilador que tiene su propio estado de análisis sintáctico (ver
+LittleEnglishCompiler.fork). Con el GIL los hilos se turnan para ejecutar
+Python; en un intérprete sin GIL (free-threaded) compilan a la vez.
+"""
+
+import mmap
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from mmap_input import iter_lines, line_chunks, map_file, mapped_file
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, ThreadPoolExecutor
+    from main import LittleEnglishCompiler
+
+# Compilador propio de cada proceso trabajador (se crea en _init_worker)
+_worker_compiler = None
+
+# Mapeo del archivo de entrada en el trabajador: (archivo, mapeo)
+_worker_mapping = None
+
+# Pool de hilos compartido: (cantidad de hilos, ThreadPoolExecutor), o None
+_thread_pool = None
+
+def _init_worker(compiler_options: Optional[Dict]):
+    """Inicializa el compilador del proceso trabajador"""
+    global _worker_compiler
+    from main import LittleEnglishCompiler
+    _worker_compiler = LittleEnglishCompiler(**(compiler_options or {}))
+
+def _compile_chunk(chunk: Tuple[int, List[str]]) -> Tuple[List[Dict], Dict]:
+    """
+    Compila un bloque de líneas dentro de un proceso trabajador
+    
+    Args:
+        chunk: Tupla con (número de la primera línea, líneas del bloque)
+        
+    Returns:
+        Tupla con (resultados en el orden de las líneas, contadores de caché
+        y métricas acumulados desde el bloque anterior)
+    """
+    first_line_number, lines = chunk
+    results = _worker_compiler.compile_block(lines, first_line_number)
+    return results, _worker_compiler.take_worker_counters()
+
+def _compile_mapped_chunk(chunk: Tuple[str, int, int, int]) -> Tuple[List[Dict], Dict]:
+    """
+    Compila un rango de bytes del archivo de entrada dentro de un trabajador
+    
+    El trabajador conserva el mapeo del archivo entre bloques.
+    
+    Args:
+        chunk: Tupla con (archivo, número de la primera línea, inicio, fin)
+        
+    Returns:
+        Tupla con (resultados en el orden de las líneas, contadores de caché y métricas)
+    """
+    global _worker_mapping
+    filename, first_line_number, start, end = chunk
+    
+    if _worker_mapping is None or _worker_mapping[0] != filename:
+        # El mapeo del archivo anterior se cierra para liberar su descriptor
+        if _worker_mapping is not None and isinstance(_worker_mapping[1], mmap.mmap):
+            _worker_mapping[1].close()
+        _worker_mapping = (filename, map_file(filename))
+    buffer = _worker_mapping[1]
+    
+    results = [_worker_compiler.compile_raw_line(raw, line_number)
+               for line_number, raw in enumerate(iter_lines(buffer, start, end), first_line_number)]
+    return results, _worker_compiler.take_worker_counters()
+
+def compile_chunks_parallel(chunks: Iterable[Tuple[int, List[str]]], workers: int,
+                            compiler_options: Optional[Dict] = None,
+                            on_counters: Optional[Callable[[Dict], None]] = None) -> Iterator[Dict]:
+    """
+    Compila bloques de líneas en un pool de procesos y entrega los resultados en orden
+    
+    Solo se mantienen en vuelo unos pocos bloques por trabajador, así que la
+    entrada se sigue leyendo de forma perezosa y la memoria no crece con el
+    tamaño del archivo.
+    
+    Args:
+        chunks: Tuplas (número de la primera línea, líneas del bloque), como
+            las de split_chunks en main.py
+        workers: Cantidad de procesos trabajadores
+        compiler_options: Argumentos para el LittleEnglishCompiler de cada trabajador
+        on_counters: Función que recibe los contadores de caché y las métricas de cada bloque
+        
+    Returns:
+        Iterador de resultados en el orden de las líneas de entrada
+    """
+    return run_ordered(_compile_chunk, chunks, workers,
+                       compiler_options, on_counters)
+
+def compile_mapped_parallel(input_filename: str, workers: int, chunk_size: int,
+                            compiler_options: Optional[Dict] = None,
+                            on_counters: Optional[Callable[[Dict], None]] = None) -> Iterator[Dict]:
+    """
+    Compila un archivo mapeado en memoria en un pool de procesos
+    
+    El proceso principal solo busca los límites de los bloques en su mapeo;
+    a cada trabajador se le envía el rango de bytes y el trabajador lo lee de
+    su propio mapeo del mismo archivo, sin copiar las líneas entre procesos.
+    
+    Args:
+        input_filename: Nombre del archivo de entrada
+        workers: Cantidad de procesos trabajadores
+        chunk_size: Cantidad de líneas por bloque
+        compiler_options: Argumentos para el LittleEnglishCompiler de cada trabajador
+        on_counters: Función que recibe los contadores de caché y las métricas de cada bloque
+        
+    Returns:
+        Iterador de resultados en el orden de las líneas de entrada
+    """
+    with mapped_file(input_filename) as buffer:
+        chunks = ((input_filename, first_line_number, start, end)
+                  for first_line_number, start, end in line_chunks(buffer, chunk_size))
+        yield from run_ordered(_compile_mapped_chunk, chunks, workers,
+                               compiler_options, on_counters)
+
+def run_ordered(task: Callable, chunks: Iterable, workers: int,
+                compiler_options: Optional[Dict] = None,
+                on_counters: Optional[Callable[[Dict], None]] = None) -> Iterator[Dict]:
+    """
+    Ejecuta una tarea por bloque en el pool y entrega los resultados en orden
+    
+    Args:
+        task: Función del trabajador que devuelve (resultados, contadores)
+        chunks: Bloques a compilar, consumidos de forma perezosa
+        workers: Cantidad de procesos trabajadores
+        compiler_options: Argumentos para el LittleEnglishCompiler de cada trabajador
+        on_counters: Función que recibe los contadores de caché y las métricas de cada bloque
+        
+    Returns:
+        Iterador de resultados en el orden de los bloques
+    """
+    if workers < 1:
+        raise ValueError("La cantidad de trabajadores debe ser al menos 1")
+    
+    # Se importa al usarse: multiprocessing es lo más caro del arranque
+    from concurrent.futures import ProcessPoolExecutor
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(compiler_options,)) as executor:
+        for results, counters in submit_ordered(executor, task, chunks, workers * 2):
+            if on_counters is not None:
+                on_counters(counters)
+            yield from results
+
+def submit_ordered(executor: "Executor", task: Callable, chunks: Iterable,
+                   max_pending: int) -> Iterator:
+    """
+    Envía un bloque tras otro al ejecutor y entrega sus resultados en orden
+    
+    Solo max_pending bloques quedan en vuelo. Si el iterador se cierra antes
+    de terminar, los bloques pendientes se cancelan y se espera a los que ya
+    estaban en ejecución.
+    
+    Args:
+        executor: Pool de procesos o de hilos
+        task: Función que compila un bloque
+        chunks: Bloques a compilar, consumidos de forma perezosa
+        max_pending: Cantidad máxima de bloques en vuelo
+        
+    Returns:
+        Iterador con el resultado de task para cada bloque, en orden
+    """
+    pending = deque()
+    try:
+        for chunk in chunks:
+            pending.append(executor.submit(task, chunk))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        for future in pending:
+            if not future.cancelled():
+                future.exception()
+
+def get_thread_pool(threads: int) -> "ThreadPoolExecutor":
+    """
+    Devuelve el pool de hilos compartido, creándolo al primer uso
+    
+    El pool se reutiliza entre compilaciones (por ejemplo, con
+    --serve-stdin); si se pide otra cantidad de hilos, se reemplaza.
+    
+    Args:
+        threads: Cantidad de hilos del pool
+        
+    Returns:
+        ThreadPoolExecutor con esa cantidad de hilos
+    """
+    global _thread_pool
+    if threads < 1:
+        raise ValueError("La cantidad de hilos debe ser al menos 1")
+    
+    from concurrent.futures import ThreadPoolExecutor
+    
+    if _thread_pool is None or _thread_pool[0] != threads:
+        if _thread_pool is not None:
+            _thread_pool[1].shutdown()
+        _thread_pool = (threads, ThreadPoolExecutor(max_workers=threads,
+                                                    thread_name_prefix="little-english"))
+    return _thread_pool[1]
+
+def compile_chunks_threaded(compiler: "LittleEnglishCompiler",
+                            chunks: Iterable[Tuple[int, List[str]]],
+                            threads: int) -> Iterator[Dict]:
+    """
+    Compila bloques de líneas en el pool de hilos compartido y entrega los resultados en orden
+    
+    Args:
+        compiler: Compilador compartido por todos los hilos
+        chunks: Tuplas (número de la primera línea, líneas del bloque)
+        threads: Cantidad de hilos
+        
+    Returns:
+        Iterador de resultados en el orden de las líneas de entrada
+    """
+    executor = get_thread_pool(threads)
+    compiler.share_caches()
+    
+    def compile_chunk(chunk: Tuple[int, List[str]]) -> List[Dict]:
+        first_line_number, chunk_lines = chunk
+        return compiler.fork().compile_block(chunk_lines, first_line_number)
+    
+    ordered = submit_ordered(executor, compile_chunk, chunks, threads * 2)
+    try:
+        for results in ordered:
+            yield from results
+    finally:
+        # Los bloques en ejecución terminan antes de quitar el candado
+        ordered.close()
+        compiler.unshare_caches()
+
+def compile_mapped_threaded(compiler: "LittleEnglishCompiler", input_filename: str,
+                            threads: int, chunk_size: int) -> Iterator[Dict]:
+    """
+    Compila un archivo mapeado en memoria en el pool de hilos compartido
+    
+    A diferencia de los procesos, todos los hilos leen del mismo mapeo.
+    
+    Args:
+        compiler: Compilador compartido por todos los hilos
+        input_filename: Nombre del archivo de entrada
+        threads: Cantidad de hilos
+        chunk_size: Cantidad de líneas por bloque
+        
+    Returns:
+        Iterador de resultados en el orden de las líneas de entrada
+    """
+    executor = get_thread_pool(threads)
+    compiler.share_caches()
+    compiler.get_bytes_engine()
+    
+    with mapped_file(input_filename) as buffer:
+        def compile_range(chunk: Tuple[int, int, int]) -> List[Dict]:
+            first_line_number, start, end = chunk
+            worker = compiler.fork()
+            return [worker.compile_raw_line(raw, line_number)
+                    for line_number, raw in enumerate(iter_lines(buffer, start, end),
+                                                      first_line_number)]
+        
+        ordered = submit_ordered(executor, compile_range, line_chunks(buffer, chunk_size),
+                                 threads * 2)
+        try:
+            for results in ordered:
+                yield from results
+        finally:
+            # Los bloques en ejecución terminan antes de quitar el candado
+            ordered.close()
+            compiler.unshare_caches()
@@ -0,0 +1,524 @@
+"""
+Árboles Sintácticos de Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Guarda el árbol sintáctico de las oraciones aceptadas como arreglos enteros
+paralelos en un arena que se reutiliza entre oraciones, en lugar de un objeto
+de Python por nodo. Cada nodo es una frase de la gramática:
+
+    kind     tipo de frase (SENTENCE, NOUN_PHRASE, VERB_PHRASE o PREP_PHRASE)
+    parent   índice del nodo padre dentro de su árbol (-1 en la raíz)
+    start    primer token de la frase
+    end      token siguiente al último de la frase
+
+Los tokens son las hojas y no se guardan como nodos: el arena guarda el tipo
+de cada token, y el token i pertenece a la frase más interna que lo cubre.
+
+Como el análisis es LL(1) y determinista, el árbol de una oración depende solo
+de su forma (la secuencia de tipos de token). El primer árbol de cada forma se
+registra durante el análisis descendente y queda como plantilla del arena; de
+cada árbol el arena guarda solo el número de línea y el índice de su
+plantilla, así que las oraciones siguientes con esa forma no se vuelven a
+analizar ni copian sus nodos.
+
+Los árboles se exportan por bloques a JSONL (un objeto por árbol) o a un
+formato binario: una secuencia de bloques, cada uno con
+
+    encabezado   'TREE', versión, cantidad de árboles, de plantillas, de
+                 nodos y de tokens de las plantillas
+    líneas       un entero de 32 bits por árbol: número de línea
+    plantillas   un entero de 32 bits por árbol: índice de su plantilla
+    nodos        plantillas + 1 enteros de 32 bits: primer nodo de cada plantilla
+    tokens       plantillas + 1 enteros de 32 bits: primer token de cada plantilla
+    kind         un byte por nodo
+    parent       un entero de 32 bits con signo por nodo
+    start, end   un entero de 32 bits con signo por nodo, cada uno
+    tipos        un byte por token: código del tipo de token
+
+Cada bloque repite las plantillas del arena (una por forma aceptada).
+
+Los enteros se guardan en little-endian.
+
+Uso: python parse_tree.py "the cat runs in the house." [...]
+"""
+
+import struct
+import sys
+from array import array
+from itertools import accumulate
+from typing import BinaryIO, Dict, Iterator, List, NamedTuple, Optional, Sequence, TextIO, Union
+
+from lexical_analyzer import Token, TokenStream, TOKEN_TYPE_IDS
+from syntax_analyzer import ACCEPTED, ParseResult, SyntaxAnalyzer, TYPE_NAMES
+
+# Tipos de nodo: las frases de la gramática
+SENTENCE = 0
+NOUN_PHRASE = 1
+VERB_PHRASE = 2
+PREP_PHRASE = 3
+
+# Nombre de cada tipo de nodo (los no terminales de la gramática)
+NODE_KINDS = ("sentence", "noun_phrase", "verb_phrase", "prep_phrase")
+
+# Formatos de exportación
+TREE_FORMATS = ("jsonl", "binary")
+
+# Encabezado de cada bloque binario: firma, versión, cantidad de árboles, de
+# plantillas, de nodos y de tokens
+MAGIC = b"TREE"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<4sHIIII")
+
+# Árboles por bloque al exportar un archivo completo
+DEFAULT_TREES_PER_BLOCK = 10000
+
+class Template(NamedTuple):
+    """Árbol de una forma de oración, como columnas"""
+    token_types: array  # 'B': código de tipo de cada token
+    kinds: array        # 'B': tipo de cada nodo
+    parents: array      # 'i'
+    starts: array       # 'i'
+    ends: array         # 'i'
+
+class Node(NamedTuple):
+    """Nodo de un árbol, para leerlo fuera del arena"""
+    kind: str
+    parent: int
+    start: int
+    end: int
+
+class ParseTree(NamedTuple):
+    """Árbol de una oración copiado del arena"""
+    line_number: int
+    token_types: List[str]
+    nodes: List[Node]
+    
+    def to_dict(self) -> Dict:
+        """Árbol como diccionario con las columnas del arena (el objeto de JSONL)"""
+        return {
+            'line_number': self.line_number,
+            'token_types': self.token_types,
+            'kind': [node.kind for node in self.nodes],
+            'parent': [node.parent for node in self.nodes],
+            'start': [node.start for node in self.nodes],
+            'end': [node.end for node in self.nodes]
+        }
+
+def reserve(column: array, size: int) -> array:
+    """Agranda una columna del arena al doble hasta que tenga al menos size elementos"""
+    while len(column) < size:
+        # El contenido agregado no importa: se sobrescribe antes de leerse
+        column.frombytes(bytes(max(len(column), 1) * column.itemsize))
+    return column
+
+def shape_tokens(shape: bytes) -> TokenStream:
+    """Tokens sin texto con los tipos de una forma, para analizar solo la forma"""
+    return TokenStream("", array('B', shape), array('I', bytes(8 * len(shape))))
+
+class ParseTreeArena:
+    """
+    Árboles de muchas oraciones en arreglos paralelos
+    
+    Los nodos de cada forma se guardan una vez, en templates; por árbol
+    solo se guardan el número de línea y el índice de su plantilla. Esas dos
+    columnas se reservan de antemano y crecen al doble cuando no alcanzan;
+    reset() solo pone el contador en cero y conserva las plantillas, así
+    que llenar el arena otra vez no pide memoria nueva.
+    """
+    
+    def __init__(self, capacity: int = 1024):
+        """
+        Args:
+            capacity: Árboles reservados al inicio
+        """
+        self.line_numbers = array('I', [0]) * capacity
+        self.tree_templates = array('I', [0]) * capacity
+        self.tree_count = 0
+        # Plantillas y su índice por forma (los bytes de token_types)
+        self.templates: List[Template] = []
+        self.template_ids: Dict[bytes, int] = {}
+    
+    def __len__(self) -> int:
+        return self.tree_count
+    
+    def reset(self):
+        """Vacía el arena conservando la memoria reservada y las plantillas"""
+        self.tree_count = 0
+    
+    def add_template(self, template: Template) -> int:
+        """Agrega la plantilla de una forma, si no estaba, y devuelve su índice"""
+        shape = template.token_types.tobytes()
+        template_id = self.template_ids.get(shape)
+        if template_id is None:
+            template_id = self.template_ids[shape] = len(self.templates)
+            self.templates.append(template)
+        return template_id
+    
+    def add_tree(self, line_number: int, template_id: int):
+        """
+        Agrega un árbol como referencia a una plantilla
+        
+        Args:
+            line_number: Número de línea de la oración
+            template_id: Índice de la plantilla de su forma (ver add_template)
+        """
+        tree = self.tree_count
+        if tree >= len(self.line_numbers):
+            reserve(self.line_numbers, tree + 1)
+            reserve(self.tree_templates, tree + 1)
+        self.line_numbers[tree] = line_number
+        self.tree_templates[tree] = template_id
+        self.tree_count = tree + 1
+    
+    def add_trees(self, line_numbers: Sequence[int], template_ids: Sequence[int]):
+        """Agrega varios árboles de una vez, con una copia por columna (ver add_tree)"""
+        first = self.tree_count
+        end = first + len(line_numbers)
+        if end > len(self.line_numbers):
+            reserve(self.line_numbers, end)
+            reserve(self.tree_templates, end)
+        self.line_numbers[first:end] = array('I', line_numbers)
+        self.tree_templates[first:end] = array('I', template_ids)
+        self.tree_count = end
+    
+    def template_tree(self, template_id: int, line_number: int) -> ParseTree:
+        """Copia una plantilla fuera del arena como el árbol de una línea"""
+        template = self.templates[template_id]
+        return ParseTree(
+            line_number,
+            [TYPE_NAMES[code] for code in template.token_types],
+            [Node(NODE_KINDS[kind], parent, start, end)
+             for kind, parent, start, end in zip(template.kinds, template.parents,
+                                                  template.starts, template.ends)])
+    
+    def tree(self, index: int) -> ParseTree:
+        """Copia el árbol de la posición index fuera del arena"""
+        if not 0 <= index < self.tree_count:
+            raise IndexError(index)
+        return self.template_tree(self.tree_templates[index], self.line_numbers[index])
+    
+    def __iter__(self) -> Iterator[ParseTree]:
+        for index in range(self.tree_count):
+            yield self.tree(index)
+
+class RecordingAnalyzer(SyntaxAnalyzer):
+    """
+    SyntaxAnalyzer que registra un nodo por cada frase que analiza
+    
+    Cada regla abre su nodo, delega en la regla de SyntaxAnalyzer y cierra el
+    nodo con la posición a la que llegó, así que la gramática se mantiene en
+    un solo lugar. Los nodos quedan en columnas propias y template() los
+    devuelve como plantilla.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.kinds = array('B')
+        self.parents = array('i')
+        self.starts = array('i')
+        self.ends = array('i')
+        self.parent = -1
+    
+    def check(self, tokens: Union[List[Token], TokenStream],
+              collect_all: bool = False) -> ParseResult:
+        for column in (self.kinds, self.parents, self.starts, self.ends):
+            del column[:]
+        self.parent = -1
+        return super().check(tokens, collect_all)
+    
+    def fork(self) -> "RecordingAnalyzer":
+        """Copia con su propio estado de análisis y sus propias columnas de nodos"""
+        clone = super().fork()
+        clone.kinds, clone.parents, clone.starts, clone.ends = (
+            array('B'), array('i'), array('i'), array('i'))
+        return clone
+    
+    def template(self, shape: bytes) -> Template:
+        """Plantilla de la forma analizada, con una copia de los nodos registrados"""
+        return Template(array('B', shape), array('B', self.kinds), array('i', self.parents),
+                        array('i', self.starts), array('i', self.ends))
+    
+    def open_node(self, kind: int) -> int:
+        """Registra un nodo que empieza en el token actual, hijo de self.parent"""
+        node = len(self.kinds)
+        self.kinds.append(kind)
+        self.parents.append(self.parent)
+        self.starts.append(self.current_token_index)
+        self.ends.append(self.current_token_index)
+        return node
+    
+    def parse_phrase(self, kind: int, rule) -> bool:
+        """Analiza una frase con la regla de SyntaxAnalyzer dentro de su nodo"""
+        parent = self.parent
+        node = self.parent = self.open_node(kind)
+        accepted = rule(self)
+        self.ends[node] = self.current_token_index
+        self.parent = parent
+        return accepted
+    
+    def parse_sentence(self) -> bool:
+        return self.parse_phrase(SENTENCE, SyntaxAnalyzer.parse_sentence)
+    
+    def parse_noun_phrase(self) -> bool:
+        return self.parse_phrase(NOUN_PHRASE, SyntaxAnalyzer.parse_noun_phrase)
+    
+    def parse_verb_phrase(self) -> bool:
+        return self.parse_phrase(VERB_PHRASE, SyntaxAnalyzer.parse_verb_phrase)
+    
+    def parse_prep_phrase(self) -> bool:
+        return self.parse_phrase(PREP_PHRASE, SyntaxAnalyzer.parse_prep_phrase)
+
+class ParseTreeBuilder:
+    """
+    Valida oraciones y guarda el árbol de las aceptadas en un arena
+    
+    Las plantillas se guardan en el arena por forma de oración; con la
+    gramática de Little English hay pocas formas aceptadas (diez), así que
+    no necesitan límite. En build(), una forma sin plantilla se valida con
+    SyntaxAnalyzer y solo se vuelve a analizar con RecordingAnalyzer si es
+    aceptada, así que las oraciones rechazadas cuestan lo mismo que
+    validarlas. add() agrega el árbol de una oración que el compilador ya
+    aceptó, a partir de la forma que produjo al compilarla.
+    """
+    
+    def __init__(self, arena: Optional[ParseTreeArena] = None):
+        self.arena = arena if arena is not None else ParseTreeArena()
+        self.analyzer = SyntaxAnalyzer()
+        self.recorder = RecordingAnalyzer()
+    
+    def build(self, tokens: Union[List[Token], TokenStream], line_number: int = 0) -> ParseResult:
+        """
+        Analiza una oración y, si es correcta, agrega su árbol al arena
+        
+        Args:
+            tokens: Lista de tokens o TokenStream del análisis léxico
+            line_number: Número de línea que se guarda con el árbol
+            
+        Returns:
+            El mismo ParseResult que SyntaxAnalyzer.check
+        """
+        if isinstance(tokens, TokenStream):
+            shape = tokens.shape()
+        else:
+            shape = bytes(TOKEN_TYPE_IDS[token.type] for token in tokens)
+        template_id = self.arena.template_ids.get(shape)
+        if template_id is None:
+            result = self.analyzer.check(tokens)
+            if not result.accepted:
+                return result
+            template_id = self.record(tokens, shape)
+        self.arena.add_tree(line_number, template_id)
+        return ACCEPTED
+    
+    def add(self, shape: bytes, line_number: int = 0):
+        """
+        Agrega al arena el árbol de una oración aceptada, dada su forma
+        
+        Args:
+            shape: Código de tipo de cada token, como bytes
+            line_number: Número de línea que se guarda con el árbol
+            
+        Raises:
+            ValueError: Si la gramática no acepta la forma
+        """
+        self.arena.add_tree(line_number, self.template_id(shape))
+    
+    def template_id(self, shape: bytes) -> int:
+        """
+        Índice en el arena de la plantilla de una forma aceptada
+        
+        Si la forma no tiene plantilla, se analiza sola (sin el texto de la
+        oración) y se registra.
+        
+        Raises:
+            ValueError: Si la gramática no acepta la forma
+        """
+        template_id = self.arena.template_ids.get(shape)
+        if template_id is None:
+            template_id = self.record(shape_tokens(shape), shape)
+        return template_id
+    
+    def record(self, tokens: Union[List[Token], TokenStream], shape: bytes) -> int:
+        """Registra los nodos de una forma como plantilla del arena y devuelve su índice"""
+        if not self.recorder.check(tokens).accepted:
+            raise ValueError("La forma de la oración no es aceptada por la gramática")
+        return self.arena.add_template(self.recorder.template(shape))
+
+class TreeWriter:
+    """
+    Exporta los árboles de un arena por bloques
+    
+    Se usa como administrador de contexto; cada write() vuelca los árboles
+    del arena y el llamador lo vacía con reset() para el siguiente bloque.
+    Todos los bloques deben venir del mismo arena: el JSONL de cada
+    plantilla se codifica una vez y se reutiliza.
+    """
+    
+    def __init__(self, output_filename: str, tree_format: str = "jsonl"):
+        """
+        Raises:
+            ValueError: Si el formato no existe
+        """
+        if tree_format not in TREE_FORMATS:
+            raise ValueError(f"Formato de árboles desconocido: '{tree_format}'")
+        self.tree_format = tree_format
+        if tree_format == "jsonl":
+            self.output_file = open(output_filename, 'w', encoding='utf-8')
+        else:
+            self.output_file = open(output_filename, 'wb')
+        self.json_tails: List[str] = []
+        self.count = 0
+    
+    def __enter__(self) -> "TreeWriter":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Cierra el archivo de árboles"""
+        self.output_file.close()
+    
+    def write(self, arena: ParseTreeArena):
+        """Escribe todos los árboles del arena"""
+        if self.tree_format == "jsonl":
+            write_jsonl(arena, self.output_file, self.json_tails)
+        else:
+            write_binary(arena, self.output_file)
+        self.count += len(arena)
+
+def write_jsonl(arena: ParseTreeArena, output_file: TextIO, tails: Optional[List[str]] = None):
+    """
+    Escribe un objeto JSON por árbol, con las columnas de sus nodos
+    
+    Todo lo que sigue al número de línea depende solo de la plantilla, así
+    que se codifica una vez por plantilla.
+    
+    Args:
+        arena: Arena con los árboles
+        output_file: Archivo de texto abierto para escribir
+        tails: Plantillas del arena ya codificadas, que se completan y se
+            reutilizan entre bloques, o None
+    """
+    import json
+    
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    if tails is None:
+        tails = []
+    for template_id in range(len(tails), len(arena.templates)):
+        tree = arena.template_tree(template_id, 0).to_dict()
+        del tree['line_number']
+        tails.append(encode(tree)[1:] + "\n")
+    
+    trees = arena.tree_count
+    output_file.write("".join([f'{{"line_number": {line_number}, {tails[template_id]}'
+                               for line_number, template_id in zip(arena.line_numbers[:trees],
+                                                                   arena.tree_templates[:trees])]))
+
+def write_binary(arena: ParseTreeArena, output_file: BinaryIO):
+    """Escribe los árboles del arena como un bloque del formato binario"""
+    trees = arena.tree_count
+    templates = arena.templates
+    columns = [arena.line_numbers[:trees], arena.tree_templates[:trees],
+               array('I', accumulate((len(template.kinds) for template in templates), initial=0)),
+               array('I', accumulate((len(template.token_types) for template in templates),
+                                     initial=0))]
+    for field, typecode in (('kinds', 'B'), ('parents', 'i'), ('starts', 'i'), ('ends', 'i'),
+                            ('token_types', 'B')):
+        column = array(typecode)
+        for template in templates:
+            column.extend(getattr(template, field))
+        columns.append(column)
+    if sys.byteorder != 'little':
+        for column in columns:
+            column.byteswap()
+    output_file.write(HEADER.pack(MAGIC, FORMAT_VERSION, trees, len(templates),
+                                  columns[2][-1], columns[3][-1]))
+    for column in columns:
+        output_file.write(column.tobytes())
+
+def read_binary(input_file: BinaryIO) -> Iterator[ParseTreeArena]:
+    """
+    Lee los bloques de un archivo binario de árboles
+    
+    Returns:
+        Un arena por bloque
+        
+    Raises:
+        ValueError: Si el archivo no tiene el formato binario de árboles
+    """
+    while True:
+        header = input_file.read(HEADER.size)
+        if not header:
+            return
+        if len(header) < HEADER.size:
+            raise ValueError("Bloque de árboles incompleto")
+        magic, version, trees, template_count, nodes, tokens = HEADER.unpack(header)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("No es un archivo de árboles compatible")
+        
+        columns = {}
+        for name, typecode, count in (('line_numbers', 'I', trees), ('tree_templates', 'I', trees),
+                                      ('template_nodes', 'I', template_count + 1),
+                                      ('template_tokens', 'I', template_count + 1),
+                                      ('kinds', 'B', nodes), ('parents', 'i', nodes),
+                                      ('starts', 'i', nodes), ('ends', 'i', nodes),
+                                      ('token_types', 'B', tokens)):
+            column = array(typecode)
+            size = column.itemsize * count
+            data = input_file.read(size)
+            if len(data) < size:
+                raise ValueError("Bloque de árboles incompleto")
+            column.frombytes(data)
+            if sys.byteorder != 'little':
+                column.byteswap()
+            columns[name] = column
+        
+        arena = ParseTreeArena(0)
+        arena.line_numbers, arena.tree_templates = columns['line_numbers'], columns['tree_templates']
+        arena.tree_count = trees
+        node_offsets, token_offsets = columns['template_nodes'], columns['template_tokens']
+        for template_id in range(template_count):
+            first, last = node_offsets[template_id], node_offsets[template_id + 1]
+            arena.add_template(Template(
+                columns['token_types'][token_offsets[template_id]:token_offsets[template_id + 1]],
+                columns['kinds'][first:last], columns['parents'][first:last],
+                columns['starts'][first:last], columns['ends'][first:last]))
+        yield arena
+
+def format_tree(tree: ParseTree, words: List[str]) -> str:
+    """Árbol con sangría, una frase por línea y los tokens de cada una"""
+    depths = []
+    lines = []
+    for node in tree.nodes:
+        depth = depths[node.parent] + 1 if node.parent >= 0 else 0
+        depths.append(depth)
+        lines.append(f"{'  ' * depth}{node.kind}: {' '.join(words[node.start:node.end])}")
+    return "\n".join(lines)
+
+def main():
+    """Muestra el árbol de las oraciones dadas"""
+    from lexical_analyzer import LexicalAnalyzer
+    
+    if len(sys.argv) < 2:
+        print("Uso: python parse_tree.py \"oración\" [...]")
+        sys.exit(1)
+    
+    lexical_analyzer = LexicalAnalyzer()
+    builder = ParseTreeBuilder()
+    for sentence in sys.argv[1:]:
+        print(f"Analizando: '{sentence}'")
+        scanned = lexical_analyzer.scan(sentence)
+        if scanned.diagnostics:
+            print(f"  Error léxico: {scanned.diagnostics[0].message}\n")
+            continue
+        builder.arena.reset()
+        result = builder.build(scanned.tokens)
+        if not result.accepted:
+            print(f"  Error sintáctico: {result.diagnostics[0].message}\n")
+            continue
+        words = [token.value for token in scanned.tokens]
+        print(format_tree(builder.arena.tree(0), words) + "\n")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,338 @@
+"""
+Reportes de Compilación para Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Escribe los resultados de la compilación en uno de tres formatos:
+
+- text: el reporte legible de siempre (título, estadísticas, detalle por línea
+  y resumen de errores),
+- jsonl: un objeto JSON por línea compilada,
+- csv: una fila por línea compilada, con encabezado.
+
+Las estadísticas se acumulan en la misma pasada que escribe los resultados, y
+la categoría de cada error se toma del prefijo fijo de su mensaje
+("Error léxico: ...", "Error sintáctico: ...") con una sola búsqueda en un
+diccionario. Cada resultado se escribe con una sola llamada sobre un archivo
+con búfer grande.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from itertools import islice
+
+# Tipos de las anotaciones; typing no se importa al arrancar (ver main.py)
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Dict, Iterable, List, Optional, TextIO, Tuple
+
+# Formatos de reporte disponibles
+REPORT_FORMATS = ("text", "jsonl", "csv")
+DEFAULT_FORMAT = "text"
+
+# Tamaño del búfer de escritura del archivo de salida
+BUFFER_SIZE = 1 << 20
+
+# Registros del detalle del reporte de texto que se guardan en memoria antes
+# de pasarlos al archivo temporal (fuera de streaming)
+SPILL_RECORDS = 10000
+
+# Categorías de error de los reportes estructurados
+LEXICAL = "lexical"
+SYNTAX = "syntax"
+OTHER = "other"
+
+# Prefijo del mensaje -> categoría del error
+MESSAGE_CATEGORIES = {
+    "Error léxico": LEXICAL,
+    "Error sintáctico": SYNTAX
+}
+
+# Contador de las estadísticas de cada categoría
+CATEGORY_COUNTERS = {
+    LEXICAL: 'lexical_errors',
+    SYNTAX: 'syntax_errors',
+    OTHER: 'other_errors'
+}
+
+# Columnas del reporte CSV (y claves del JSONL)
+FIELDS = ("line_number", "sentence", "success", "category", "message")
+
+def error_category(message: str) -> str:
+    """Categoría de un mensaje de error: LEXICAL, SYNTAX u OTHER"""
+    return MESSAGE_CATEGORIES.get(message.partition(':')[0], OTHER)
+
+def new_stats() -> Dict[str, int]:
+    """Crea un diccionario de contadores de estadísticas en cero"""
+    return {
+        'total': 0,
+        'successful': 0,
+        'failed': 0,
+        'lexical_errors': 0,
+        'syntax_errors': 0,
+        'other_errors': 0
+    }
+
+def add_stats(totals: Dict[str, int], stats: Dict[str, int]):
+    """Suma los contadores de stats a los de totals"""
+    for key, value in stats.items():
+        totals[key] += value
+
+def format_statistics(stats: Dict[str, int]) -> str:
+    """Sección de estadísticas generales del reporte de texto"""
+    total_lines = stats['total']
+    success_rate = (stats['successful'] / total_lines) * 100 if total_lines else 0.0
+    return (f"ESTADÍSTICAS GENERALES:\n"
+            f"Total de líneas procesadas: {total_lines}\n"
+            f"Compilaciones exitosas: {stats['successful']}\n"
+            f"Compilaciones fallidas: {stats['failed']}\n"
+            f"Tasa de éxito: {success_rate:.1f}%\n\n")
+
+def format_error_summary(stats: Dict[str, int]) -> str:
+    """Resumen de errores por categoría del reporte de texto (vacío si no hubo fallos)"""
+    if stats['failed'] == 0:
+        return ""
+    return ("RESUMEN DE ERRORES:\n" + "-" * 20 + "\n"
+            f"Errores léxicos: {stats['lexical_errors']}\n"
+            f"Errores sintácticos: {stats['syntax_errors']}\n"
+            f"Otros errores: {stats['other_errors']}\n")
+
+def result_category(result: Dict) -> Optional[str]:
+    """Categoría del error de un resultado, o None si la compilación fue exitosa"""
+    if result['success']:
+        return None
+    return error_category(result['message'])
+
+class ReportWriter(ABC):
+    """
+    Escritor de reportes: acumula las estadísticas mientras escribe
+    
+    Se usa como administrador de contexto; al salir sin errores escribe lo
+    que el formato deja para el final y cierra el archivo. Las subclases
+    implementan format_result y, si hace falta, begin y finish.
+    """
+    
+    # Si el archivo se abre sin traducir los saltos de línea (csv lo exige)
+    raw_newlines = False
+    
+    def __init__(self, output_filename: str, streaming: bool = False):
+        """
+        Args:
+            output_filename: Nombre del archivo de salida
+            streaming: Si es True, los resultados se escriben en cuanto llegan
+                y las estadísticas van al final del reporte; si es False, el
+                formato puede ubicarlas antes de los resultados
+        """
+        self.output_file: TextIO = open(output_filename, 'w', encoding='utf-8',
+                                        buffering=BUFFER_SIZE,
+                                        newline='' if self.raw_newlines else None)
+        self.streaming = streaming
+        self.stats = new_stats()
+        self.begin()
+    
+    def __enter__(self) -> "ReportWriter":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                self.finish()
+        finally:
+            self.output_file.close()
+    
+    def begin(self):
+        """Escribe el encabezado del reporte"""
+    
+    def finish(self):
+        """Escribe lo que el formato deja para el final del reporte"""
+    
+    @abstractmethod
+    def format_result(self, result: Dict, category: Optional[str]) -> Any:
+        """Registro de un resultado en el reporte (texto o fila, según el formato)"""
+    
+    def emit(self, record: Any):
+        """Escribe el registro de un resultado"""
+        self.output_file.write(record)
+    
+    def count(self, category: Optional[str], times: int = 1):
+        """Acumula en las estadísticas times resultados de la categoría (None = éxito)"""
+        stats = self.stats
+        stats['total'] += times
+        if category is None:
+            stats['successful'] += times
+        else:
+            stats['failed'] += times
+            stats[CATEGORY_COUNTERS[category]] += times
+    
+    def write(self, result: Dict):
+        """Acumula un resultado en las estadísticas y lo escribe"""
+        category = result_category(result)
+        self.count(category)
+        self.emit(self.format_result(result, category))
+    
+    def write_all(self, results: Iterable[Dict]):
+        """Escribe todos los resultados en una sola pasada (write() con los contadores en locales)"""
+        format_result = self.format_result
+        emit = self.emit
+        counts = {None: 0, LEXICAL: 0, SYNTAX: 0, OTHER: 0}
+        for result in results:
+            category = result_category(result)
+            counts[category] += 1
+            emit(format_result(result, category))
+        for category, times in counts.items():
+            self.count(category, times)
+
+class TextReportWriter(ReportWriter):
+    """Reporte legible: título, estadísticas, detalle por línea y resumen de errores"""
+    
+    def begin(self):
+        self.output_file.write("REPORTE DE COMPILACIÓN - LITTLE ENGLISH\n")
+        self.output_file.write("=" * 50 + "\n\n")
+        # Fuera de streaming las estadísticas van antes del detalle, así que
+        # el detalle espera hasta el final: los últimos registros en memoria y
+        # el resto en un archivo temporal, no una copia de todo el reporte
+        self.pending: List[str] = []
+        self.spill_file: Optional[TextIO] = None
+        if self.streaming:
+            self.write_details_header()
+        else:
+            self.emit = self.pending.append
+    
+    def write(self, result: Dict):
+        super().write(result)
+        if len(self.pending) >= SPILL_RECORDS:
+            self.spill()
+    
+    def write_all(self, results: Iterable[Dict]):
+        if self.streaming:
+            super().write_all(results)
+            return
+        # Por bloques de SPILL_RECORDS, para revisar la memoria una vez por bloque
+        results = iter(results)
+        while True:
+            block = list(islice(results, SPILL_RECORDS))
+            if not block:
+                return
+            super().write_all(block)
+            if len(self.pending) >= SPILL_RECORDS:
+                self.spill()
+    
+    def spill(self):
+        """Pasa los registros guardados en memoria al archivo temporal"""
+        if self.spill_file is None:
+            # tempfile tarda en importarse; los reportes chicos no lo necesitan
+            import tempfile
+            self.spill_file = tempfile.TemporaryFile('w+', encoding='utf-8',
+                                                     buffering=BUFFER_SIZE)
+        self.spill_file.write("".join(self.pending))
+        # Se vacía en su lugar porque emit es su método append
+        self.pending.clear()
+    
+    def finish(self):
+        if self.streaming:
+            self.write_statistics()
+        else:
+            self.write_statistics()
+            self.write_details_header()
+            if self.spill_file is not None:
+                # El temporal ya está codificado como el reporte: se copian sus bytes
+                import shutil
+                self.spill_file.flush()
+                self.spill_file.buffer.seek(0)
+                self.output_file.flush()
+                shutil.copyfileobj(self.spill_file.buffer, self.output_file.buffer, BUFFER_SIZE)
+                self.spill_file.close()
+                self.spill_file = None
+            self.output_file.write("".join(self.pending))
+            self.pending.clear()
+        self.write_error_summary()
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            super().__exit__(exc_type, exc_value, traceback)
+        finally:
+            # Si la compilación falló, finish() no llegó a cerrar el temporal
+            if self.spill_file is not None:
+                self.spill_file.close()
+    
+    def format_result(self, result: Dict, category: Optional[str]) -> str:
+        sentence = result['sentence']
+        header = (f"Línea {result['line_number']}: '{sentence}'\n" if sentence.strip()
+                  else f"Línea {result['line_number']}: (línea vacía)\n")
+        if result['success']:
+            return header + "Estado: ✓ ÉXITO\n\n"
+        return f"{header}Estado: ✗ FALLO\nError: {result['message']}\n\n"
+    
+    def write_statistics(self):
+        """Escribe la sección de estadísticas generales"""
+        self.output_file.write(format_statistics(self.stats))
+    
+    def write_details_header(self):
+        """Escribe el título de la sección de resultados detallados"""
+        self.output_file.write("RESULTADOS DETALLADOS:\n" + "-" * 30 + "\n\n")
+    
+    def write_error_summary(self):
+        """Escribe el resumen de errores por categoría, si hubo fallos"""
+        self.output_file.write(format_error_summary(self.stats))
+
+class JsonLinesReportWriter(ReportWriter):
+    """Un objeto JSON por línea compilada, con las claves de FIELDS"""
+    
+    def begin(self):
+        # json y csv solo se importan si se pide su formato
+        import json
+        self.encode = json.JSONEncoder(ensure_ascii=False).encode
+    
+    def format_result(self, result: Dict, category: Optional[str]) -> str:
+        return self.encode({
+            'line_number': result['line_number'],
+            'sentence': result['sentence'],
+            'success': result['success'],
+            'category': category,
+            'message': result['message']
+        }) + "\n"
+
+class CsvReportWriter(ReportWriter):
+    """Una fila por línea compilada con las columnas de FIELDS; el éxito es 1 o 0"""
+    
+    raw_newlines = True
+    
+    def begin(self):
+        import csv
+        self.writerow = csv.writer(self.output_file).writerow
+        self.writerow(FIELDS)
+    
+    def format_result(self, result: Dict, category: Optional[str]) -> Tuple:
+        return (result['line_number'], result['sentence'], 1 if result['success'] else 0,
+                category or "", result['message'])
+    
+    def emit(self, row: Tuple):
+        self.writerow(row)
+
+# Escritor de cada formato
+REPORT_WRITERS = {
+    "text": TextReportWriter,
+    "jsonl": JsonLinesReportWriter,
+    "csv": CsvReportWriter
+}
+
+def open_report(output_filename: str, report_format: str = DEFAULT_FORMAT,
+                streaming: bool = False) -> ReportWriter:
+    """
+    Abre un reporte para escribir resultados
+    
+    Args:
+        output_filename: Nombre del archivo de salida
+        report_format: Uno de REPORT_FORMATS
+        streaming: Si los resultados se escriben en cuanto se producen
+        
+    Returns:
+        Escritor del formato, para usar como administrador de contexto
+        
+    Raises:
+        ValueError: Si el formato no existe
+    """
+    writer_class = REPORT_WRITERS.get(report_format)
+    if writer_class is None:
+        raise ValueError(f"Formato de reporte desconocido: '{report_format}'")
+    return writer_class(output_filename, streaming)
@@ -0,0 +1,366 @@
+"""
+Sugerencias para Palabras Desconocidas de Little English
+Paradigmas de Programación - Proyecto Programado 1
+
+Índice de borrados al estilo SymSpell para proponer las palabras del
+vocabulario más parecidas a un token no reconocido. Cada palabra del
+vocabulario se registra bajo todas las cadenas que se obtienen borrando hasta
+MAX_DISTANCE caracteres de su prefijo de PREFIX_LENGTH caracteres. Para una
+palabra desconocida se generan sus propios borrados, se buscan en el índice y
+solo los candidatos encontrados se comparan con la distancia de edición
+(Damerau-Levenshtein restringida), en lugar de comparar contra todo el
+vocabulario.
+
+El índice se guarda en un formato binario que se abre con mmap sin construir
+estructuras de Python:
+
+    encabezado   'SUGG', versión, distancia máxima, largo del prefijo,
+                 cantidad de palabras y cantidad de entradas
+    claves       un entero de 32 bits por entrada: crc32 del borrado, en orden
+    palabras     un entero de 32 bits por entrada: posición de la palabra
+    offsets      cantidad + 1 enteros de 32 bits con el inicio de cada
+                 palabra en la zona de cadenas
+    cadenas      palabras en UTF-8, concatenadas
+
+Dos borrados distintos pueden compartir el crc32; eso solo agrega candidatos,
+que la distancia de edición descarta. Los enteros se guardan en little-endian.
+
+Uso: python suggestions.py [palabra ...] [--lexicon ARCHIVO] [--count K]
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from hashlib import blake2b
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Union
+from zlib import crc32
+
+from lexicon import Lexicon
+
+# Encabezado: firma, versión, distancia máxima, largo del prefijo, cantidad
+# de palabras y cantidad de entradas
+MAGIC = b"SUGG"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHBBII")
+
+# Parámetros del índice: distancia de edición máxima de una sugerencia y
+# caracteres de cada palabra que se indexan
+MAX_DISTANCE = 2
+PREFIX_LENGTH = 7
+
+# Sugerencias por token no reconocido
+DEFAULT_SUGGESTIONS = 3
+
+# Mensaje de un token no reconocido (ver Diagnostic.message)
+UNKNOWN_TOKEN_PREFIX = "Token no reconocido: '"
+UNKNOWN_TOKEN_SUFFIX = "' en posición "
+
+class Suggestion(NamedTuple):
+    """Palabra del vocabulario propuesta para un token no reconocido"""
+    word: str
+    distance: int       # Distancia de edición al token
+
+def deletes(word: str, max_distance: int) -> Set[str]:
+    """Cadenas que resultan de borrar hasta max_distance caracteres de word (incluida word)"""
+    found = {word}
+    level = [word]
+    for _ in range(max_distance):
+        next_level = []
+        for current in level:
+            for index in range(len(current)):
+                shorter = current[:index] + current[index + 1:]
+                if shorter not in found:
+                    found.add(shorter)
+                    next_level.append(shorter)
+        level = next_level
+    return found
+
+def character_masks(word: str) -> Dict[str, int]:
+    """Máscara de bits de cada carácter de word: bit i encendido si word[i] es ese carácter"""
+    masks = {}
+    for position, char in enumerate(word):
+        masks[char] = masks.get(char, 0) | (1 << position)
+    return masks
+
+def edit_distance(source: str, target: str, masks: Optional[Dict[str, int]] = None) -> int:
+    """
+    Distancia de Damerau-Levenshtein restringida (inserción, borrado,
+    sustitución y transposición de caracteres vecinos)
+    
+    Se calcula con el algoritmo de vectores de bits de Hyyrö: la columna de
+    la matriz de distancias se guarda como dos enteros de diferencias
+    verticales y cada carácter de target la actualiza con unas pocas
+    operaciones de bits, en lugar de recorrer una fila por carácter.
+    
+    Args:
+        source: Primera palabra
+        target: Segunda palabra
+        masks: character_masks(source), para reutilizarlas entre comparaciones
+        
+    Returns:
+        La distancia entre las dos palabras
+    """
+    length = len(source)
+    if not length:
+        return len(target)
+    get_mask = (masks if masks is not None else character_masks(source)).get
+    full = (1 << length) - 1
+    last = 1 << (length - 1)
+    positive = full
+    negative = 0
+    diagonal = 0
+    previous_mask = 0
+    distance = length
+    for char in target:
+        mask = get_mask(char, 0)
+        transposed = ((~diagonal & mask) << 1) & previous_mask
+        diagonal = ((((mask & positive) + positive) ^ positive) | mask | negative | transposed) & full
+        horizontal_positive = negative | (~(diagonal | positive) & full)
+        horizontal_negative = diagonal & positive
+        if horizontal_positive & last:
+            distance += 1
+        elif horizontal_negative & last:
+            distance -= 1
+        horizontal_positive = ((horizontal_positive << 1) | 1) & full
+        horizontal_negative = (horizontal_negative << 1) & full
+        positive = horizontal_negative | (~(diagonal | horizontal_positive) & full)
+        negative = diagonal & horizontal_positive
+        previous_mask = mask
+    return distance
+
+def key_of(text: str) -> int:
+    """Clave de 32 bits de un borrado en el índice"""
+    return crc32(text.encode('utf-8', 'surrogatepass'))
+
+def build_index(words: Iterable[str], max_distance: int = MAX_DISTANCE,
+                prefix_length: int = PREFIX_LENGTH) -> bytes:
+    """
+    Construye el índice de borrados de un vocabulario
+    
+    Args:
+        words: Palabras del vocabulario (se guardan en minúsculas y sin repetir)
+        max_distance: Distancia de edición máxima de una sugerencia
+        prefix_length: Caracteres de cada palabra que se indexan
+        
+    Returns:
+        El índice en el formato binario del módulo
+    """
+    vocabulary = sorted({word.lower() for word in words})
+    # Cada entrada es clave << 32 | palabra, así que ordenar los enteros
+    # ordena por clave
+    entries = []
+    for position, word in enumerate(vocabulary):
+        entries.extend({(key_of(text) << 32) | position
+                        for text in deletes(word[:prefix_length], max_distance)})
+    entries.sort()
+    
+    keys = array('I', [entry >> 32 for entry in entries])
+    positions = array('I', [entry & 0xFFFFFFFF for entry in entries])
+    encoded = [word.encode('utf-8', 'surrogatepass') for word in vocabulary]
+    offsets = array('I', [0])
+    for word in encoded:
+        offsets.append(offsets[-1] + len(word))
+    if sys.byteorder != 'little':
+        for values in (keys, positions, offsets):
+            values.byteswap()
+    
+    return b"".join((HEADER.pack(MAGIC, FORMAT_VERSION, max_distance, prefix_length,
+                                 len(vocabulary), len(entries)),
+                     keys.tobytes(), positions.tobytes(), offsets.tobytes(), b"".join(encoded)))
+
+class SuggestionIndex:
+    """Índice de borrados abierto sobre un archivo mapeado o un bloque de bytes"""
+    
+    def __init__(self, buffer: Union[bytes, mmap.mmap]):
+        """
+        Raises:
+            ValueError: Si el contenido no es un índice compatible
+        """
+        self.buffer = buffer
+        if len(buffer) < HEADER.size:
+            raise ValueError("No es un índice de sugerencias")
+        magic, version, max_distance, prefix_length, count, entry_count = HEADER.unpack_from(buffer)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("No es un índice de sugerencias compatible")
+        
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.count = count
+        view = memoryview(buffer)
+        keys_end = HEADER.size + 4 * entry_count
+        positions_end = keys_end + 4 * entry_count
+        offsets_end = positions_end + 4 * (count + 1)
+        self.keys = Lexicon.integers(view[HEADER.size:keys_end])
+        self.positions = Lexicon.integers(view[keys_end:positions_end])
+        self.offsets = Lexicon.integers(view[positions_end:offsets_end])
+        self.strings = offsets_end
+    
+    @classmethod
+    def open(cls, filename: str) -> "SuggestionIndex":
+        """Abre un índice guardado en disco con mmap"""
+        with open(filename, 'rb') as index_file:
+            buffer = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(buffer)
+        except ValueError:
+            buffer.close()
+            raise
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def word(self, position: int) -> str:
+        """Devuelve la palabra de la posición dada"""
+        start = self.strings + self.offsets[position]
+        end = self.strings + self.offsets[position + 1]
+        return bytes(self.buffer[start:end]).decode('utf-8', 'surrogatepass')
+    
+    def candidates(self, word: str) -> Set[int]:
+        """Posiciones de las palabras que comparten algún borrado con word"""
+        keys = self.keys
+        positions = self.positions
+        entry_count = len(keys)
+        found = set()
+        for text in deletes(word[:self.prefix_length], self.max_distance):
+            key = key_of(text)
+            entry = bisect_left(keys, key)
+            while entry < entry_count and keys[entry] == key:
+                found.add(positions[entry])
+                entry += 1
+        return found
+    
+    def lookup(self, word: str, count: int = DEFAULT_SUGGESTIONS) -> List[Suggestion]:
+        """
+        Busca las palabras del vocabulario más parecidas a word
+        
+        Args:
+            word: Token no reconocido
+            count: Cantidad máxima de sugerencias
+            
+        Returns:
+            Sugerencias ordenadas por distancia y luego alfabéticamente
+        """
+        word = word.lower()
+        length = len(word)
+        max_distance = self.max_distance
+        masks = character_masks(word)
+        suggestions = []
+        for position in self.candidates(word):
+            candidate = self.word(position)
+            if abs(len(candidate) - length) > max_distance:
+                continue
+            distance = edit_distance(word, candidate, masks)
+            if distance <= max_distance:
+                suggestions.append(Suggestion(candidate, distance))
+        suggestions.sort(key=lambda suggestion: (suggestion.distance, suggestion.word))
+        return suggestions[:count]
+    
+    def close(self):
+        """Libera el archivo mapeado, si lo hay"""
+        for name in ('keys', 'positions', 'offsets'):
+            view = getattr(self, name, None)
+            if isinstance(view, memoryview):
+                view.release()
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+
+def vocabulary_fingerprint(lexical_analyzer) -> str:
+    """Hash del vocabulario de un analizador léxico"""
+    if lexical_analyzer.lexicon is not None:
+        return lexical_analyzer.lexicon.fingerprint()
+    digest = blake2b(digest_size=16)
+    digest.update("\n".join(sorted(lexical_analyzer.vocabulary)).encode('utf-8', 'surrogatepass'))
+    return digest.hexdigest()
+
+def cache_filename(lexical_analyzer, digest: str) -> str:
+    """
+    Archivo del índice en caché: junto al léxico externo o, con el
+    vocabulario de Little English, junto a este módulo
+    """
+    lexicon = lexical_analyzer.lexicon
+    source = lexicon.filename if lexicon is not None else os.path.abspath(__file__)
+    directory, name = os.path.split(os.path.abspath(source))
+    if lexicon is None:
+        name = "vocabulary"
+    return os.path.join(directory, "__pycache__", f"{name}.{digest[:16]}.sug")
+
+def load_suggestion_index(lexical_analyzer, max_distance: int = MAX_DISTANCE,
+                          prefix_length: int = PREFIX_LENGTH,
+                          use_cache: bool = True) -> SuggestionIndex:
+    """
+    Carga el índice de sugerencias del vocabulario de un analizador léxico,
+    construyéndolo solo si no hay uno en caché
+    
+    Args:
+        lexical_analyzer: LexicalAnalyzer cuyo vocabulario se indexa
+        max_distance: Distancia de edición máxima de una sugerencia
+        prefix_length: Caracteres de cada palabra que se indexan
+        use_cache: Si es False, construye siempre el índice y no escribe la caché
+        
+    Returns:
+        Índice abierto (con mmap si viene de la caché)
+    """
+    digest = blake2b(f"{FORMAT_VERSION}:{max_distance}:{prefix_length}:".encode('ascii'),
+                     digest_size=16)
+    digest.update(vocabulary_fingerprint(lexical_analyzer).encode('ascii'))
+    cached = cache_filename(lexical_analyzer, digest.hexdigest())
+    
+    if use_cache:
+        try:
+            return SuggestionIndex.open(cached)
+        except (OSError, ValueError):
+            pass
+    
+    content = build_index(lexical_analyzer.vocabulary, max_distance, prefix_length)
+    if use_cache:
+        # Sin permiso de escritura se sigue sin caché
+        try:
+            os.makedirs(os.path.dirname(cached), exist_ok=True)
+            temporary_filename = cached + ".tmp"
+            with open(temporary_filename, 'wb') as cache_file:
+                cache_file.write(content)
+            os.replace(temporary_filename, cached)
+        except OSError:
+            pass
+    return SuggestionIndex(content)
+
+def unknown_word(message: str) -> Optional[str]:
+    """Token de un mensaje de error por token no reconocido, o None si es otro error"""
+    start = message.find(UNKNOWN_TOKEN_PREFIX)
+    if start < 0:
+        return None
+    word, separator, _ = message[start + len(UNKNOWN_TOKEN_PREFIX):].rpartition(UNKNOWN_TOKEN_SUFFIX)
+    return word if separator else None
+
+def format_suggestions(suggestions: List[Suggestion]) -> str:
+    """Texto que se agrega al mensaje de error (vacío si no hay sugerencias)"""
+    if not suggestions:
+        return ""
+    return " (¿quiso decir " + ", ".join(f"'{suggestion.word}'" for suggestion in suggestions) + "?)"
+
+def main():
+    """Muestra las sugerencias de las palabras dadas"""
+    from lexical_analyzer import LexicalAnalyzer
+    from lexicon import open_lexicon
+    
+    parser = argparse.ArgumentParser(description="Sugerencias para palabras desconocidas")
+    parser.add_argument("words", nargs="+", metavar="palabra")
+    parser.add_argument("--lexicon", default=None, metavar="ARCHIVO",
+                        help="léxico externo (por defecto, el vocabulario de Little English)")
+    parser.add_argument("--count", type=int, default=DEFAULT_SUGGESTIONS, metavar="K",
+                        help=f"sugerencias por palabra (por defecto {DEFAULT_SUGGESTIONS})")
+    args = parser.parse_args()
+    
+    analyzer = LexicalAnalyzer(open_lexicon(args.lexicon) if args.lexicon else None)
+    index = load_suggestion_index(analyzer)
+    for word in args.words:
+        suggestions = index.lookup(word, args.count)
+        print(f"{word}: " + (", ".join(f"{suggestion.word} ({suggestion.distance})"
+                                       for suggestion in suggestions) or "sin sugerencias"))
+
+if __name__ == "__main__":
+    main()
@@ -3,18 +3,68 @@ Analizador Sintáctico para Little English
 Paradigmas de Programación - Proyecto Programado 1
 """
 
-from typing import List
-from lexical_analyzer import Token, TokenType
+from __future__ import annotations
+
+from collections import namedtuple
+from diagnostics import Diagnostic, ErrorCode, EXTRA_TOKENS, UNEXPECTED_END, UNEXPECTED_TOKEN
+from lexical_analyzer import Token, TokenStream, TokenType, TOKEN_TYPES, TOKEN_TYPE_IDS
+
+# Tipos de las anotaciones; typing no se importa al arrancar (ver main.py)
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import List, Optional, Sequence, Tuple, Union
+
+# Códigos enteros de los tipos de token que usa la gramática
+ARTICLE = TOKEN_TYPE_IDS[TokenType.ARTICLE]
+NOUN = TOKEN_TYPE_IDS[TokenType.NOUN]
+VERB = TOKEN_TYPE_IDS[TokenType.VERB]
+ADJECTIVE = TOKEN_TYPE_IDS[TokenType.ADJECTIVE]
+PREPOSITION = TOKEN_TYPE_IDS[TokenType.PREPOSITION]
+DOT = TOKEN_TYPE_IDS[TokenType.DOT]
+
+# Código del token actual cuando ya no quedan tokens
+END_OF_TOKENS = -1
+
+# Nombre de cada tipo de token por código, para los diagnósticos
+TYPE_NAMES = tuple(token_type.value for token_type in TOKEN_TYPES)
+
+class ParseResult(namedtuple("ParseResult", ("accepted", "diagnostics"))):
+    """Resultado de SyntaxAnalyzer.check"""
+    __slots__ = ()
+    accepted: bool                       # True si la oración es correcta
+    diagnostics: Tuple[Diagnostic, ...]  # Errores sintácticos; vacía si no hubo
+
+# Resultados que no dependen de los tokens
+ACCEPTED = ParseResult(True, ())
+EMPTY_TOKENS_RESULT = ParseResult(False, (Diagnostic(ErrorCode.EMPTY_TOKENS),))
+UNEXPECTED_END_ERROR = Diagnostic(UNEXPECTED_END)
 
 class SyntaxAnalyzer:
-    """Analizador Sintáctico para Little English usando Recursive Descent Parsing"""
+    """
+    Analizador Sintáctico para Little English usando Recursive Descent Parsing
+    
+    check() y analyze() guardan el estado del análisis en curso en la
+    instancia, así que no son reentrantes; parse() analiza sobre una copia
+    con estado propio y se puede llamar desde varios hilos a la vez.
+    """
     
     def __init__(self):
         self.tokens = []
+        self.token_types: Sequence[int] = []
         self.current_token_index = 0
-        self.current_token = None
+        self.current_type = END_OF_TOKENS
+        # Errores del análisis en curso y si se siguen buscando después del primero
+        self.diagnostics: List[Diagnostic] = []
+        self.collect_all = False
+    
+    @property
+    def current_token(self) -> Optional[Token]:
+        """Token actual, construido bajo demanda (None al final de la oración)"""
+        if self.current_type == END_OF_TOKENS:
+            return None
+        return self.tokens[self.current_token_index]
     
-    def analyze(self, tokens: List[Token]) -> bool:
+    def analyze(self, tokens: Union[List[Token], TokenStream]) -> bool:
         """
         Realiza el análisis sintáctico de una lista de tokens
         
@@ -25,7 +75,7 @@ class SyntaxAnalyzer:
         <prep_phrase> ::= <preposition> <noun_phrase>
         
         Args:
-            tokens: Lista de tokens del análisis léxico
+            tokens: Lista de tokens o TokenStream del análisis léxico
             
         Returns:
             True si la oración es sintácticamente correcta
@@ -33,27 +83,121 @@ class SyntaxAnalyzer:
         Raises:
             SyntaxError: Si hay errores sintácticos
         """
+        result = self.check(tokens)
+        if not result.accepted:
+            raise SyntaxError(result.diagnostics[0].message)
+        return True
+    
+    def check(self, tokens: Union[List[Token], TokenStream],
+              collect_all: bool = False) -> ParseResult:
+        """
+        Realiza el análisis sintáctico sin lanzar excepciones
+        
+        Las comparaciones del análisis se hacen sobre los códigos enteros de
+        los tipos; con un TokenStream esos códigos se leen directamente de su
+        arreglo y los objetos Token solo se crean para los diagnósticos.
+        
+        Args:
+            tokens: Lista de tokens o TokenStream del análisis léxico
+            collect_all: Si es True, después de un error descarta tokens hasta
+                encontrar uno del tipo esperado y sigue analizando, para
+                reportar todos los errores; si es False, se detiene en el primero
+                
+        Returns:
+            ParseResult con el veredicto y los errores encontrados; el primer
+            error es el mismo que lanzaría analyze()
+        """
         if not tokens:
-            raise SyntaxError("Lista de tokens vacía")
+            return EMPTY_TOKENS_RESULT
         
         self.tokens = tokens
+        if isinstance(tokens, TokenStream):
+            self.token_types = tokens.types
+        else:
+            self.token_types = [TOKEN_TYPE_IDS[token.type] for token in tokens]
         self.current_token_index = 0
-        self.current_token = self.tokens[0] if self.tokens else None
+        self.current_type = self.token_types[0]
+        self.diagnostics = []
+        self.collect_all = collect_all
         
-        try:
-            # Comenzar con la regla principal
-            self.parse_sentence()
-            
-            # Verificar que se hayan consumido todos los tokens
-            if self.current_token_index < len(self.tokens):
-                raise SyntaxError(f"Tokens adicionales después del punto: {self.current_token.value}")
-            
+        # Comenzar con la regla principal y verificar que se hayan consumido
+        # todos los tokens
+        if self.parse_sentence() and self.current_type != END_OF_TOKENS:
+            token = self.current_token
+            self.diagnostics.append(tuple.__new__(Diagnostic, (
+                EXTRA_TOKENS, token.value, token.position, self.current_token_index, None, None)))
+        
+        if self.diagnostics:
+            return tuple.__new__(ParseResult, (False, tuple(self.diagnostics)))
+        return ACCEPTED
+    
+    def fork(self) -> "SyntaxAnalyzer":
+        """
+        Copia del analizador con su propio estado de análisis
+        
+        La copia comparte la configuración de la instancia (por ejemplo, las
+        tablas de TableDrivenAnalyzer) sin copiarla; check() reemplaza el
+        estado de la copia sin tocar el del original.
+        """
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone.diagnostics = []
+        return clone
+    
+    def parse(self, tokens: Union[List[Token], TokenStream],
+              collect_all: bool = False) -> ParseResult:
+        """
+        Igual que check(), pero reentrante: el análisis usa un estado propio
+        de la llamada (ver fork), así que varios hilos pueden compartir el
+        mismo analizador
+        """
+        return self.fork().check(tokens, collect_all)
+    
+    def diagnose(self, expected_code: int) -> Diagnostic:
+        """Describe el error de esperar un token de tipo expected_code en la posición actual"""
+        if self.current_type == END_OF_TOKENS:
+            return UNEXPECTED_END_ERROR
+        token = self.current_token
+        return tuple.__new__(Diagnostic, (UNEXPECTED_TOKEN, token.value, token.position,
+                                          self.current_token_index, TYPE_NAMES[expected_code],
+                                          TYPE_NAMES[self.current_type]))
+    
+    def advance(self):
+        """Avanza al siguiente token"""
+        self.current_token_index += 1
+        if self.current_token_index < len(self.token_types):
+            self.current_type = self.token_types[self.current_token_index]
+        else:
+            self.current_type = END_OF_TOKENS
+    
+    def expect(self, expected_code: int) -> bool:
+        """
+        Consume el token actual si es del tipo esperado, sin lanzar excepciones
+        
+        Si no lo es, registra el error. Con collect_all, además descarta
+        tokens hasta encontrar uno del tipo esperado y lo consume (recuperación
+        por borrado); los tokens descartados no generan más errores.
+        
+        Returns:
+            True si se consumió un token del tipo esperado
+        """
+        if self.current_type == expected_code:
+            # Avance en línea: es el camino de cada token
+            index = self.current_token_index = self.current_token_index + 1
+            token_types = self.token_types
+            self.current_type = token_types[index] if index < len(token_types) else END_OF_TOKENS
             return True
-            
-        except (SyntaxError, IndexError) as e:
-            if isinstance(e, IndexError):
-                raise SyntaxError("Oración incompleta")
-            raise e
+        
+        self.diagnostics.append(self.diagnose(expected_code))
+        if not self.collect_all:
+            return False
+        
+        while self.current_type != END_OF_TOKENS:
+            self.advance()
+            if self.current_type == expected_code:
+                self.advance()
+                return True
+        return False
     
     def consume_token(self, expected_type: TokenType = None):
         """
@@ -65,64 +209,68 @@ class SyntaxAnalyzer:
         Raises:
             SyntaxError: Si el token no es del tipo esperado
         """
-        if self.current_token is None:
-            raise SyntaxError("Token inesperado: fin de oración")
-        
-        if expected_type and self.current_token.type != expected_type:
-            raise SyntaxError(f"Se esperaba {expected_type.value}, pero se encontró {self.current_token.type.value}: '{self.current_token.value}'")
+        self.consume_code(TOKEN_TYPE_IDS[expected_type] if expected_type else None)
+    
+    def consume_code(self, expected_code: int = None):
+        """
+        Igual que consume_token, pero con el código entero del tipo esperado
         
-        self.current_token_index += 1
-        if self.current_token_index < len(self.tokens):
-            self.current_token = self.tokens[self.current_token_index]
-        else:
-            self.current_token = None
+        Raises:
+            SyntaxError: Si el token no es del tipo esperado
+        """
+        if self.current_type == END_OF_TOKENS or (expected_code is not None
+                                                   and self.current_type != expected_code):
+            raise SyntaxError(self.diagnose(expected_code).message)
+        self.advance()
     
-    def parse_sentence(self):
+    def parse_sentence(self) -> bool:
         """
         Parsea una oración completa
         <sentence> ::= <noun_phrase> <verb_phrase> '.'
+        
+        Las reglas devuelven False cuando el análisis no puede continuar.
         """
-        self.parse_noun_phrase()
-        self.parse_verb_phrase()
-        self.consume_token(TokenType.DOT)
+        return self.parse_noun_phrase() and self.parse_verb_phrase() and self.expect(DOT)
     
-    def parse_noun_phrase(self):
+    def parse_noun_phrase(self) -> bool:
         """
         Parsea una frase nominal
         <noun_phrase> ::= <article> <noun> | <article> <adjective> <noun>
         """
         # Debe comenzar con un artículo
-        self.consume_token(TokenType.ARTICLE)
+        if not self.expect(ARTICLE):
+            return False
         
         # Verificar si hay un adjetivo
-        if self.current_token and self.current_token.type == TokenType.ADJECTIVE:
-            self.consume_token(TokenType.ADJECTIVE)
+        if self.current_type == ADJECTIVE:
+            self.advance()
         
         # Debe terminar con un sustantivo
-        self.consume_token(TokenType.NOUN)
+        return self.expect(NOUN)
     
-    def parse_verb_phrase(self):
+    def parse_verb_phrase(self) -> bool:
         """
         Parsea una frase verbal
         <verb_phrase> ::= <verb> | <verb> <noun_phrase> | <verb> <prep_phrase>
         """
         # Debe comenzar con un verbo
-        self.consume_token(TokenType.VERB)
+        if not self.expect(VERB):
+            return False
         
         # Verificar si hay una frase preposicional o nominal después del verbo
-        if self.current_token and self.current_token.type == TokenType.PREPOSITION:
-            self.parse_prep_phrase()
-        elif self.current_token and self.current_token.type == TokenType.ARTICLE:
-            self.parse_noun_phrase()
+        if self.current_type == PREPOSITION:
+            return self.parse_prep_phrase()
+        if self.current_type == ARTICLE:
+            return self.parse_noun_phrase()
         # Si no hay nada más, es un verbo intransitivo (válido)
+        return True
     
-    def parse_prep_phrase(self):
+    def parse_prep_phrase(self) -> bool:
         """
         Parsea una frase preposicional
         <prep_phrase> ::= <preposition> <noun_phrase>
         """
-        self.consume_token(TokenType.PREPOSITION)
-        self.parse_noun_phrase()
+        return self.expect(PREPOSITION) and self.parse_noun_phrase()
 
 def test_syntax_analyzer():
     """Función de prueba para el analizador sintáctico"""
@@ -154,7 +302,8 @@ def test_syntax_analyzer():
             print("Análisis sintáctico: EXITOSO")
             
         except ValueError as e:
-            print(f"Error léxico: {e}")
+            # El mensaje de analyze() ya lleva el prefijo "Error léxico:"
+            print(e)
         except SyntaxError as e:
             print(f"Error sintáctico: {e}")
         except Exception as e: